@@ -0,0 +1,213 @@
+import argparse
+import os
+import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+from skill_matcher import SkillMatcher
+from skill_taxonomy import CACHE_FILE, MatchCache, load_taxonomy
+from perf_timer import StageTimer
+
+# Analisis skill SELURUH gsearch_jobs.csv (versi batch dari analisis.loker.ipynb).
+# CSV dibaca per chunk dan yang disimpan cuma counter per skill, jadi memori
+# dibatasi ukuran chunk (bukan list semua skill dari semua lowongan).
+# Bar chart & word cloud dibuat langsung dari tabel frekuensi.
+
+input_file = 'gsearch_jobs.csv'
+freq_file = 'skill_frequencies.csv'        # Tabel frekuensi (skill, jumlah, persen)
+bar_file = 'top_20_skills_analysis.png'
+wordcloud_file = 'wordcloud_full.png'
+
+READ_CHUNK_SIZE = 10000  # Baris CSV per chunk
+N_WORKERS = 1            # >1 = chunk diproses paralel di process pool
+TOP_N = 20
+
+# Daftar skill per kategori (programming, database, BI, cloud, AI/ML, soft skill)
+# + sinonimnya ada di skill_taxonomy.json, sama dengan yang dipakai ETL dashboard
+TAXONOMY = load_taxonomy()
+TARGET_SKILLS = TAXONOMY.skills
+SKILL_MATCHER = SkillMatcher(TAXONOMY.patterns)
+
+
+def _count_chunk(texts):
+    # Dijalankan di worker (level modul agar bisa di-pickle); hasilnya counter kecil
+    counts = Counter()
+    for text in texts:
+        counts.update(TAXONOMY.to_skills(SKILL_MATCHER.find(text)))
+    return counts, len(texts)
+
+
+def _count_cached(texts, cache, workers, chunk_size):
+    # Pola yang sudah ada di cache tidak di-scan ulang (lihat skill_taxonomy.MatchCache)
+    counts = Counter()
+    for found in cache.match(texts, TAXONOMY.patterns, workers=workers, chunk_size=chunk_size):
+        counts.update(TAXONOMY.to_skills(found))
+    return counts, len(texts)
+
+
+def _description_chunks(path, chunk_size, timer):
+    reader = pd.read_csv(path, usecols=['description'], chunksize=chunk_size, on_bad_lines='skip')
+    while True:
+        with timer.stage('read'):
+            chunk = next(reader, None)
+        if chunk is None:
+            return
+        # Buang deskripsi kosong (NaN), sisanya dipastikan string
+        yield chunk['description'].dropna().astype(str).tolist()
+
+
+def count_skills(path=input_file, chunk_size=READ_CHUNK_SIZE, workers=N_WORKERS, timer=None, cache=None):
+    """Stream CSV per chunk -> (Counter skill, jumlah lowongan yang dianalisis).
+
+    Counter berisi jumlah LOWONGAN yang menyebut skill kanonik tsb (1 per
+    lowongan; sinonim seperti 'gcp' dihitung sebagai 'google cloud').
+    Dengan workers > 1, maksimal 2 chunk per worker yang sedang diproses,
+    jadi memori tetap dibatasi ukuran chunk. Kalau `cache` (MatchCache)
+    diberikan, chunk diproses di proses utama dan hanya deskripsi / pola
+    yang belum ada di cache yang di-scan (paralel kalau workers > 1).
+    """
+    timer = timer or StageTimer('analisis_skill')
+    counts, n_rows = Counter(), 0
+
+    def merge(result, rows):
+        nonlocal n_rows
+        counts.update(result)
+        n_rows += rows
+        print(f"   🔍 {n_rows:,} lowongan di-scan")
+
+    chunks = _description_chunks(path, chunk_size, timer)
+    if cache is not None:
+        for texts in chunks:
+            with timer.stage('count', len(texts)):
+                merge(*_count_cached(texts, cache, workers, max(1, chunk_size // (workers or 1))))
+        return counts, n_rows
+
+    if workers is None or workers <= 1:
+        for texts in chunks:
+            with timer.stage('count', len(texts)):
+                merge(*_count_chunk(texts))
+        return counts, n_rows
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for texts in chunks:
+            pending.append(executor.submit(_count_chunk, texts))
+            if len(pending) >= workers * 2:
+                with timer.stage('count'):
+                    merge(*pending.popleft().result())
+        while pending:
+            with timer.stage('count'):
+                merge(*pending.popleft().result())
+    return counts, n_rows
+
+
+def frequency_table(counts, n_rows):
+    """Counter -> DataFrame (Skill, Jumlah, Persen) terurut menurun."""
+    table = pd.DataFrame(counts.most_common(), columns=['Skill', 'Jumlah'])
+    table['Persen'] = (table['Jumlah'] / n_rows * 100).round(2) if n_rows else 0.0
+    return table
+
+
+def plot_top_skills(table, n_rows, path=bar_file, top_n=TOP_N):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    # Ambil cuma skill teratas biar grafik gak semrawut
+    top_skills = table.head(top_n).sort_values('Jumlah', ascending=True)
+
+    plt.figure(figsize=(12, 8))
+    plt.barh(top_skills['Skill'], top_skills['Jumlah'], color='#2a9d8f')
+    plt.title(f'TOP {top_n} Skill Paling Dicari (Dari {n_rows:,} Lowongan)', fontsize=16, fontweight='bold')
+    plt.xlabel('Jumlah Lowongan', fontsize=12)
+    plt.ylabel('Skill Teknis', fontsize=12)
+    plt.grid(axis='x', linestyle='--', alpha=0.5)
+
+    # Menambahkan label angka di ujung batang
+    for index, value in enumerate(top_skills['Jumlah']):
+        plt.text(value + 10, index, str(value), va='center')
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=300)  # Simpan resolusi tinggi
+    plt.close()
+    return path
+
+
+def plot_wordcloud(table, path=wordcloud_file):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from wordcloud import WordCloud
+
+    # Langsung dari frekuensi: tanpa string gabungan raksasa, dan skill
+    # multi-kata ("power bi", "machine learning") tetap utuh satu frasa
+    wc = WordCloud(
+        width=1600, height=800,
+        background_color='black',  # Background hitam biar warna skill 'pop up'
+        colormap='rainbow',        # Warna-warni cerah
+    ).generate_from_frequencies(dict(zip(table['Skill'], table['Jumlah'])))
+
+    plt.figure(figsize=(15, 8))
+    plt.imshow(wc, interpolation='bilinear')
+    plt.axis('off')
+    plt.title('Peta Kompetensi Data Analyst 2025', fontsize=20)
+    plt.tight_layout()
+    plt.savefig(path, dpi=300)
+    plt.close()
+    return path
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Analisis skill seluruh dataset (streaming per chunk)")
+    parser.add_argument('--input', default=input_file)
+    parser.add_argument('--chunk-size', type=int, default=READ_CHUNK_SIZE,
+                        help=f"Jumlah baris CSV per chunk (default {READ_CHUNK_SIZE})")
+    parser.add_argument('--workers', type=int, default=N_WORKERS,
+                        help="Jumlah proses paralel (default 1 = serial)")
+    parser.add_argument('--top', type=int, default=TOP_N, help="Jumlah skill di bar chart")
+    parser.add_argument('--cache', action='store_true',
+                        help=f"Pakai cache hasil match skill ('{CACHE_FILE}', dipakai bersama ETL)")
+    parser.add_argument('--no-plot', action='store_true', help="Hanya tulis tabel frekuensi (tanpa gambar)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    perf = StageTimer('analisis_skill')
+
+    try:
+        if not os.path.exists(args.input):
+            raise FileNotFoundError(f"File '{args.input}' tidak ditemukan")
+
+        print(f"🚀 Menganalisis '{args.input}' per {args.chunk_size:,} baris "
+              f"({len(TARGET_SKILLS)} skill, taxonomy v{TAXONOMY.version})...")
+        cache = MatchCache(CACHE_FILE) if args.cache else None
+        counts, n_rows = count_skills(args.input, args.chunk_size, args.workers, timer=perf, cache=cache)
+        if cache is not None and cache.save():
+            print(f"💾 Cache skill diperbarui: {len(cache):,} deskripsi")
+        table = frequency_table(counts, n_rows)
+        table.to_csv(freq_file, index=False)
+        print(f"✅ {n_rows:,} lowongan dianalisis, {len(table)} skill ditemukan -> '{freq_file}'")
+
+        if not args.no_plot:
+            with perf.stage('plot'):
+                plot_top_skills(table, n_rows, top_n=args.top)
+                print(f"📊 Grafik batang tersimpan: {bar_file}")
+                try:
+                    plot_wordcloud(table)
+                    print(f"☁️  Word Cloud tersimpan: {wordcloud_file}")
+                except ImportError:
+                    print("⚠️  Paket wordcloud belum terpasang, Word Cloud dilewati (pip install wordcloud)")
+
+        report = perf.log(rows=n_rows, workers=args.workers)
+        print(f"⏱️  Selesai dalam {report['total_ms'] / 1000:,.1f} detik")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        # Exit code != 0 supaya pemanggil (benchmark, cron) tahu analisis gagal
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
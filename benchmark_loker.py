@@ -0,0 +1,324 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from bikin_data_sintetis import generate, parse_rows
+from bikin_data_lite import detect_skills
+from compact_data import compact_frame, memory_report
+from data_explorer import get_page
+from dedup import cluster_ids, minhash_signatures
+from data_lite import read_lite_data
+from filter_pipeline import FilterPipeline
+from mmap_data import read_mmap_data, write_mmap_data
+from overview_cube import build_cube, cell_mask, query_cube, overview_from_rows
+from rollups import build_rollups, query_trend
+from query_backend import ENGINES, DATA_SQLITE, SqlBackend, build_sqlite, duckdb
+from salary_stats import QUANTILES, valid_salaries, salary_summary, salary_histogram
+from skill_matcher import skill_columns
+from skill_insights import SkillInsights
+from sketches import DISTINCT_KEYS, HLL_ERROR_BOUND, TDIGEST_RANK_ERROR_BOUND, build_sketches, query_sketches
+from title_index import TitleIndex
+
+# Benchmark hot path ETL & dashboard di atas data sintetis yang di-seed.
+# Hasil tiap run ditambahkan (1 baris JSON) ke benchmark_results.jsonl supaya
+# bisa dibandingkan antar waktu; langkah yang melambat > threshold ditandai.
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+BENCH_DIR = 'bench_data'
+RESULTS_FILE = 'benchmark_results.jsonl'
+REGRESSION_THRESHOLD = 0.20  # 20% lebih lambat dari run sebelumnya = regresi
+MIN_DELTA_S = 0.002          # Selisih < 2 ms dianggap noise
+
+# Kombinasi filter sidebar yang realistis (search, schedule_type, via, remote)
+FILTER_CASES = [
+    ("", None, None, None),
+    ("", None, ['via LinkedIn', 'via Upwork', 'via BeBee'], None),
+    ("", ['Full-time'], ['via LinkedIn'], True),
+    ("analyst", None, None, None),
+    ("senior data", None, ['via LinkedIn', 'via Indeed'], False),
+]
+
+
+def _timeit(fn, repeat=3):
+    """Waktu terbaik (detik) dari `repeat` kali panggil + hasil panggilan terakhir."""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def _record(results, name, seconds, rows=None):
+    entry = {'seconds': round(seconds, 6)}
+    if rows:
+        entry['rows'] = rows
+        entry['rows_per_s'] = round(rows / seconds, 1) if seconds > 0 else None
+    results[name] = entry
+    rate = f" ({entry['rows_per_s']:,.0f} baris/s)" if rows and entry['rows_per_s'] else ""
+    print(f"   ⏱️  {name:<28} {seconds * 1000:>10.1f} ms{rate}")
+
+
+def _git_rev():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                                       text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def prepare_data(rows, seed):
+    """Pastikan gsearch_jobs.csv sintetis untuk skala ini ada (di-cache per rows/seed)."""
+    workdir = os.path.join(BENCH_DIR, f"{rows}_{seed}")
+    os.makedirs(workdir, exist_ok=True)
+    raw = os.path.join(workdir, 'gsearch_jobs.csv')
+    if not os.path.exists(raw):
+        print(f"🧪 Membuat data sintetis {rows:,} baris di '{workdir}'...")
+        generate(raw, rows, seed=seed)
+    return workdir
+
+
+def bench_etl(workdir, results, rows, sample_descriptions):
+    print("🔧 ETL (bikin_data_lite.py)")
+    sample = pd.read_csv(os.path.join(workdir, 'gsearch_jobs.csv'),
+                         usecols=['title', 'company_name', 'description'], nrows=sample_descriptions)
+    descs = sample['description']
+    seconds, _ = _timeit(lambda: descs.apply(detect_skills), repeat=1)
+    _record(results, 'detect_skills', seconds, len(descs))
+
+    # Deteksi near-duplicate: signature MinHash (per batch) + clustering LSH
+    seconds, signatures = _timeit(
+        lambda: minhash_signatures(sample['title'], sample['company_name'], descs), repeat=1)
+    _record(results, 'minhash', seconds, len(sample))
+    seconds, clusters = _timeit(lambda: cluster_ids(signatures), repeat=1)
+    _record(results, 'lsh_cluster', seconds, len(sample))
+    results['lsh_cluster']['unique'] = int(pd.Series(clusters).nunique())
+
+    script = os.path.join(REPO_DIR, 'bikin_data_lite.py')
+
+    def run_etl(*extra):
+        subprocess.run([sys.executable, script, *extra], cwd=workdir, check=True,
+                       stdout=subprocess.DEVNULL)
+
+    # Cache hasil match skill dimatikan: workdir dipakai ulang antar run, jadi
+    # tanpa --no-cache yang terukur hanya lookup cache, bukan scan skill
+    for name, extra in [('etl_pipeline', []), ('etl_pipeline_stream', ['--stream'])]:
+        seconds, _ = _timeit(lambda: run_etl(*extra, '--no-cache'), repeat=1)
+        _record(results, name, seconds, rows)
+
+    # Run ulang dengan cache hangat (run pertama hanya mengisi cache, tidak diukur)
+    run_etl()
+    seconds, _ = _timeit(run_etl, repeat=1)
+    _record(results, 'etl_pipeline_warm_cache', seconds, rows)
+
+
+def bench_dashboard(workdir, results, filter_repeat):
+    print("📊 Dashboard (load_data, filter, agregasi per tab)")
+    parquet = os.path.join(workdir, 'gsearch_jobs_lite.parquet')
+    csv = os.path.join(workdir, 'gsearch_jobs_lite.csv')
+
+    seconds, df = _timeit(lambda: compact_frame(read_lite_data(parquet, csv)))
+    _record(results, 'load_data', seconds, len(df))
+    results['load_data']['memory_bytes'] = int(memory_report(df)['bytes'].iloc[-1])
+
+    # Mode mmap (LOKER_MMAP=1): start worker = buka file Arrow, tanpa decode/salin kolom
+    arrow = write_mmap_data(df, os.path.join(workdir, 'gsearch_jobs_lite.arrow'))
+    seconds, _ = _timeit(lambda: read_mmap_data(arrow))
+    _record(results, 'load_data_mmap', seconds, len(df))
+
+    seconds, index = _timeit(lambda: TitleIndex(df['title']), repeat=1)
+    _record(results, 'title_index_build', seconds, len(df))
+
+    # Filter tanpa LRU (selalu cold) supaya yang diukur memang scan/mask-nya
+    pipeline = FilterPipeline(df, index, maxsize=0)
+    schedules = list(df['schedule_type'].unique())
+    filtered = {}
+    for i, (search, sched, via, remote) in enumerate(FILTER_CASES):
+        seconds, filtered[i] = _timeit(
+            lambda: pipeline.select_rows(search, sched if sched is not None else schedules, via, remote),
+            repeat=filter_repeat)
+        _record(results, f'filter_{i}', seconds, len(df))
+
+    cells, top = _timeit(lambda: build_cube(df), repeat=1)[1]
+    sel, rows = filtered[1]
+    seconds, _ = _timeit(lambda: query_cube(cells, top, schedules, FILTER_CASES[1][2]), repeat=filter_repeat)
+    _record(results, 'tab_overview_cube', seconds)
+    seconds, _ = _timeit(lambda: overview_from_rows(sel), repeat=filter_repeat)
+    _record(results, 'tab_overview_rows', seconds, len(sel))
+
+    cols = skill_columns(sel)
+    seconds, _ = _timeit(lambda: sel[cols].sum().sort_values(ascending=False).head(15), repeat=filter_repeat)
+    _record(results, 'tab_skill', seconds, len(sel))
+
+    # Co-occurrence (sparse X^T X) & premium gaji per skill untuk baris hasil filter
+    seconds, insights = _timeit(lambda: SkillInsights(df, skill_columns(df)), repeat=1)
+    _record(results, 'skill_insights_build', seconds, len(df))
+    seconds, _ = _timeit(lambda: (insights.cooccurrence(rows), insights.premium(rows)), repeat=filter_repeat)
+    _record(results, 'tab_skill_insights', seconds, len(sel))
+
+    def salary_stats():
+        gaji = valid_salaries(sel)
+        return salary_summary(gaji), salary_histogram(gaji, bins=30)
+
+    seconds, _ = _timeit(salary_stats, repeat=filter_repeat)
+    _record(results, 'tab_salary', seconds, len(sel))
+
+    # Halaman ke-10 (100 baris) diurutkan gaji tertinggi
+    raw_cols = ['title', 'company_name', 'location', 'salary_yearly', 'via', 'date_time', 'schedule_type']
+    seconds, _ = _timeit(lambda: get_page(sel, raw_cols, 'salary_yearly', False, page=10, page_size=100),
+                         repeat=filter_repeat)
+    _record(results, 'tab_raw_page', seconds, len(sel))
+
+    # Sketch HLL/t-digest per sel cube: KPI unik & kuantil gaji tanpa scan baris
+    seconds, sketches = _timeit(lambda: build_sketches(df), repeat=1)
+    _record(results, 'sketch_build', seconds, len(df))
+    seconds, _ = _timeit(lambda: query_sketches(sketches, schedules, FILTER_CASES[1][2], None, QUANTILES),
+                         repeat=filter_repeat)
+    _record(results, 'tab_overview_sketch', seconds)
+    errors = sketch_errors(df, sketches, schedules)
+    results['tab_overview_sketch'].update(errors)
+    print(f"   📐 Galat sketch: HLL {errors['hll_max_rel_error']:.2%} (batas {HLL_ERROR_BOUND:.2%}), "
+          f"t-digest rank {errors['tdigest_max_rank_error']:.2%} (batas {TDIGEST_RANK_ERROR_BOUND:.2%})")
+
+    rollups = build_rollups(df)
+    seconds, _ = _timeit(lambda: query_trend(rollups, 'weekly', schedules, FILTER_CASES[1][2]), repeat=filter_repeat)
+    _record(results, 'tab_trend_weekly', seconds)
+
+
+def sketch_errors(df, sketches, schedules):
+    """Galat sketch vs nilai exact untuk kasus filter tanpa pencarian judul.
+
+    hll: galat relatif |perkiraan/exact - 1| perusahaan, lokasi & lowongan unik
+    tdigest: galat rank |rank(perkiraan kuantil)/n - q| kuantil gaji
+    """
+    hll_err, rank_err = 0.0, 0.0
+    for search, sched, via, remote in FILTER_CASES:
+        if search:
+            continue
+        sched = sched if sched is not None else schedules
+        approx = query_sketches(sketches, sched, via, remote, QUANTILES)
+        rows = df[cell_mask(df, sched, via, remote).to_numpy(dtype=bool)]
+        for dim, key in DISTINCT_KEYS.items():
+            exact = rows[dim].nunique() if dim in rows.columns else 0
+            if exact:
+                hll_err = max(hll_err, abs(approx[key] / exact - 1))
+        salaries = np.sort(valid_salaries(rows))
+        if len(salaries) and approx.get('salary_quantiles'):
+            for label, q in QUANTILES.items():
+                rank = np.searchsorted(salaries, approx['salary_quantiles'][label], side='right') / len(salaries)
+                rank_err = max(rank_err, abs(rank - q))
+    return {'hll_max_rel_error': round(hll_err, 5), 'tdigest_max_rank_error': round(rank_err, 5),
+            'within_bounds': bool(hll_err <= HLL_ERROR_BOUND and rank_err <= TDIGEST_RANK_ERROR_BOUND)}
+
+
+def bench_backends(workdir, results, filter_repeat):
+    print("🗄️  Backend SQL (filter + agregasi semua tab di engine)")
+    parquet = os.path.join(workdir, 'gsearch_jobs_lite.parquet')
+    search, via = FILTER_CASES[4][0], FILTER_CASES[4][2]
+    raw_cols = ['title', 'company_name', 'location', 'salary_yearly', 'via', 'date_time', 'schedule_type']
+
+    for engine in ENGINES:
+        if engine == 'duckdb' and duckdb is None:
+            print("   ⏭️  duckdb tidak terpasang, dilewati")
+            continue
+        path = parquet
+        if engine == 'sqlite':
+            path = os.path.join(workdir, DATA_SQLITE)
+            seconds, _ = _timeit(lambda: build_sqlite(parquet, path), repeat=1)
+            _record(results, 'sqlite_build', seconds)
+
+        # maxsize=0 -> tanpa LRU, yang diukur memang query ke engine
+        backend = SqlBackend(engine, path, maxsize=0)
+        where = backend.where(search, backend.schedule_options(), via, None)
+
+        def all_tabs():
+            backend.overview(where)
+            backend.skill_totals(where)
+            backend.salary_summary(where)
+            backend.salary_histogram(where, bins=30)
+            return backend.page(where, raw_cols, 'salary_yearly', False, page=10, page_size=100)
+
+        seconds, _ = _timeit(all_tabs, repeat=filter_repeat)
+        _record(results, f'{engine}_all_tabs', seconds, backend.n_rows)
+
+
+def find_regressions(run, history, threshold=REGRESSION_THRESHOLD):
+    """Bandingkan dengan run terakhir ber-skala sama; kembalikan list langkah yang melambat."""
+    previous = [h for h in history if h.get('rows') == run['rows'] and h.get('seed') == run['seed']]
+    if not previous:
+        return []
+    last = previous[-1]['results']
+    slow = []
+    for name, entry in run['results'].items():
+        before = last.get(name, {}).get('seconds')
+        if before and entry['seconds'] > before * (1 + threshold) and entry['seconds'] - before > MIN_DELTA_S:
+            slow.append({'name': name, 'before': before, 'after': entry['seconds'],
+                         'ratio': round(entry['seconds'] / before, 3)})
+    return slow
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ETL & dashboard loker (data sintetis)")
+    parser.add_argument('--rows', type=parse_rows, default=parse_rows('10k'),
+                        help="Skala data sintetis: 10k .. 5M")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--skip-etl', action='store_true', help="Lewati benchmark ETL (pakai artefak yang ada)")
+    parser.add_argument('--skip-backends', action='store_true', help="Lewati benchmark backend DuckDB/SQLite")
+    parser.add_argument('--detect-sample', type=int, default=20_000,
+                        help="Jumlah deskripsi untuk benchmark detect_skills")
+    parser.add_argument('--repeat', type=int, default=5, help="Ulangan untuk langkah dashboard")
+    parser.add_argument('--output', default=RESULTS_FILE)
+    parser.add_argument('--fail-on-regression', action='store_true')
+    args = parser.parse_args()
+
+    workdir = prepare_data(args.rows, args.seed)
+    results = {}
+
+    if not args.skip_etl or not os.path.exists(os.path.join(workdir, 'gsearch_jobs_lite.parquet')):
+        bench_etl(workdir, results, args.rows, args.detect_sample)
+    bench_dashboard(workdir, results, args.repeat)
+    if not args.skip_backends:
+        bench_backends(workdir, results, args.repeat)
+
+    run = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'git_rev': _git_rev(),
+        'rows': args.rows,
+        'seed': args.seed,
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'cpu_count': os.cpu_count(),
+        'results': results,
+    }
+    run['regressions'] = find_regressions(run, load_history(args.output))
+
+    with open(args.output, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(run) + "\n")
+    print(f"💾 Hasil ditambahkan ke '{args.output}'")
+
+    for r in run['regressions']:
+        print(f"⚠️  Regresi: {r['name']} {r['before'] * 1000:.1f} ms -> {r['after'] * 1000:.1f} ms (x{r['ratio']})")
+    sketch_ok = results['tab_overview_sketch']['within_bounds']
+    if not sketch_ok:
+        print("⚠️  Galat sketch melebihi batas yang didokumentasikan (lihat sketches.py)")
+    if (run['regressions'] or not sketch_ok) and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
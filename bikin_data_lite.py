@@ -1,65 +1,519 @@
 import pandas as pd
+import numpy as np
 import os
-import re  # Import modul Regex
+import sys
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from skill_matcher import MATCH_RULES_VERSION, SkillMatcher, SKILL_PREFIX, skill_matrix
+from overview_cube import build_cube
+from sketches import SKETCH_FILE, build_sketches, write_sketches
+from rollups import build_rollups, merge_rollups, read_rollups, write_rollups
+from etl_manifest import (HASH_VERSION, KEY_COL, hash_rows, id_columns, in_sample, needs_scan, posting_hashes,
+                          read_manifest, write_manifest)
+from skill_taxonomy import CACHE_FILE, MatchCache, load_taxonomy
+from mmap_data import DATA_ARROW, write_mmap_data
+from dedup import CLUSTER_COL, SIGNATURE_COL, cluster_ids, signature_column, unpack_signatures
+from perf_timer import StageTimer
 
 input_file = 'gsearch_jobs.csv'
-output_file = 'gsearch_jobs_lite.csv'
-
-# Daftar Skill
-SKILL_KEYWORDS = [
-    'python', 'sql', 'excel', 'tableau', 'power bi', 'aws', 'azure', 
-    'google cloud', 'machine learning', 'spark', 'hadoop', 'java', 
-    'scala', 'r', 'sas', 'looker', 'snowflake', 'databricks', 'tensorflow',
-    'pytorch', 'scikit-learn', 'pandas', 'numpy'
+output_file = 'gsearch_jobs_lite.parquet'   # Artefak utama: Parquet bertipe (dibaca langsung oleh dashboard)
+csv_output_file = 'gsearch_jobs_lite.csv'   # Versi CSV lama (opsional, lewat --csv)
+arrow_output_file = DATA_ARROW              # Arrow IPC untuk mmap multi-worker (opsional, lewat --arrow)
+skill_vocab_file = 'gsearch_jobs_skill_vocab.parquet'  # Tabel kosakata skill (id, nama, kolom)
+cube_file = 'gsearch_jobs_cube.parquet'          # Cube agregat Overview (per kombinasi filter)
+cube_top_file = 'gsearch_jobs_cube_top.parquet'  # Jumlah per lokasi/perusahaan per sel cube
+sketch_file = SKETCH_FILE  # Sketch HLL & t-digest per sel cube (perusahaan/lokasi unik, kuantil gaji)
+skill_cache_file = CACHE_FILE  # Cache hasil match skill per deskripsi (lihat skill_taxonomy.py)
+signature_file = 'gsearch_jobs_minhash.parquet'  # Signature MinHash per lowongan sampel (mode --incremental)
+
+# Setting default mode paralel (bisa dioverride lewat argumen CLI)
+N_WORKERS = 1        # 1 = mode serial biasa (satu core)
+CHUNK_SIZE = 5000    # Jumlah deskripsi per chunk yang dikirim ke 1 worker
+
+# Setting sampling & mode streaming
+SAMPLE_SIZE = 50000
+RANDOM_STATE = 42
+READ_CHUNK_SIZE = 20000  # Jumlah baris CSV yang dibaca per chunk (mode --stream)
+
+COLS_TO_READ = [
+    'title', 'company_name', 'location', 'via', 'schedule_type',
+    'work_from_home', 'date_time', 'salary_yearly', 'description'
 ]
 
-print("⏳ Sedang membaca data asli...")
+# Kolom low-cardinality -> disimpan sebagai dictionary (categorical) di Parquet
+CATEGORY_COLS = ['via', 'schedule_type', 'location', 'company_name']
+
+# Daftar Skill: dari skill_taxonomy.json (kategori + sinonim, contoh gcp -> google cloud)
+TAXONOMY = load_taxonomy()
+SKILL_KEYWORDS = TAXONOMY.skills
+
+# Semua pola (skill + sinonim) dikompilasi sekali jadi satu regex gabungan (lihat skill_matcher.py)
+SKILL_MATCHER = SkillMatcher(TAXONOMY.patterns)
+
+
+def detect_skills(text):
+    # Hasil identik dengan regex per pola (batas kata, lihat skill_matcher.py),
+    # tapi deskripsi cukup di-scan satu kali. Sinonim dipetakan ke skill kanonik.
+    if not isinstance(text, str):
+        return ""
+    return TAXONOMY.joined(SKILL_MATCHER.find(text))
+
+
+def _detect_chunk(texts):
+    # Dijalankan di dalam worker process (harus level modul agar bisa di-pickle)
+    return [detect_skills(t) for t in texts]
+
+
+def extract_skills(descriptions, workers=N_WORKERS, chunk_size=CHUNK_SIZE, cache=None):
+    """Deteksi skill untuk satu Series deskripsi, opsional paralel multi-core.
+
+    Deskripsi dipecah jadi chunk berukuran `chunk_size` lalu diproses di
+    process pool berisi `workers` proses. Urutan hasil selalu sama dengan
+    urutan baris asli. Dengan workers=1 dipakai jalur serial biasa.
+    Kalau `cache` (MatchCache) diberikan, hanya deskripsi / pola taxonomy
+    yang belum ada di cache yang di-scan.
+    """
+    if cache is not None:
+        found = cache.match(descriptions, TAXONOMY.patterns, workers=workers, chunk_size=chunk_size)
+        return pd.Series([TAXONOMY.joined(f) for f in found], index=descriptions.index, dtype=object)
+
+    if workers is None or workers <= 1 or len(descriptions) <= chunk_size:
+        return descriptions.apply(detect_skills)
+
+    texts = descriptions.tolist()
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+    # executor.map mengembalikan hasil sesuai urutan chunk input
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_detect_chunk, chunks)
+        skills = list(chain.from_iterable(results))
+
+    return pd.Series(skills, index=descriptions.index, dtype=object)
+
+
+def add_signatures(df, timer):
+    """Tambah kolom signature MinHash (judul + perusahaan + deskripsi) sebelum deskripsi dibuang."""
+    with timer.stage('minhash', rows=len(df)):
+        df[SIGNATURE_COL] = signature_column(df).values
+    return df
+
+
+def _scan_chunk(frame):
+    # Satu tugas worker: skill + signature MinHash satu chunk lowongan (level modul agar bisa di-pickle)
+    return [detect_skills(t) for t in frame['description']], signature_column(frame).tolist()
+
+
+def _signature_chunk(frame):
+    return signature_column(frame).tolist()
+
+
+def scan_rows(df, timer, workers=N_WORKERS, chunk_size=CHUNK_SIZE, cache=None):
+    """Tambah kolom `required_skills` + signature MinHash (sebelum deskripsi dibuang).
+
+    Dengan workers > 1, tiap chunk `chunk_size` baris diproses di process pool:
+    worker mendeteksi skill sekaligus menghitung signature MinHash chunk itu
+    (waktunya tercatat di stage 'extract'). Kalau `cache` (MatchCache) diberikan,
+    skill diambil lewat cache (lihat extract_skills) dan MinHash tetap dibagi per
+    chunk ke pool. Hasil identik dengan jalur serial.
+    """
+    if workers is None or workers <= 1 or len(df) <= chunk_size:
+        with timer.stage('extract', rows=len(df)):
+            df['required_skills'] = extract_skills(df['description'], workers=workers,
+                                                   chunk_size=chunk_size, cache=cache).values
+        return add_signatures(df, timer)
+
+    cols = [c for c in ('title', 'company_name', 'description') if c in df.columns]
+    chunks = [df[cols].iloc[i:i + chunk_size] for i in range(0, len(df), chunk_size)]
+    if cache is not None:
+        with timer.stage('extract', rows=len(df)):
+            df['required_skills'] = extract_skills(df['description'], workers=workers,
+                                                   chunk_size=chunk_size, cache=cache).values
+        with timer.stage('minhash', rows=len(df)):
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                df[SIGNATURE_COL] = list(chain.from_iterable(executor.map(_signature_chunk, chunks)))
+        return df
+
+    with timer.stage('extract', rows=len(df)):
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_scan_chunk, chunks))
+    df['required_skills'] = list(chain.from_iterable(skills for skills, _ in results))
+    df[SIGNATURE_COL] = list(chain.from_iterable(signatures for _, signatures in results))
+    return df
+
+
+def assign_clusters(df):
+    """Kolom signature -> kolom `dup_cluster` (id cluster near-duplicate, lihat dedup.py)."""
+    df = df.reset_index(drop=True)
+    df[CLUSTER_COL] = cluster_ids(unpack_signatures(df.pop(SIGNATURE_COL).tolist()))
+    n_unique = df[CLUSTER_COL].nunique()
+    print(f"🧬 {n_unique:,} lowongan unik dari {len(df):,} baris ({len(df) - n_unique:,} near-duplicate)")
+    return df
+
+
+def reservoir_picks(rng, seen, n, sample_size):
+    """Langkah Algorithm R untuk satu chunk `n` baris (sudah `seen` baris sebelumnya).
+
+    Return Series: index = slot reservoir, nilai = posisi baris di chunk yang mengisinya.
+    Tiap baris memakai tepat satu angka acak, jadi sampel tidak tergantung ukuran chunk.
+    """
+    pos = np.arange(seen, seen + n)
+
+    # Baris ke-i (global) masuk ke slot j ~ Uniform(0, i), diterima jika j < sample_size.
+    # Selama reservoir belum penuh, baris langsung mengisi slot ke-i.
+    slots = np.where(pos < sample_size, pos, rng.integers(0, pos + 1))
+    accepted = np.flatnonzero(slots < sample_size)
+
+    # Kalau 1 slot kena lebih dari sekali di chunk yang sama, yang terakhir menang
+    picked = pd.Series(accepted, index=slots[accepted])
+    return picked[~picked.index.duplicated(keep='last')]
+
+
+def stream_sample(path, sample_size=SAMPLE_SIZE, read_chunk_size=READ_CHUNK_SIZE,
+                  random_state=RANDOM_STATE, workers=N_WORKERS, chunk_size=CHUNK_SIZE, timer=None,
+                  cache=None):
+    """Baca CSV per chunk + reservoir sampling (Algorithm R) dengan seed tetap.
+
+    Hanya baris yang masuk reservoir yang di-scan skill-nya, lalu kolom
+    `description` langsung dibuang (setelah signature MinHash-nya dihitung). Jadi pemakaian memori dibatasi oleh
+    ukuran chunk + ukuran sampel, bukan ukuran file. Baris CSV yang rusak
+    dilewati (on_bad_lines='skip', sama seperti di notebook analisis).
+    Waktu tahap read/sample/extract dicatat ke `timer` (StageTimer) kalau diberikan.
+    """
+    timer = timer or StageTimer('stream_sample')
+    rng = np.random.default_rng(random_state)
+    reservoir = None  # DataFrame ber-index nomor slot (0..sample_size-1)
+    seen = 0
+
+    reader = pd.read_csv(path, usecols=lambda c: c in COLS_TO_READ,
+                         chunksize=read_chunk_size, on_bad_lines='skip')
+
+    chunks = iter(reader)
+    while True:
+        t0 = time.perf_counter()
+        chunk = next(chunks, None)
+        if chunk is None:
+            break
+        n = len(chunk)
+        timer.add('read', time.perf_counter() - t0, n)
+        t0 = time.perf_counter()
+
+        picked = reservoir_picks(rng, seen, n, sample_size)
+        seen += n
+
+        if len(picked) == 0:
+            timer.add('sample', time.perf_counter() - t0, n)
+            continue
+
+        new_rows = chunk.iloc[picked.values].copy()
+        timer.add('sample', time.perf_counter() - t0, n)
+
+        new_rows = scan_rows(new_rows, timer, workers, chunk_size, cache).drop(columns=['description'])
+        new_rows.index = picked.index
+
+        if reservoir is None:
+            reservoir = new_rows
+        else:
+            reservoir = pd.concat([reservoir[~reservoir.index.isin(new_rows.index)], new_rows])
+
+    if reservoir is None:
+        return pd.DataFrame(columns=[c for c in COLS_TO_READ if c != 'description']
+                            + ['required_skills', SIGNATURE_COL])
+
+    print(f"   📥 Total baris dibaca: {seen:,}")
+    return reservoir.sort_index().reset_index(drop=True)
+
+
+def to_typed(df):
+    """Rapikan tipe kolom supaya dashboard tidak perlu parsing ulang saat start."""
+    df = df.reset_index(drop=True)
+    if 'date_time' in df.columns:
+        df['date_time'] = pd.to_datetime(df['date_time'], errors='coerce')
+    if 'work_from_home' in df.columns:
+        df['work_from_home'] = df['work_from_home'].fillna(False).astype(bool)
+    if 'salary_yearly' in df.columns:
+        df['salary_yearly'] = pd.to_numeric(df['salary_yearly'], errors='coerce').astype('float64')
+    if 'required_skills' in df.columns:
+        df['required_skills'] = df['required_skills'].fillna("").astype(str)
+    for col in CATEGORY_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+
+def skill_vocab(lite_df):
+    """Tabel kosakata skill (id, nama, kategori, kolom matriks, total lowongan)."""
+    columns = [SKILL_PREFIX + s for s in SKILL_KEYWORDS]
+    return pd.DataFrame({
+        'skill_id': range(len(SKILL_KEYWORDS)),
+        'skill': SKILL_KEYWORDS,
+        'category': [TAXONOMY.category_of[s] for s in SKILL_KEYWORDS],
+        'column': columns,
+        'total': lite_df[columns].sum().values,
+    })
+
+
+def add_skill_matrix(df, keep_strings=False):
+    """Tambah matriks skill uint8 (kolom 'skill_<nama>') + tabel kosakata skill."""
+    matrix = skill_matrix(df['required_skills'], SKILL_KEYWORDS)
+    if not keep_strings:
+        df = df.drop(columns=['required_skills'])
+    lite_df = pd.concat([df, matrix], axis=1)
+    return lite_df, skill_vocab(lite_df)
+
+
+def write_parquet(frame, path):
+    # Tulis ke .tmp lalu rename atomik: dashboard tidak pernah membaca file setengah
+    # jadi, dan snapshot yang masih memegang versi lama (hardlink, lihat
+    # query_backend.snapshot_link) tetap melihat isi lamanya
+    tmp_path = path + '.tmp'
+    frame.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def write_artifacts(lite_df, vocab, rollups=None, arrow=False):
+    """Tulis Parquet lite + kosakata skill + cube & sketch Overview + rollup tren (+ Arrow mmap)."""
+    write_parquet(lite_df, output_file)
+    write_parquet(vocab, skill_vocab_file)
+
+    if arrow:
+        # Dibaca dashboard via memory-map (LOKER_MMAP=1), dipakai bersama semua worker
+        write_mmap_data(lite_df, arrow_output_file)
+        size_mb = os.path.getsize(arrow_output_file) / (1024 * 1024)
+        print(f"🗺️  File Arrow (mmap) disimpan: '{arrow_output_file}' ({size_mb:.2f} MB)")
+
+    # Cube agregat untuk tab Overview
+    cells, top = build_cube(lite_df)
+    if cells is not None:
+        write_parquet(cells, cube_file)
+        write_parquet(top, cube_top_file)
+        print(f"🧊 Cube Overview disimpan: {len(cells):,} sel, {len(top):,} baris top lokasi/perusahaan")
+
+    # Sketch per sel cube (dibangun ulang penuh: HLL tidak bisa dikurangi saat lowongan berubah)
+    sketches = build_sketches(lite_df)
+    if sketches is not None:
+        write_sketches(sketches, sketch_file)
+        print(f"📐 Sketch HLL/t-digest disimpan: {len(sketches):,} partisi")
+
+    # Rollup harian & mingguan untuk chart tren
+    if rollups is None:
+        rollups = build_rollups(lite_df)
+    if rollups is not None:
+        write_rollups(rollups)
+        print(f"📈 Rollup tren disimpan: {len(rollups['postings']):,} baris (harian + mingguan)")
+
+
+def run_incremental(args, timer, cache=None):
+    """ETL inkremental: hanya lowongan baru/berubah yang di-scan skill-nya.
+
+    Return False kalau tidak ada perubahan (artefak tidak ditulis ulang).
+
+    Manifest (etl_manifest.py) mencatat hash tiap lowongan yang sudah diproses.
+    Full rebuild otomatis hanya kalau manifest/artefak (termasuk signature MinHash)
+    belum ada atau versi taxonomy skill / aturan match / hashing manifest berubah. Sampel dipilih
+    berdasarkan hash posting_key dengan rate tetap (disimpan di manifest), jadi
+    lowongan lama tidak keluar-masuk sampel.
+    """
+    header = pd.read_csv(input_file, nrows=0).columns
+    id_cols = id_columns(header)
+    read_cols = list(dict.fromkeys([c for c in COLS_TO_READ if c in header] + id_cols))
+
+    manifest, meta = read_manifest()
+    base = signatures = None
+    same_taxonomy = (meta.get('taxonomy_version') == TAXONOMY.version
+                     and meta.get('match_rules') == MATCH_RULES_VERSION
+                     and meta.get('hash_version') == HASH_VERSION)
+    if manifest is not None and same_taxonomy and os.path.exists(output_file) and os.path.exists(signature_file):
+        base = pd.read_parquet(output_file)
+        signatures = pd.read_parquet(signature_file).set_index(KEY_COL)[SIGNATURE_COL]
+        # Signature MinHash lowongan lama diambil dari file terpisah (deskripsi sudah tidak ada)
+        if KEY_COL not in base.columns or not base[KEY_COL].isin(signatures.index).all():
+            base = None
+
+    if base is None:
+        reason = "manifest belum ada" if manifest is None else "taxonomy skill / hashing / artefak berubah"
+        print(f"🔁 Full rebuild ({reason})...")
+        manifest = None
+        # Pass pertama (kolom identitas saja) untuk menentukan rate sampel
+        with timer.stage('hash'):
+            keys = pd.unique(np.concatenate([
+                hash_rows(chunk[id_cols])
+                for chunk in pd.read_csv(input_file, usecols=id_cols, chunksize=args.read_chunk_size,
+                                         on_bad_lines='skip')
+            ]))
+        sample_rate = min(1.0, SAMPLE_SIZE / max(len(keys), 1))
+    else:
+        sample_rate = meta['sample_rate']
+        print(f"➕ Mode inkremental: {len(manifest):,} lowongan sudah ada di manifest")
+
+    # Stream CSV: hash tiap baris, simpan hanya baris baru/berubah yang masuk sampel
+    key_parts, content_parts, delta_parts = [], [], []
+    reader = pd.read_csv(input_file, usecols=read_cols, chunksize=args.read_chunk_size, on_bad_lines='skip')
+    while True:
+        with timer.stage('read'):
+            chunk = next(reader, None)
+        if chunk is None:
+            break
+        with timer.stage('hash', rows=len(chunk)):
+            keys, content = posting_hashes(chunk, id_cols, COLS_TO_READ)
+            todo = needs_scan(manifest, keys, content) & in_sample(keys, sample_rate)
+            key_parts.append(keys)
+            content_parts.append(content)
+            delta_parts.append(chunk[todo].assign(**{KEY_COL: keys[todo], '_content': content[todo]}))
+
+    new_manifest = pd.DataFrame({KEY_COL: np.concatenate(key_parts), 'content_hash': np.concatenate(content_parts)})
+    new_manifest = new_manifest.drop_duplicates(KEY_COL, keep='first').reset_index(drop=True)
+
+    # Key duplikat di CSV: yang dipakai versi pertama (sama dengan manifest)
+    delta = pd.concat(delta_parts, ignore_index=True).drop_duplicates(KEY_COL, keep='first')
+    first_content = new_manifest.set_index(KEY_COL)['content_hash']
+    delta = delta[delta['_content'].to_numpy() == first_content.reindex(delta[KEY_COL]).to_numpy()]
+    delta = delta.drop(columns=['_content'] + [c for c in id_cols if c not in COLS_TO_READ])
+    print(f"🔍 {len(delta):,} lowongan baru/berubah di sampel (rate {sample_rate:.4f}), di-scan skill-nya...")
+
+    delta = scan_rows(delta, timer, args.workers, args.chunk_size, cache).drop(columns=['description'])
+
+    with timer.stage('write', rows=len(delta)):
+        delta_lite, _ = add_skill_matrix(to_typed(delta), keep_strings=args.skill_strings)
+        if base is None:
+            lite_df, rollups = delta_lite, None
+        else:
+            # Buang versi lama lowongan yang berubah + lowongan yang sudah tidak ada di CSV
+            gone = ~base[KEY_COL].isin(new_manifest[KEY_COL])
+            stale = gone | base[KEY_COL].isin(delta_lite[KEY_COL])
+            if delta_lite.empty and not stale.any():
+                print("✅ Tidak ada lowongan baru/berubah, artefak tidak diubah")
+                return False
+            old_rows = base[stale]
+            kept = base[~stale].drop(columns=[CLUSTER_COL], errors='ignore')
+            kept[SIGNATURE_COL] = signatures.reindex(kept[KEY_COL]).values
+            lite_df = to_typed(pd.concat([kept, delta_lite], ignore_index=True))
+
+            rollups = read_rollups()
+            if rollups is not None:
+                rollups = merge_rollups(rollups, build_rollups(old_rows), sign=-1)
+                rollups = merge_rollups(rollups, build_rollups(delta_lite))
+            print(f"🧩 Merge: {len(delta_lite):,} masuk, {int(stale.sum()):,} versi lama/hilang dibuang")
+
+        # Cluster duplikat dihitung ulang atas semua baris (murah: signature sudah ada)
+        lite_df[[KEY_COL, SIGNATURE_COL]].to_parquet(signature_file, index=False)
+        lite_df = assign_clusters(lite_df)
+        write_artifacts(lite_df, skill_vocab(lite_df), rollups, arrow=args.arrow)
+        # Manifest ditulis terakhir: kalau run gagal di tengah, run berikutnya mengulang delta yang sama
+        write_manifest(new_manifest, {'taxonomy_version': TAXONOMY.version, 'match_rules': MATCH_RULES_VERSION,
+                                      'hash_version': HASH_VERSION, 'sample_rate': sample_rate,
+                                      'id_cols': id_cols})
+
+    if args.csv:
+        print("⚠️  --csv tidak didukung di mode --incremental (pakai mode biasa)")
+    return True
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Cleaning, sampling & ekstraksi skill dataset loker")
+    parser.add_argument('--workers', type=int, default=N_WORKERS,
+                        help="Jumlah proses untuk ekstraksi skill (default: 1 = serial)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                        help="Jumlah deskripsi per chunk untuk mode paralel")
+    parser.add_argument('--stream', action='store_true',
+                        help="Baca CSV per chunk + reservoir sampling (hemat memori untuk file besar)")
+    parser.add_argument('--read-chunk-size', type=int, default=READ_CHUNK_SIZE,
+                        help="Jumlah baris CSV per chunk untuk mode --stream")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Hanya proses lowongan baru/berubah (manifest hash), lalu merge ke artefak lama")
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f"Jangan pakai/tulis cache hasil match skill ('{skill_cache_file}')")
+    parser.add_argument('--csv', action='store_true',
+                        help=f"Simpan juga versi CSV lama ('{csv_output_file}')")
+    parser.add_argument('--arrow', action='store_true',
+                        help=f"Tulis juga '{arrow_output_file}' (Arrow IPC) untuk dashboard mode LOKER_MMAP=1")
+    parser.add_argument('--skill-strings', action='store_true',
+                        help="Tetap simpan kolom string 'required_skills' di Parquet (selain matriks skill)")
+    return parser.parse_args()
+
+
+def print_perf(report):
+    print(f"⏱️  Total {report['total_ms'] / 1000:,.2f} s · peak RSS {report['peak_rss_mb']} MB")
+    for stage in report['stages']:
+        rate = f" ({stage['rows_per_s']:,.0f} baris/s)" if stage.get('rows_per_s') else ""
+        print(f"   - {stage['stage']:<8} {stage['ms'] / 1000:>8.2f} s{rate}")
+
+
+def read_and_extract(args, timer, cache=None):
+    """Mode biasa / --stream: baca CSV, ambil sampel, ekstrak skill."""
+    if args.stream:
+        # Mode streaming: baca -> sampling -> ekstrak skill per chunk
+        print(f"🌊 Mode streaming (chunk {args.read_chunk_size:,} baris, reservoir {SAMPLE_SIZE:,})...")
+        return stream_sample(input_file, read_chunk_size=args.read_chunk_size,
+                             workers=args.workers, chunk_size=args.chunk_size, timer=timer, cache=cache)
 
-try:
     # 1. Baca data
-    cols_to_read = [
-        'title', 'company_name', 'location', 'via', 'schedule_type', 
-        'work_from_home', 'date_time', 'salary_yearly', 'description' 
-    ]
-    
-    df = pd.read_csv(input_file, usecols=lambda c: c in cols_to_read)
-    
+    with timer.stage('read'):
+        df = pd.read_csv(input_file, usecols=lambda c: c in COLS_TO_READ)
+    timer.stages['read']['rows'] = len(df)
+
     # 2. Ambil Sampel
-    if len(df) > 50000:
-        df = df.sample(n=50000, random_state=42)
-
-    print("🔍 Sedang mengekstrak skill (Mode Akurat - Regex)...")
-
-    # 3. Fungsi deteksi skill YANG SUDAH DIPERBAIKI
-    def detect_skills(text):
-        if not isinstance(text, str):
-            return ""
-        text = text.lower()
-        found_skills = []
-        
-        for skill in SKILL_KEYWORDS:
-            # \b artinya "Word Boundary" (batas kata)
-            # Jadi dia mencari kata yang berdiri sendiri
-            # \b(r)\b akan match " r " tapi TIDAK match "your"
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            
-            if re.search(pattern, text):
-                found_skills.append(skill)
-                
-        return ", ".join(found_skills)
-
-    # Terapkan fungsi
-    df['required_skills'] = df['description'].apply(detect_skills)
-
-    # 4. HAPUS kolom description
+    with timer.stage('sample', rows=len(df)):
+        if len(df) > SAMPLE_SIZE:
+            df = df.sample(n=SAMPLE_SIZE, random_state=RANDOM_STATE)
+
+    print(f"🔍 Sedang mengekstrak skill (Mode Akurat - Regex, {args.workers} worker)...")
+
+    # 3. Deteksi skill + signature MinHash untuk deteksi duplikat (paralel per chunk
+    #    kalau --workers > 1), lalu HAPUS kolom description
+    df = scan_rows(df, timer, args.workers, args.chunk_size, cache)
     df.drop(columns=['description'], inplace=True)
+    return df
+
+
+def main():
+    args = parse_args()
+    perf = StageTimer('etl')
+
+    print("⏳ Sedang membaca data asli...")
+
+    try:
+        updated = True
+        cache = None if args.no_cache else MatchCache(skill_cache_file)
+        if args.incremental:
+            updated = run_incremental(args, perf, cache)
+        else:
+            df = read_and_extract(args, perf, cache)
+
+            with perf.stage('write', rows=len(df)):
+                # 5. Simpan hasil (Parquet bertipe, kolom kategori jadi dictionary,
+                #    skill jadi matriks uint8 + tabel kosakata), cube & rollup tren
+                df = assign_clusters(to_typed(df))
+                lite_df, vocab = add_skill_matrix(df, keep_strings=args.skill_strings)
+                write_artifacts(lite_df, vocab, arrow=args.arrow)
+
+                if args.csv:
+                    # Format lama: skill tetap sebagai string "python, sql, excel"
+                    df.to_csv(csv_output_file, index=False)
+                    print(f"📄 Versi CSV juga disimpan: '{csv_output_file}'")
+
+        if cache is not None:
+            stats = cache.stats
+            print(f"🗃️  Cache skill (taxonomy v{TAXONOMY.version}): {stats['hit']:,} deskripsi dari cache, "
+                  f"{stats['partial']:,} hanya pola baru, {stats['new']:,} di-scan penuh")
+            if cache.save():
+                print(f"   💾 {len(cache):,} deskripsi tersimpan di '{skill_cache_file}'")
+
+        if updated:
+            size_mb = os.path.getsize(output_file) / (1024 * 1024)
+            print(f"✅ Berhasil! Dataset '{output_file}' diperbarui.")
+            print(f"📉 Ukuran file: {size_mb:.2f} MB")
+
+        # Ringkasan per tahap + 1 baris JSON terstruktur (stderr) untuk log produksi
+        mode = 'incremental' if args.incremental else 'stream' if args.stream else 'full'
+        print_perf(perf.log(mode=mode, workers=args.workers))
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        # Exit code != 0 supaya pemanggil (benchmark, load test, cron) tahu ETL gagal
+        sys.exit(1)
 
-    # 5. Simpan hasil
-    df.to_csv(output_file, index=False)
-    
-    size_mb = os.path.getsize(output_file) / (1024 * 1024)
-    print(f"✅ Berhasil! Dataset '{output_file}' diperbarui.")
-    print(f"📉 Ukuran file: {size_mb:.2f} MB")
 
-except Exception as e:
-    print(f"❌ Error: {e}")
\ No newline at end of file
+if __name__ == '__main__':
+    main()
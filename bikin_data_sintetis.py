@@ -0,0 +1,193 @@
+import argparse
+import os
+import numpy as np
+import pandas as pd
+
+# Generator dataset sintetis berbentuk gsearch_jobs.csv (untuk benchmark & uji lokal).
+# Dataset asli (Kaggle) tidak ada di repo, jadi angka performa dibuat dari data
+# sintetis yang di-seed: hasilnya selalu sama untuk seed & jumlah baris yang sama.
+
+output_file = 'gsearch_jobs.csv'
+DEFAULT_ROWS = 100_000
+CHUNK_ROWS = 50_000
+
+# Perkiraan frekuensi skill (porsi lowongan yang menyebut skill tsb)
+SKILL_FREQ = {
+    'sql': 0.52, 'excel': 0.40, 'communication': 0.35, 'python': 0.30, 'tableau': 0.28,
+    'power bi': 0.23, 'presentation': 0.20, 'r': 0.17, 'spreadsheet': 0.10, 'sas': 0.08,
+    'agile': 0.08, 'machine learning': 0.07, 'aws': 0.06, 'azure': 0.06, 'sql server': 0.06,
+    'looker': 0.05, 'oracle': 0.05, 'leadership': 0.05, 'snowflake': 0.04, 'spark': 0.04,
+    'vba': 0.04, 'alteryx': 0.03, 'java': 0.03, 'mysql': 0.03, 'pandas': 0.03, 'qlik': 0.03,
+    'redshift': 0.03, 'google cloud': 0.02, 'gcp': 0.02, 'bigquery': 0.02, 'hadoop': 0.02,
+    'databricks': 0.02, 'javascript': 0.02, 'numpy': 0.02, 'scrum': 0.02, 'postgresql': 0.02,
+    'c++': 0.01, 'scala': 0.01, 'tensorflow': 0.01, 'pytorch': 0.01, 'scikit-learn': 0.01,
+    'deep learning': 0.01, 'nlp': 0.01, 'matlab': 0.01, 'mongodb': 0.01, 'nosql': 0.01,
+    'html': 0.01, 'css': 0.005, 'julia': 0.002, 'kafka': 0.005, 'cassandra': 0.002,
+    'redis': 0.002, 'google data studio': 0.01,
+}
+# Cara penulisan skill di deskripsi (variasi huruf besar/kecil)
+SKILL_SPELLING = {
+    'sql': 'SQL', 'excel': 'Excel', 'python': 'Python', 'tableau': 'Tableau', 'power bi': 'Power BI',
+    'r': 'R', 'sas': 'SAS', 'aws': 'AWS', 'azure': 'Azure', 'sql server': 'SQL Server',
+    'looker': 'Looker', 'snowflake': 'Snowflake', 'spark': 'Spark', 'vba': 'VBA', 'gcp': 'GCP',
+    'google cloud': 'Google Cloud', 'bigquery': 'BigQuery', 'c++': 'C++', 'nlp': 'NLP',
+    'html': 'HTML', 'css': 'CSS', 'google data studio': 'Google Data Studio',
+}
+
+PLATFORMS = {
+    'via LinkedIn': 0.32, 'via Upwork': 0.12, 'via BeBee': 0.09, 'via Trabajo.org': 0.08,
+    'via ZipRecruiter': 0.07, 'via Indeed': 0.06, 'via Snagajob': 0.05, 'via Adzuna': 0.04,
+    'via Jobs Trabajo': 0.04, 'via Talent.com': 0.03, 'via Monster': 0.03, 'via Dice': 0.03,
+    'via Built In': 0.02, 'via Glassdoor': 0.02,
+}
+SCHEDULES = {'Full-time': 0.70, 'Contractor': 0.20, 'Part-time': 0.05, 'Internship': 0.02, None: 0.03}
+LOCATIONS = {
+    'Anywhere': 0.45, 'United States': 0.20, 'Kansas City, MO': 0.05, 'Oklahoma City, OK': 0.04,
+    'Jefferson City, MO': 0.03, 'Wichita, KS': 0.03, 'Topeka, KS': 0.02, 'Tulsa, OK': 0.02,
+    'Bentonville, AR': 0.02, 'Little Rock, AR': 0.02, 'Springfield, MO': 0.02, 'Lawrence, KS': 0.02,
+    'Overland Park, KS': 0.02, 'Columbia, MO': 0.02, 'Omaha, NE': 0.02, 'New York, NY': 0.02,
+}
+TITLES = [
+    'Data Analyst', 'Senior Data Analyst', 'Business Intelligence Analyst', 'Data Analyst II',
+    'Junior Data Analyst', 'Business Analyst', 'Marketing Data Analyst', 'Financial Data Analyst',
+    'Healthcare Data Analyst', 'Data Scientist', 'Sr. Data Analyst', 'Lead Data Analyst',
+    'Data Analyst (Remote)', 'Product Analyst', 'Data Reporting Analyst', 'Operations Analyst',
+    'BI Developer', 'Data Engineer', 'Analytics Engineer', 'Research Analyst',
+]
+INTRO = [
+    "We are looking for a {title} to join our growing team.",
+    "{company} is hiring a {title} to turn data into insights.",
+    "As a {title} you will partner with stakeholders across the business.",
+    "Join {company} as a {title} and help us build a data-driven culture.",
+]
+FILLER = [
+    "You will build dashboards and reports for leadership.",
+    "Work with cross-functional teams to define metrics and KPIs.",
+    "Clean, transform and validate large datasets from multiple sources.",
+    "Present findings and recommendations to non-technical audiences.",
+    "Identify trends and opportunities to improve business performance.",
+    "Maintain documentation for data pipelines and reporting processes.",
+    "Support ad-hoc analysis requests from your business partners.",
+    "Ensure data quality and integrity across our systems.",
+    "We offer competitive pay, health insurance and a 401(k) plan.",
+    "This role reports to the Director of Analytics.",
+]
+REQUIRE = [
+    "Experience with {skills} is required.",
+    "Strong skills in {skills}.",
+    "Proficiency in {skills} preferred.",
+    "Hands-on knowledge of {skills}.",
+]
+
+
+def parse_rows(text):
+    """'10k' -> 10000, '5M' -> 5000000, '250000' -> 250000."""
+    text = str(text).strip().lower().replace('_', '')
+    scale = {'k': 1_000, 'm': 1_000_000}.get(text[-1:], 1)
+    return int(float(text[:-1] if scale != 1 else text) * scale)
+
+
+def _choice(rng, weights, size):
+    keys = list(weights)
+    p = np.array(list(weights.values()), dtype=float)
+    idx = rng.choice(len(keys), size=size, p=p / p.sum())
+    return [keys[i] for i in idx]
+
+
+def _description(rng, title, company, skills):
+    parts = [INTRO[rng.integers(len(INTRO))].format(title=title, company=company)]
+    parts += [FILLER[i] for i in rng.integers(len(FILLER), size=rng.integers(6, 20))]
+    if skills:
+        named = [SKILL_SPELLING.get(s, s) for s in skills]
+        joined = named[0] if len(named) == 1 else ", ".join(named[:-1]) + " and " + named[-1]
+        parts.insert(rng.integers(1, len(parts) + 1), REQUIRE[rng.integers(len(REQUIRE))].format(skills=joined))
+    return " ".join(parts)
+
+
+def generate_chunk(rng, start, n, n_companies):
+    """Buat `n` baris sintetis (mulai dari nomor baris `start`)."""
+    skill_names = list(SKILL_FREQ)
+    skill_p = np.array(list(SKILL_FREQ.values()))
+    has_skill = rng.random((n, len(skill_names))) < skill_p
+
+    titles = [TITLES[i] for i in rng.zipf(1.6, size=n) % len(TITLES)]
+    company_ids = rng.zipf(1.3, size=n) % n_companies
+    companies = [f"Company {i:05d}" for i in company_ids]
+    locations = _choice(rng, LOCATIONS, n)
+
+    salary = np.round(rng.lognormal(mean=np.log(95_000), sigma=0.35, size=n), -2)
+    salary[rng.random(n) > 0.17] = np.nan  # sebagian besar lowongan tanpa info gaji
+
+    dates = pd.Timestamp('2022-11-04') + pd.to_timedelta(rng.integers(0, 365 * 24 * 3600, size=n), unit='s')
+
+    descriptions = [
+        _description(rng, titles[i], companies[i], [skill_names[j] for j in np.flatnonzero(has_skill[i])])
+        for i in range(n)
+    ]
+    wfh = np.where(np.array(locations) == 'Anywhere', True, None)
+
+    return pd.DataFrame({
+        'index': np.arange(start, start + n),
+        'title': titles,
+        'company_name': companies,
+        'location': locations,
+        'via': _choice(rng, PLATFORMS, n),
+        'description': descriptions,
+        'job_id': [f"job-{rng.integers(1 << 62):016x}" for _ in range(n)],
+        'schedule_type': _choice(rng, SCHEDULES, n),
+        'work_from_home': wfh,
+        'date_time': dates.strftime('%Y-%m-%d %H:%M:%S.%f'),
+        'salary_yearly': salary,
+        'search_term': 'data analyst',
+    })
+
+
+def generate(path, rows, seed=42, chunk_rows=CHUNK_ROWS, repost_rate=0.08):
+    """Tulis `rows` baris ke `path` per chunk (memori tetap kecil walau jutaan baris).
+
+    Sekitar `repost_rate` lowongan diposting ulang lewat platform lain
+    (judul, perusahaan & deskripsi sama), seperti di data asli.
+    """
+    rng = np.random.default_rng(seed)
+    n_companies = max(100, rows // 20)
+    written = 0
+
+    if os.path.exists(path):
+        os.remove(path)
+
+    while written < rows:
+        n = min(chunk_rows, rows - written)
+        chunk = generate_chunk(rng, written, n, n_companies)
+
+        # Posting ulang: salin sebagian baris lalu ganti platform & job_id
+        reposts = np.flatnonzero(rng.random(n) < repost_rate)
+        if len(reposts) > 1:
+            src = rng.choice(n, size=len(reposts))
+            for col in ['title', 'company_name', 'location', 'description', 'schedule_type', 'work_from_home', 'salary_yearly']:
+                chunk.loc[reposts, col] = chunk.loc[src, col].values
+            chunk.loc[reposts, 'via'] = _choice(rng, PLATFORMS, len(reposts))
+
+        chunk.to_csv(path, mode='a', header=(written == 0), index=False)
+        written += n
+        print(f"   ✍️  {written:,} / {rows:,} baris")
+
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generator dataset sintetis gsearch_jobs.csv")
+    parser.add_argument('--rows', type=parse_rows, default=DEFAULT_ROWS,
+                        help="Jumlah baris, boleh pakai k/M (contoh: 10k, 1M, 5M)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=output_file)
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    args = parser.parse_args()
+
+    print(f"🧪 Membuat {args.rows:,} lowongan sintetis (seed={args.seed})...")
+    generate(args.output, args.rows, seed=args.seed, chunk_rows=args.chunk_rows)
+    size_mb = os.path.getsize(args.output) / (1024 * 1024)
+    print(f"✅ Selesai: '{args.output}' ({size_mb:.2f} MB)")
+
+
+if __name__ == '__main__':
+    main()
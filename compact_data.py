@@ -0,0 +1,54 @@
+import pandas as pd
+
+# Representasi ringkas dataset dashboard di memori.
+# Kolom string low-cardinality -> category, angka -> tipe sekecil mungkin
+# (tanpa kehilangan nilai), sisa kolom teks -> string Arrow kalau tersedia.
+
+
+def _arrow_string_dtype():
+    try:
+        import pyarrow  # noqa: F401
+        return 'string[pyarrow]'
+    except ImportError:
+        return None
+
+
+def compact_frame(df, max_category_ratio=0.5):
+    """Kembalikan salinan `df` dengan tipe kolom yang hemat memori."""
+    out = {}
+    string_dtype = _arrow_string_dtype()
+
+    for col in df.columns:
+        s = df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(s):
+            out[col] = s
+        elif pd.api.types.is_integer_dtype(s):
+            kind = 'unsigned' if len(s) and s.min() >= 0 else 'integer'
+            out[col] = pd.to_numeric(s, downcast=kind)
+        elif pd.api.types.is_float_dtype(s):
+            small = s.astype('float32')
+            # Hanya turun ke float32 kalau semua nilai tetap sama persis
+            out[col] = small if ((small == s) | s.isna()).all() else s
+        elif pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s):
+            if len(s) and s.nunique(dropna=True) / len(s) <= max_category_ratio:
+                out[col] = s.astype('category')
+            elif string_dtype is not None:
+                out[col] = s.astype(string_dtype)
+            else:
+                out[col] = s
+        else:
+            out[col] = s
+
+    return pd.DataFrame(out, index=df.index)
+
+
+def memory_report(df):
+    """Pemakaian memori per kolom (bytes, deep) + baris TOTAL."""
+    usage = df.memory_usage(deep=True, index=True)
+    report = pd.DataFrame({
+        'kolom': usage.index.astype(str),
+        'dtype': [str(df[c].dtype) if c in df.columns else '-' for c in usage.index],
+        'bytes': usage.values,
+    })
+    total = pd.DataFrame({'kolom': ['TOTAL'], 'dtype': [''], 'bytes': [int(usage.sum())]})
+    return pd.concat([report, total], ignore_index=True)
@@ -1,7 +1,26 @@
+import os
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-from collections import Counter
+from skill_matcher import SKILL_PREFIX, skill_columns
+from overview_cube import build_cube, query_cube, overview_from_rows
+from title_index import TitleIndex
+from filter_pipeline import FilterPipeline
+from compact_data import compact_frame, memory_report
+from data_lite import DATA_CSV, DATA_PARQUET, read_lite_data
+from mmap_data import DATA_ARROW, read_mmap_data
+from data_refresh import DatasetRefresher
+from perf_timer import StageTimer
+from salary_stats import QUANTILES, valid_salaries, salary_summary, salary_histogram
+from data_explorer import (EXPORT_MAX_ROWS, get_page, export_csv, export_parquet, export_csv_frames,
+                           export_parquet_frames)
+from query_backend import open_backend
+from sketches import SKETCH_FILE, build_sketches, query_sketches, read_sketches
+from rollups import GRAINS, ROLLUP_FILES, build_rollups, read_rollups, query_trend
+from skill_insights import MIN_SALARY_POSTINGS, SkillInsights
+
+# Timer per tahap untuk rerun ini (lihat panel "⏱️ Performance" & log JSON)
+perf = StageTimer('dashboard_rerun')
 
 # --- 1. SETUP HALAMAN ---
 st.set_page_config(
@@ -76,25 +95,107 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # --- 2. LOAD DATA ---
-@st.cache_data
-def load_data():
-    try:
-        df = pd.read_csv('gsearch_jobs_lite.csv')
-        if 'date_time' in df.columns:
-            df['date_time'] = pd.to_datetime(df['date_time'], errors='coerce')
-        if 'required_skills' in df.columns:
-            df['required_skills'] = df['required_skills'].fillna("")
-        if 'work_from_home' in df.columns:
-            df['work_from_home'] = df['work_from_home'].fillna(False)
-        return df
-    except Exception as e:
-        st.error(f"Gagal load data: {e}")
-        return pd.DataFrame()
-
-df = load_data()
-
-if df.empty:
-    st.warning("Dataframe kosong. Cek file CSV Anda.")
+CUBE_FILE = 'gsearch_jobs_cube.parquet'          # Cube agregat Overview (hasil ETL)
+CUBE_TOP_FILE = 'gsearch_jobs_cube_top.parquet'
+COMPACT_LOAD = True  # category + downcast + string Arrow (hemat RAM, lihat compact_data.py)
+PAGE_SIZES = [25, 50, 100, 500]  # Pilihan baris per halaman di tab Raw Data
+# Backend query opsional: None = pandas di memori (default),
+# 'duckdb' / 'sqlite' = filter & agregasi di-push-down ke engine SQL embedded
+# (dataset tidak dimuat ke RAM, lihat query_backend.py). Bisa diset lewat env LOKER_BACKEND.
+QUERY_BACKEND = os.environ.get('LOKER_BACKEND') or None
+# LOKER_MMAP=1: dataset dibaca dari file Arrow hasil `bikin_data_lite.py --arrow` lewat
+# memory-map read-only. Beberapa proses server berbagi halaman data yang sama di page
+# cache OS (RAM tidak bertambah per worker) dan start worker tanpa decode (lihat mmap_data.py).
+MMAP_LOAD = os.environ.get('LOKER_MMAP') == '1'
+# Panel Performance di sidebar bersifat opt-in: buka dashboard dengan ?perf=1
+SHOW_PERF_PANEL = st.query_params.get('perf') == '1'
+# Refresher latar: artefak ETL dicek tiap sekian detik, snapshot baru dibangun di
+# belakang lalu ditukar (lihat data_refresh.py). 0 = matikan (data tetap sampai restart).
+REFRESH_INTERVAL_S = float(os.environ.get('LOKER_REFRESH_S', 30))
+DATA_ARTIFACTS = [DATA_ARROW if MMAP_LOAD else DATA_PARQUET, DATA_CSV, CUBE_FILE, CUBE_TOP_FILE,
+                  SKETCH_FILE, *ROLLUP_FILES.values()]
+
+def _read_data():
+    if MMAP_LOAD:
+        # File mmap sudah dipadatkan saat ETL; compact_frame di sini justru akan menyalin kolom
+        return read_mmap_data()
+    # Parquet bertipe, fallback ke CSV lama (lihat data_lite.py)
+    df = read_lite_data()
+    return compact_frame(df) if COMPACT_LOAD and not df.empty else df
+
+def _build_snapshot():
+    # Dataset + semua struktur turunan dibangun di sini (thread latar saat refresh),
+    # jadi sesi tidak pernah menunggu load/index/cube setelah data diganti
+    if QUERY_BACKEND:
+        # Satu koneksi engine (+ LRU hasil query) dipakai bersama semua sesi. Engine
+        # membaca salinan artefak milik snapshot ini, jadi sesi yang masih memegang
+        # snapshot lama tidak ikut melihat data baru setelah ETL menulis ulang file
+        return {'df': None, 'backend': open_backend(QUERY_BACKEND, snapshot=True), 'cube': None, 'sketches': None,
+                'rollups': read_rollups(), 'pipeline': None, 'skill_insights': None, 'memory': None}
+
+    df = _read_data()
+    if df.empty:
+        return {'df': df, 'backend': None, 'cube': None, 'sketches': None, 'rollups': None, 'pipeline': None,
+                'skill_insights': None, 'memory': None}
+
+    # Cube, sketch & rollup dari ETL; kalau belum ada (mis. masih pakai CSV lama), bangun dari dataset
+    if os.path.exists(CUBE_FILE) and os.path.exists(CUBE_TOP_FILE):
+        cube = pd.read_parquet(CUBE_FILE), pd.read_parquet(CUBE_TOP_FILE)
+    else:
+        cube = build_cube(df)
+    sketches = read_sketches()
+    if sketches is None:
+        sketches = build_sketches(df)
+    rollups = read_rollups()
+    if rollups is None:
+        rollups = build_rollups(df)
+
+    # Index trigram judul + satu pipeline filter (mask + LRU) untuk semua sesi,
+    # dipanaskan dengan filter default sidebar supaya rerun pertama langsung kena cache
+    pipeline = FilterPipeline(df, TitleIndex(df['title']))
+    if 'via' in df.columns:
+        pipeline.select("", list(df['schedule_type'].unique()),
+                        df['via'].value_counts().head(10).index.tolist()[:3], None)
+    # Matriks sparse baris x skill untuk co-occurrence & premium gaji (tab Skill)
+    skill_cols = skill_columns(df)
+    insights = SkillInsights(df, skill_cols) if skill_cols else None
+    # Laporan memori (memory_usage deep = scan semua string) cukup sekali per snapshot
+    return {'df': df, 'backend': None, 'cube': cube, 'sketches': sketches, 'rollups': rollups,
+            'pipeline': pipeline, 'skill_insights': insights, 'memory': memory_report(df)}
+
+# cache_resource: SATU refresher (double buffer snapshot) per proses server,
+# dipakai bersama semua sesi (cache_data memberi tiap sesi salinan hasil pickle)
+@st.cache_resource
+def load_refresher():
+    return DatasetRefresher(_build_snapshot, DATA_ARTIFACTS, interval=REFRESH_INTERVAL_S).start()
+
+perf.lap('setup')
+refresher = load_refresher()
+try:
+    latest = refresher.current()
+except Exception as e:
+    st.error(f"Gagal load data ({QUERY_BACKEND or 'pandas'}): {e}")
+    st.stop()
+
+# Sesi memegang snapshot-nya sendiri: data tidak berganti di tengah eksplorasi,
+# snapshot baru dipakai kalau user memilih (atau saat sesi baru dibuka)
+snapshot = st.session_state.setdefault('data_snapshot', latest)
+if snapshot is not latest:
+    with st.sidebar:
+        st.info(f"📦 Data baru tersedia (versi {latest.version}).")
+        if st.button("🔄 Muat data terbaru"):
+            st.session_state['data_snapshot'] = latest
+            st.rerun()
+
+backend, df = snapshot['backend'], snapshot['df']
+if backend:
+    data_columns, n_rows = backend.columns, backend.n_rows
+else:
+    data_columns, n_rows = list(df.columns), len(df)
+perf.lap('load_data', n_rows)
+
+if n_rows == 0:
+    st.warning("Dataframe kosong. Cek file data (Parquet/CSV) Anda.")
     st.stop()
 
 # --- 3. SIDEBAR ---
@@ -102,10 +203,11 @@ with st.sidebar:
     st.header("🎛️ Filter Menu")
     search = st.text_input("🔍 Cari Posisi", placeholder="Ex: Data Analyst")
     
-    tipe_kerja = st.multiselect("⏳ Tipe Jadwal:", options=df['schedule_type'].unique(), default=df['schedule_type'].unique())
+    jadwal_options = backend.schedule_options() if backend else list(df['schedule_type'].unique())
+    tipe_kerja = st.multiselect("⏳ Tipe Jadwal:", options=jadwal_options, default=jadwal_options)
     
-    if 'via' in df.columns:
-        platform_options = df['via'].value_counts().head(10).index.tolist()
+    if 'via' in data_columns:
+        platform_options = backend.platform_options(10) if backend else df['via'].value_counts().head(10).index.tolist()
         pilih_platform = st.multiselect("🌐 Platform:", options=platform_options, default=platform_options[:3])
     else:
         pilih_platform = []
@@ -113,18 +215,32 @@ with st.sidebar:
     wfh_option = st.radio("🏠 Mode Kerja:", ["Semua", "Remote Only", "On-site Only"])
     st.markdown("---")
 
+    with st.expander("💾 Memori Dataset"):
+        loaded_at = pd.Timestamp(snapshot.loaded_at, unit='s').strftime('%Y-%m-%d %H:%M:%S')
+        st.caption(f"Snapshot data {snapshot.version} · dimuat {loaded_at} UTC ({snapshot.build_s:,.1f} s)")
+        if backend:
+            st.caption(f"Backend {backend.engine}: {n_rows:,} baris dibaca dari '{backend.path}' (tidak dimuat ke RAM)")
+        else:
+            mem = snapshot['memory']
+            st.caption(f"Total: {mem['bytes'].iloc[-1] / (1024 * 1024):,.2f} MB (dipakai bersama semua sesi)")
+            st.dataframe(mem, hide_index=True, use_container_width=True)
+
+perf.lap('sidebar')
+
 # --- 4. LOGIKA FILTERING ---
-filtered_df = df.copy()
-
-if search:
-    filtered_df = filtered_df[filtered_df['title'].str.contains(search, case=False, na=False)]
-filtered_df = filtered_df[filtered_df['schedule_type'].isin(tipe_kerja)]
-if pilih_platform and 'via' in df.columns:
-    filtered_df = filtered_df[filtered_df['via'].isin(pilih_platform)]
-if wfh_option == "Remote Only":
-    filtered_df = filtered_df[filtered_df['work_from_home'] == True]
-elif wfh_option == "On-site Only":
-    filtered_df = filtered_df[filtered_df['work_from_home'] != True]
+remote_filter = {"Remote Only": True, "On-site Only": False}.get(wfh_option)
+
+filter_args = (search, tipe_kerja, pilih_platform if 'via' in data_columns else [], remote_filter)
+if backend:
+    # Hanya klausa WHERE; tiap tab menjalankan agregasinya sendiri di engine
+    where = backend.where(*filter_args)
+    filtered_df = filtered_rows = None
+    n_filtered = backend.count(where)
+else:
+    # Posisi baris hasil filter (None = semua baris) ikut disimpan untuk tab Skill
+    filtered_df, filtered_rows = snapshot['pipeline'].select_rows(*filter_args)
+    n_filtered = len(filtered_df)
+perf.lap('filter', n_rows)
 
 # --- 5. DASHBOARD HEADER ---
 st.title("🚀 Dashboard Pasar Kerja & Analisis Gaji")
@@ -137,7 +253,7 @@ st.markdown(f"""
     border-left: 5px solid #0077b6; 
     border-radius: 5px; 
     margin-bottom: 25px;">
-    <span style="font-size:16px; color: var(--text-color);">📊 <strong>Status Data:</strong> Menampilkan <b>{len(filtered_df):,}</b> lowongan pekerjaan hasil filter.</span>
+    <span style="font-size:16px; color: var(--text-color);">📊 <strong>Status Data:</strong> Menampilkan <b>{n_filtered:,}</b> lowongan pekerjaan hasil filter.</span>
 </div>
 """, unsafe_allow_html=True)
 
@@ -149,20 +265,46 @@ with tab1:
     st.markdown("### 📈 Key Performance Indicators")
     
     c1, c2, c3, c4 = st.columns(4)
-    c1.metric("Total Lowongan", f"{len(filtered_df):,}")
+
+    if backend:
+        overview = backend.overview(where)
+    else:
+        cube_cells, cube_top = snapshot['cube']
+        if not search and cube_cells is not None and snapshot['sketches'] is not None:
+            # Tanpa pencarian judul -> cukup jumlahkan sel cube (tidak scan baris)
+            overview = query_cube(cube_cells, cube_top, tipe_kerja, pilih_platform, remote=remote_filter)
+            # Yang tidak ada di cube (perusahaan/lokasi unik, kuantil gaji) diambil dari merge
+            # sketch partisi (HLL, t-digest): biaya tetap berapa pun jumlah baris, galat lihat
+            # sketches.py. Nilai exact dari cube (total, rata-rata, top-N) tidak ditimpa.
+            sketched = query_sketches(snapshot['sketches'], tipe_kerja, pilih_platform, remote_filter, QUANTILES)
+            for key, value in sketched.items():
+                overview.setdefault(key, value)
+            overview['approx'] = True
+        else:
+            overview = overview_from_rows(filtered_df)
+    perf.lap('overview_agg', n_filtered)
+
+    c1.metric("Total Lowongan", f"{overview['total']:,}")
     
-    if 'salary_yearly' in filtered_df.columns:
-        gaji_valid = filtered_df[filtered_df['salary_yearly'] > 0]
-        avg_gaji = gaji_valid['salary_yearly'].mean() if not gaji_valid.empty else 0
-        c2.metric("Rata-rata Gaji", f"${avg_gaji:,.0f}")
+    if 'salary_yearly' in data_columns:
+        c2.metric("Rata-rata Gaji", f"${overview['avg_salary']:,.0f}")
     else:
         c2.metric("Rata-rata Gaji", "N/A")
     
-    platform_top = filtered_df['via'].mode()[0] if not filtered_df.empty and 'via' in filtered_df.columns else "-"
-    c3.metric("Platform Terbanyak", platform_top)
-    
-    comp_unique = filtered_df['company_name'].nunique() if 'company_name' in filtered_df.columns else 0
-    c4.metric("Perusahaan Unik", f"{comp_unique:,}")
+    c3.metric("Platform Terbanyak", overview['platform_top'])
+    approx = "≈" if overview.get('approx') else ""
+    c4.metric("Perusahaan Unik", f"{approx}{overview.get('comp_unique', 0):,}",
+              help="Perkiraan HyperLogLog (galat ±2,4%)" if approx else None)
+
+    ringkas_kpi = [f"{approx}{overview.get('loc_unique', 0):,} lokasi unik"]
+    if overview.get('job_unique') is not None:
+        # Lowongan sama yang diposting di beberapa platform dihitung sekali (cluster MinHash, lihat dedup.py)
+        ringkas_kpi.insert(0, f"{approx}{overview['job_unique']:,} lowongan unik (duplikat lintas platform digabung)")
+    if overview.get('salary_quantiles'):
+        q = overview['salary_quantiles']
+        ringkas_kpi.insert(0, f"Median gaji {approx}${q['Median']:,.0f} (P25 ${q['P25']:,.0f} – P75 ${q['P75']:,.0f}, "
+                              f"P90 ${q['P90']:,.0f})")
+    st.caption(" · ".join(ringkas_kpi))
 
     st.markdown("<br>", unsafe_allow_html=True)
 
@@ -172,8 +314,8 @@ with tab1:
     # Chart Lokasi
     with col_l:
         st.subheader("📍 Persebaran Lokasi")
-        if 'location' in filtered_df.columns:
-            top_loc = filtered_df['location'].value_counts().head(10).reset_index()
+        if 'location' in overview:
+            top_loc = overview['location'].reset_index()
             top_loc.columns = ['Lokasi', 'Jumlah']
             
             fig_loc = px.bar(top_loc, x='Jumlah', y='Lokasi', orientation='h', 
@@ -192,8 +334,8 @@ with tab1:
     # Chart Perusahaan
     with col_r:
         st.subheader("🏢 Top Perusahaan")
-        if 'company_name' in filtered_df.columns:
-            top_comp = filtered_df['company_name'].value_counts().head(10).reset_index()
+        if 'company_name' in overview:
+            top_comp = overview['company_name'].reset_index()
             top_comp.columns = ['Perusahaan', 'Jumlah']
             
             fig_comp = px.bar(top_comp, x='Jumlah', y='Perusahaan', orientation='h',
@@ -207,16 +349,58 @@ with tab1:
                 height=400
             )
             st.plotly_chart(fig_comp, use_container_width=True)
+    perf.lap('overview_charts')
+
+    # Chart tren dibaca dari rollup (biaya ~ jumlah bucket, bukan jumlah baris)
+    st.subheader("📈 Tren Lowongan")
+    rollups = snapshot['rollups']
+    if rollups is None:
+        st.info("Rollup tren belum tersedia. Jalankan ulang bikin_data_lite.py.")
+    else:
+        col_grain, col_metric = st.columns([1, 3])
+        with col_grain:
+            grain_label = st.radio("Periode:", list(GRAINS.values())[::-1], horizontal=True)
+        with col_metric:
+            metrik = st.radio("Metrik:", ["Jumlah Lowongan", "Median Gaji", "Porsi Remote", "Top 5 Skill"], horizontal=True)
+        grain = {label: key for key, label in GRAINS.items()}[grain_label]
+        trend, trend_skills = query_trend(rollups, grain, tipe_kerja, pilih_platform, remote=remote_filter)
+        perf.lap('trend_agg')
+
+        if metrik == "Top 5 Skill":
+            fig_trend = px.line(trend_skills, x='bucket', y='count', color='skill',
+                                labels={'bucket': '', 'count': 'Jumlah Lowongan', 'skill': 'Skill'})
+        else:
+            y_col = {"Jumlah Lowongan": 'count', "Median Gaji": 'median_salary', "Porsi Remote": 'remote_share'}[metrik]
+            fig_trend = px.line(trend, x='bucket', y=y_col, labels={'bucket': '', y_col: metrik},
+                                color_discrete_sequence=['#00A8E8'])
+        fig_trend.update_layout(
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            height=350
+        )
+        st.plotly_chart(fig_trend, use_container_width=True)
+        if search:
+            st.caption("Catatan: pencarian judul tidak diterapkan pada tren (rollup per jadwal, platform & mode kerja).")
+    perf.lap('trend_chart')
 
 # === TAB 2: SKILL ===
 with tab2:
     st.subheader("🔥 Skill Paling Banyak Dicari")
-    if 'required_skills' in filtered_df.columns:
-        all_skills = filtered_df['required_skills'].str.split(', ').explode().tolist()
-        all_skills = [s for s in all_skills if s]
+    skill_cols = backend.skill_cols if backend else skill_columns(filtered_df)
+    if skill_cols:
+        if backend:
+            totals = backend.skill_totals(where, top_n=15)
+        else:
+            # Jumlah per skill = sum kolom matriks (vektor), tanpa explode/Counter
+            totals = filtered_df[skill_cols].sum()
+            totals = totals[totals > 0].sort_values(ascending=False, kind='stable').head(15)
+        perf.lap('skill_agg', n_filtered)
         
-        if all_skills:
-            skill_counts = pd.DataFrame(Counter(all_skills).most_common(15), columns=['Skill', 'Jumlah'])
+        if not totals.empty:
+            skill_counts = pd.DataFrame({
+                'Skill': [c[len(SKILL_PREFIX):] for c in totals.index],
+                'Jumlah': totals.values
+            })
             fig_skill = px.bar(skill_counts, x='Jumlah', y='Skill', orientation='h', 
                                color='Jumlah', color_continuous_scale='Magma', text='Jumlah')
             fig_skill.update_layout(
@@ -229,20 +413,77 @@ with tab2:
             st.plotly_chart(fig_skill, use_container_width=True)
         else:
             st.warning("Tidak ada data skill.")
+    perf.lap('skill_chart')
+
+    st.subheader("🔗 Skill yang Sering Muncul Bersama")
+    insights = snapshot['skill_insights']
+    if insights is None:
+        st.info("Co-occurrence & premium gaji skill hanya tersedia saat dataset dimuat di memori (tanpa LOKER_BACKEND).")
+    elif n_filtered:
+        cooc = insights.cooccurrence(filtered_rows)
+        premium = insights.premium(filtered_rows)
+        perf.lap('skill_insight_agg', n_filtered)
+
+        if not cooc.empty:
+            # Sel = % lowongan dengan skill baris yang juga meminta skill kolom
+            share = cooc.div(pd.Series(cooc.values.diagonal(), index=cooc.index), axis=0) * 100
+            fig_cooc = px.imshow(share.round(1), text_auto='.0f', aspect='auto',
+                                 color_continuous_scale='Magma',
+                                 labels={'x': 'Juga meminta', 'y': 'Lowongan dengan skill', 'color': '%'})
+            fig_cooc.update_layout(paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', height=550)
+            st.plotly_chart(fig_cooc, use_container_width=True)
+            st.caption("Angka = % lowongan dengan skill di baris yang juga meminta skill di kolom.")
+
+        st.subheader("💎 Premium Gaji per Skill")
+        if premium.empty:
+            st.warning(f"Belum ada skill dengan minimal {MIN_SALARY_POSTINGS} lowongan bergaji di hasil filter.")
+        else:
+            premium_table = pd.DataFrame({
+                'Skill': premium['skill'],
+                'Lowongan Bergaji': premium['postings'],
+                'Median Gaji': premium['median'],
+                'Rata-rata Gaji': premium['mean'],
+                'Median Tanpa Skill': premium['median_without'],
+                'Premium (%)': premium['premium'] * 100,
+            })
+            st.dataframe(premium_table, hide_index=True, use_container_width=True, column_config={
+                'Median Gaji': st.column_config.NumberColumn(format="$%.0f"),
+                'Rata-rata Gaji': st.column_config.NumberColumn(format="$%.0f"),
+                'Median Tanpa Skill': st.column_config.NumberColumn(format="$%.0f"),
+                'Premium (%)': st.column_config.NumberColumn(format="%+.1f%%"),
+            })
+            st.caption(f"Premium = median gaji lowongan dengan skill dibanding median lowongan tanpa skill itu "
+                       f"(hasil filter, minimal {MIN_SALARY_POSTINGS} lowongan bergaji).")
+    perf.lap('skill_insight_chart')
 
 # === TAB 3: GAJI ===
 with tab3:
     st.subheader("💰 Analisis Distribusi Gaji")
-    if 'salary_yearly' in filtered_df.columns and not gaji_valid.empty:
+    # Binning & kuantil dihitung di server; chart hanya menerima jumlah per bin
+    if backend:
+        n_gaji = backend.salary_count(where)
+    else:
+        gaji_valid = valid_salaries(filtered_df)
+        n_gaji = len(gaji_valid)
+    perf.lap('salary_agg', n_filtered)
+    if n_gaji:
         col_chart, col_stat = st.columns([2,1])
         with col_chart:
-            fig_hist = px.histogram(
-                gaji_valid, 
-                x="salary_yearly", 
-                nbins=30,
+            bin_mode = st.radio("Bin histogram:", ["Tetap (30 bin)", "Adaptif"], horizontal=True)
+            bin_kind = 'adaptive' if bin_mode == "Adaptif" else 'fixed'
+            if backend:
+                hist = backend.salary_histogram(where, bins=30, mode=bin_kind)
+            else:
+                hist = salary_histogram(gaji_valid, bins=30, mode=bin_kind)
+            fig_hist = px.bar(
+                hist,
+                x="center",
+                y="count",
                 color_discrete_sequence=['#4cc9f0'],
-                opacity=0.8
+                opacity=0.8,
+                hover_data={'start': ':,.0f', 'end': ':,.0f', 'center': False}
             )
+            fig_hist.update_traces(width=hist['width'] * 0.9)
             fig_hist.update_layout(
                 title_text=None,
                 xaxis_title="Gaji Tahunan (USD)",
@@ -254,26 +495,73 @@ with tab3:
             st.plotly_chart(fig_hist, use_container_width=True)
         with col_stat:
             st.markdown("#### Statistik Ringkas")
-            st.markdown(f"""
-            - **Tertinggi:** ${gaji_valid['salary_yearly'].max():,.0f}
-            - **Rata-rata:** ${gaji_valid['salary_yearly'].mean():,.0f}
-            - **Terendah:** ${gaji_valid['salary_yearly'].min():,.0f}
-            """)
+            ringkas = backend.salary_summary(where) if backend else salary_summary(gaji_valid)
+            st.markdown("\n".join(f"- **{label}:** ${value:,.0f}" for label, value in ringkas.items()))
+            st.caption(f"Dari {n_gaji:,} lowongan dengan info gaji")
     else:
         st.warning("Data gaji tidak tersedia.")
+    perf.lap('salary_chart')
 
 # === TAB 4: DATA DETAIL ===
 with tab4:
     st.subheader("📋 Eksplorasi Data Detail")
     show_cols = ['title', 'company_name', 'location', 'salary_yearly', 'via', 'date_time', 'schedule_type']
-    valid_cols = [c for c in show_cols if c in filtered_df.columns]
-    
+    valid_cols = [c for c in show_cols if c in data_columns]
+
+    # Paging & sorting di server: hanya baris halaman aktif yang dikirim ke browser
+    col_size, col_sort, col_dir, col_page = st.columns([1, 2, 1, 1])
+    with col_size:
+        page_size = st.selectbox("Baris per halaman:", PAGE_SIZES, index=2)
+    with col_sort:
+        sort_label = st.selectbox("Urutkan berdasarkan:", ["(tanpa urutan)"] + valid_cols)
+    with col_dir:
+        ascending = st.radio("Arah:", ["Naik", "Turun"], horizontal=True) == "Naik"
+    total_pages = max(1, -(-n_filtered // page_size))
+    with col_page:
+        page = st.number_input(f"Halaman (dari {total_pages:,}):", min_value=1, max_value=total_pages, value=1)
+
+    sort_col = None if sort_label == "(tanpa urutan)" else sort_label
+    if backend:
+        page_df = backend.page(where, valid_cols, sort_col, ascending, int(page), page_size)
+    else:
+        page_df = get_page(filtered_df, valid_cols, sort_col, ascending, int(page), page_size)
     st.dataframe(
-        filtered_df[valid_cols].head(1000), 
+        page_df,
         use_container_width=True,
         column_config={
             "salary_yearly": st.column_config.NumberColumn("Gaji (USD)", format="$%d"),
             "date_time": st.column_config.DatetimeColumn("Diposting", format="D MMM YYYY")
         },
         height=500
-    )
\ No newline at end of file
+    )
+    st.caption(f"Menampilkan {len(page_df):,} dari {n_filtered:,} lowongan hasil filter")
+
+    # File download baru dibuat saat tombol diklik (bukan tiap rerun), ditulis per chunk
+    # ke file sementara; Streamlit sendiri memuat file itu utuh ke memori server saat dikirim
+    if backend:
+        make_csv = lambda: export_csv_frames(backend.iter_frames(where, valid_cols))
+        make_parquet = lambda: export_parquet_frames(backend.iter_frames(where, valid_cols))
+    else:
+        export_df = filtered_df[valid_cols]
+        make_csv = lambda: export_csv(export_df)
+        make_parquet = lambda: export_parquet(export_df)
+    col_csv, col_parquet = st.columns(2)
+    with col_csv:
+        st.download_button("⬇️ Download CSV", data=make_csv,
+                           file_name="loker_filter.csv", mime="text/csv")
+    with col_parquet:
+        st.download_button("⬇️ Download Parquet", data=make_parquet,
+                           file_name="loker_filter.parquet", mime="application/octet-stream")
+    if n_filtered > EXPORT_MAX_ROWS:
+        st.caption(f"⚠️ Download dibatasi {EXPORT_MAX_ROWS:,} baris pertama: Streamlit menyimpan file download "
+                   "utuh di memori server. Persempit filter untuk export lengkap.")
+    perf.lap('raw_data')
+
+# --- 7. PERFORMANCE (opt-in) ---
+# Satu baris JSON per rerun selalu ditulis ke log server
+perf_report = perf.log(rows_total=n_rows, rows_filtered=n_filtered, search=bool(search),
+                       backend=QUERY_BACKEND or ('mmap' if MMAP_LOAD else 'pandas'))
+if SHOW_PERF_PANEL:
+    with st.sidebar.expander("⏱️ Performance", expanded=True):
+        st.caption(f"Rerun terakhir: {perf_report['total_ms']:,.1f} ms · peak RSS {perf_report['peak_rss_mb']} MB")
+        st.dataframe(pd.DataFrame(perf_report['stages']), hide_index=True, use_container_width=True)
@@ -0,0 +1,138 @@
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Explorer Raw Data: paging + sorting di server.
+# Tiap halaman hanya mengurutkan sebagian (argpartition) lalu mengiris baris
+# halaman itu saja, jadi membuka halaman ke-N dari jutaan baris tetap ringan.
+
+EXPORT_CHUNK_ROWS = 50_000
+# Streamlit tetap membaca file download utuh ke memori server saat tombol diklik,
+# jadi export dibatasi supaya satu klik tidak memakan RAM tanpa batas
+EXPORT_MAX_ROWS = 1_000_000
+
+
+def _sort_key(s, ascending):
+    """Kunci numerik (float64) untuk sorting; nilai kosong selalu di akhir."""
+    if pd.api.types.is_datetime64_any_dtype(s):
+        values = s.to_numpy(dtype='datetime64[ns]')
+        missing = np.isnat(values)
+        key = values.view('int64').astype('float64')
+    elif pd.api.types.is_numeric_dtype(s) or pd.api.types.is_bool_dtype(s):
+        key = s.to_numpy(dtype='float64', na_value=np.nan)
+        missing = np.isnan(key)
+    else:
+        # Teks / kategori -> urutan leksikografis lewat factorize(sort=True)
+        codes, _ = pd.factorize(s, sort=True)
+        key = codes.astype('float64')
+        missing = codes < 0
+
+    if not ascending:
+        key = -key
+    return np.where(missing, np.inf, key)
+
+
+def page_positions(key, start, stop):
+    """Posisi baris urutan ke-[start, stop) menurut (key, posisi asli).
+
+    Cukup argpartition O(n) + sort kandidat, bukan argsort penuh. Nilai yang
+    sama (ties) diurutkan berdasarkan posisi asli supaya antar halaman konsisten.
+    """
+    n = len(key)
+    stop = min(stop, n)
+    if start >= stop:
+        return np.empty(0, dtype=np.int64)
+
+    if stop < n:
+        kth = key[np.argpartition(key, stop - 1)[stop - 1]]
+        cand = np.flatnonzero(key <= kth)
+    else:
+        cand = np.arange(n)
+
+    order = cand[np.lexsort((cand, key[cand]))]
+    return order[start:stop]
+
+
+def get_page(df, cols, sort_col=None, ascending=True, page=1, page_size=100):
+    """Irisan DataFrame untuk satu halaman (hanya baris halaman ini yang disalin)."""
+    start = (page - 1) * page_size
+    if sort_col is None:
+        return df[cols].iloc[start:start + page_size]
+    key = _sort_key(df[sort_col], ascending)
+    return df[cols].iloc[page_positions(key, start, start + page_size)]
+
+
+def iter_chunks(df, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Potong DataFrame jadi chunk baris (view, tanpa salin); minimal 1 chunk."""
+    for start in range(0, max(len(df), 1), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def iter_csv_chunks(frames):
+    """Generator CSV (bytes) dari urutan chunk DataFrame (header hanya di chunk pertama)."""
+    first = True
+    for chunk in frames:
+        yield chunk.to_csv(index=False, header=first).encode('utf-8')
+        first = False
+
+
+def limit_frames(frames, max_rows=EXPORT_MAX_ROWS):
+    """Potong urutan chunk setelah `max_rows` baris (None = tanpa batas)."""
+    remaining = max_rows
+    for chunk in frames:
+        if remaining is not None:
+            if remaining <= 0:
+                break
+            chunk = chunk.iloc[:remaining]
+            remaining -= len(chunk)
+        yield chunk
+
+
+def _spool_file():
+    # File sementara tanpa buffer (FileIO): bisa langsung diberikan ke st.download_button,
+    # otomatis terhapus saat ditutup / tidak dipakai lagi
+    return tempfile.TemporaryFile(buffering=0)
+
+
+def export_csv(df, chunk_rows=EXPORT_CHUNK_ROWS, max_rows=EXPORT_MAX_ROWS):
+    return export_csv_frames(iter_chunks(df, chunk_rows), max_rows)
+
+
+def export_csv_frames(frames, max_rows=EXPORT_MAX_ROWS):
+    """CSV ditulis per chunk ke file sementara -> file handle (posisi 0), bukan bytes utuh."""
+    out = _spool_file()
+    for part in iter_csv_chunks(limit_frames(frames, max_rows)):
+        out.write(part)
+    out.seek(0)
+    return out
+
+
+def export_parquet(df, chunk_rows=EXPORT_CHUNK_ROWS, max_rows=EXPORT_MAX_ROWS):
+    return export_parquet_frames(iter_chunks(df, chunk_rows), schema_df=df.iloc[:0], max_rows=max_rows)
+
+
+def export_parquet_frames(frames, schema_df=None, max_rows=EXPORT_MAX_ROWS):
+    """Parquet ditulis per row group (chunk) ke file sementara -> file handle (posisi 0).
+
+    Skema diambil dari `schema_df` (kalau ada) atau chunk pertama.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    out = _spool_file()
+    writer = None
+    schema = pa.Schema.from_pandas(schema_df, preserve_index=False) if schema_df is not None else None
+    try:
+        for chunk in limit_frames(frames, max_rows):
+            if schema is None:
+                schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(out, schema)
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+        if writer is None and schema is not None:
+            writer = pq.ParquetWriter(out, schema)
+    finally:
+        if writer is not None:
+            writer.close()
+    out.seek(0)
+    return out
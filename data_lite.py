@@ -0,0 +1,26 @@
+import os
+import pandas as pd
+from skill_matcher import skill_matrix
+
+# Loader dataset lite (dipakai dashboard & benchmark).
+DATA_PARQUET = 'gsearch_jobs_lite.parquet'  # Hasil bikin_data_lite.py (sudah bertipe)
+DATA_CSV = 'gsearch_jobs_lite.csv'          # Fallback format lama
+
+
+def read_lite_data(parquet_path=DATA_PARQUET, csv_path=DATA_CSV):
+    """Baca dataset lite: Parquet kalau ada, kalau tidak parse CSV format lama."""
+    # Parquet sudah bertipe (datetime, bool, float, category) -> tanpa parsing ulang
+    if os.path.exists(parquet_path):
+        return pd.read_parquet(parquet_path)
+
+    df = pd.read_csv(csv_path)
+    if 'date_time' in df.columns:
+        df['date_time'] = pd.to_datetime(df['date_time'], errors='coerce')
+    if 'required_skills' in df.columns:
+        df['required_skills'] = df['required_skills'].fillna("")
+        # CSV lama: bangun matriks skill sekali di sini
+        vocab = sorted({s for row in df['required_skills'] for s in row.split(', ') if s})
+        df = pd.concat([df, skill_matrix(df['required_skills'], vocab)], axis=1)
+    if 'work_from_home' in df.columns:
+        df['work_from_home'] = df['work_from_home'].fillna(False).astype(bool)
+    return df
@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+
+# Refresh dataset dashboard tanpa restart server & tanpa sesi yang "nge-freeze".
+# Pola double buffer: satu snapshot aktif dipakai semua sesi, sementara thread
+# latar memantau mtime/ukuran artefak ETL. Kalau artefak berubah (dan sudah
+# stabil selama satu interval, supaya file yang masih ditulis ETL tidak ikut
+# terbaca), snapshot baru dibangun penuh di thread itu (dataset, index, cube,
+# rollup, pipeline filter) lalu ditukar dengan satu assignment referensi.
+# Sesi yang sedang jalan tetap memegang snapshot lamanya sampai pindah sendiri.
+
+
+def artifact_version(paths):
+    """Versi artefak: hash pendek dari (path, mtime, ukuran) file yang ada."""
+    stamp = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        stamp.append([path, st.st_mtime_ns, st.st_size])
+    return hashlib.sha1(json.dumps(stamp).encode('utf-8')).hexdigest()[:10]
+
+
+class DataSnapshot:
+    """Satu versi dataset + struktur turunannya (read-only, dipakai bersama sesi)."""
+
+    def __init__(self, version, parts, build_s):
+        self.version = version
+        self.parts = parts
+        self.build_s = build_s
+        self.loaded_at = time.time()
+
+    def __getitem__(self, key):
+        return self.parts[key]
+
+
+class DatasetRefresher:
+    """Double buffer snapshot dataset dengan builder di thread latar.
+
+    build    : fungsi tanpa argumen -> dict bagian snapshot (boleh lambat)
+    paths    : file artefak yang dipantau
+    interval : detik antar pengecekan (<= 0 = tanpa thread, snapshot tidak pernah diganti)
+    """
+
+    def __init__(self, build, paths, interval=30.0):
+        self._build = build
+        self.paths = list(paths)
+        self.interval = interval
+        self._current = None
+        self._pending = None  # versi yang baru terlihat berubah, menunggu stabil
+        self._failed = None   # versi yang build-nya gagal (tidak dicoba lagi sampai artefak berubah)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.swaps = 0
+        self.last_error = None
+
+    def _load(self, version):
+        t0 = time.perf_counter()
+        parts = self._build()
+        return DataSnapshot(version, parts, time.perf_counter() - t0)
+
+    def current(self):
+        """Snapshot aktif. Hanya pemanggilan pertama yang membangun (sinkron)."""
+        snapshot = self._current
+        if snapshot is None:
+            with self._lock:
+                if self._current is None:
+                    self._current = self._load(artifact_version(self.paths))
+                snapshot = self._current
+        return snapshot
+
+    def check(self):
+        """Satu kali cek: bangun & tukar snapshot kalau artefak berubah dan sudah stabil.
+
+        Return True kalau snapshot diganti.
+        """
+        version = artifact_version(self.paths)
+        current = self._current
+        if current is None or version == current.version or version == self._failed:
+            self._pending = None
+            return False
+        if version != self._pending:
+            # Baru terlihat berubah: tunggu satu interval lagi (ETL mungkin masih menulis)
+            self._pending = version
+            return False
+
+        try:
+            snapshot = self._load(version)
+        except Exception as e:
+            # Snapshot lama tetap dipakai; versi ini baru dicoba lagi kalau artefak berubah lagi
+            self._failed = version
+            self.last_error = f"{type(e).__name__}: {e}"
+            self._log(event='refresh_failed', version=version, error=self.last_error)
+            return False
+        finally:
+            self._pending = None
+
+        if artifact_version(self.paths) != version:
+            # Artefak berubah lagi selama build -> ulangi di pengecekan berikutnya
+            return False
+        with self._lock:
+            old, self._current = self._current, snapshot
+        self.swaps += 1
+        self.last_error = None
+        self._log(event='refresh_swapped', old=old.version, new=version,
+                  build_ms=round(snapshot.build_s * 1000, 2))
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def start(self):
+        if self.interval > 0 and self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='dataset-refresher', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    @staticmethod
+    def _log(**fields):
+        # Satu baris JSON ke stderr (sama seperti log StageTimer)
+        print(json.dumps({'run': 'dataset_refresh', **fields}), file=sys.stderr, flush=True)
@@ -0,0 +1,180 @@
+import re
+import numpy as np
+import pandas as pd
+
+# Deteksi lowongan near-duplicate (lowongan sama yang muncul lewat beberapa `via`).
+# Perbandingan berpasangan O(n^2) tidak mungkin untuk jutaan baris, jadi:
+#   1. Tiap lowongan -> shingle 3 kata dari judul + perusahaan + deskripsi,
+#      lalu signature MinHash (NUM_PERM nilai min hash). Dihitung per batch
+#      (memori dibatasi ukuran batch), semua operasi NumPy.
+#   2. LSH: signature dipecah jadi BANDS band x ROWS_PER_BAND nilai. Lowongan yang
+#      satu band-nya sama persis jadi kandidat (cukup sort per band, O(n log n)).
+#   3. Kandidat diverifikasi dengan perkiraan Jaccard dari signature (>= JACCARD_THRESHOLD),
+#      lalu digabung jadi cluster (connected components, label propagation vektor).
+# Hasil: 1 id cluster per lowongan; lowongan unik = jumlah id cluster berbeda.
+
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS  # 4 -> pasangan dengan Jaccard 0,8 jadi kandidat dengan peluang > 99,9%
+JACCARD_THRESHOLD = 0.8
+SHINGLE_SIZE = 3
+MAX_TOKENS = 400          # Cukup awal deskripsi; duplikat lintas platform biasanya identik di sini
+BATCH_SIZE = 2000         # Lowongan per batch MinHash
+SIGNATURE_COL = 'minhash'  # Kolom sementara (bytes) selama ETL, tidak ikut ke dataset lite
+CLUSTER_COL = 'dup_cluster'
+
+_TOKEN_RE = re.compile(r'\w+')
+_rng = np.random.default_rng(2025)  # Seed tetap: signature harus sama antar run
+_PERM_A = _rng.integers(1, 1 << 61, NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_PERM_B = _rng.integers(0, 1 << 61, NUM_PERM, dtype=np.uint64)
+_MIX = _rng.integers(1, 1 << 63, NUM_PERM, dtype=np.uint64) | np.uint64(1)
+
+
+def _tokens(title, company, description):
+    parts = [p for p in (title, company, description) if isinstance(p, str)]
+    return _TOKEN_RE.findall(" ".join(parts).lower())[:MAX_TOKENS]
+
+
+def _shingle_hashes(docs):
+    """List token per dokumen -> (hash shingle uint64, offset awal per dokumen, jumlah shingle)."""
+    lengths = np.fromiter((len(d) for d in docs), dtype=np.int64, count=len(docs))
+    words = [w for d in docs for w in d]
+    if not words:
+        return np.empty(0, dtype=np.uint64), np.zeros(len(docs), dtype=np.int64), np.zeros(len(docs), dtype=np.int64)
+    h = pd.util.hash_array(np.array(words, dtype=object))
+    doc_of = np.repeat(np.arange(len(docs)), lengths)
+
+    # Shingle k kata = kombinasi hash k kata berurutan (dalam dokumen yang sama);
+    # dokumen yang lebih pendek dari k kata memakai kata-katanya sendiri
+    k = SHINGLE_SIZE
+    n = len(h)
+    if n >= k:
+        start = np.arange(n - k + 1)
+        combined = h[start].copy()
+        for j in range(1, k):
+            combined = (combined * np.uint64(0x9E3779B97F4A7C15)) ^ h[start + j]
+        same_doc = doc_of[start] == doc_of[start + k - 1]
+        shingles, shingle_doc = combined[same_doc], doc_of[start][same_doc]
+    else:
+        shingles, shingle_doc = np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int64)
+    short = lengths < k
+    if short.any():
+        extra = np.isin(doc_of, np.flatnonzero(short))
+        shingles = np.concatenate([shingles, h[extra]])
+        shingle_doc = np.concatenate([shingle_doc, doc_of[extra]])
+
+    order = np.argsort(shingle_doc, kind='stable')
+    shingles, shingle_doc = shingles[order], shingle_doc[order]
+    counts = np.bincount(shingle_doc, minlength=len(docs))
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    return shingles, starts, counts
+
+
+def minhash_batch(titles, companies, descriptions):
+    """Signature MinHash (n, NUM_PERM) uint32 untuk satu batch lowongan.
+
+    Lowongan tanpa teks sama sekali mendapat signature nol (tidak ikut LSH,
+    jadi cluster sendiri-sendiri, lihat cluster_ids).
+    """
+    docs = [_tokens(t, c, d) for t, c, d in zip(titles, companies, descriptions)]
+    shingles, starts, counts = _shingle_hashes(docs)
+    signatures = np.zeros((len(docs), NUM_PERM), dtype=np.uint32)
+    has = counts > 0
+    if not has.any():
+        return signatures
+    for j in range(NUM_PERM):
+        # Hash universal (a*x + b) mod 2^64, ambil 32 bit atas
+        hashed = ((shingles * _PERM_A[j] + _PERM_B[j]) >> np.uint64(32)).astype(np.uint32)
+        signatures[has, j] = np.minimum.reduceat(hashed, starts[has])
+    return signatures
+
+
+def minhash_signatures(titles, companies, descriptions, batch_size=BATCH_SIZE):
+    """Signature MinHash untuk semua baris, diproses per batch `batch_size`."""
+    titles, companies, descriptions = (list(x) for x in (titles, companies, descriptions))
+    parts = [minhash_batch(titles[i:i + batch_size], companies[i:i + batch_size], descriptions[i:i + batch_size])
+             for i in range(0, len(titles), batch_size)]
+    return np.concatenate(parts) if parts else np.zeros((0, NUM_PERM), dtype=np.uint32)
+
+
+def signature_column(frame):
+    """Signature MinHash sebagai kolom bytes (ikut terbawa saat sampling / merge)."""
+    col = lambda name: frame[name] if name in frame.columns else [None] * len(frame)
+    signatures = minhash_signatures(col('title'), col('company_name'), col('description'))
+    return pd.Series([row.tobytes() for row in signatures], index=frame.index, dtype=object)
+
+
+def unpack_signatures(column):
+    """Kolom bytes -> array (n, NUM_PERM) uint32."""
+    if len(column) == 0:
+        return np.zeros((0, NUM_PERM), dtype=np.uint32)
+    return np.frombuffer(b"".join(column), dtype=np.uint32).reshape(len(column), NUM_PERM)
+
+
+def _band_keys(signatures):
+    # 4 nilai uint32 per band -> satu key uint64
+    bands = signatures.reshape(len(signatures), BANDS, ROWS_PER_BAND).astype(np.uint64)
+    keys = np.zeros((len(signatures), BANDS), dtype=np.uint64)
+    for r in range(ROWS_PER_BAND):
+        keys = (keys * np.uint64(0x100000001B3)) ^ (bands[:, :, r] + np.uint64(r + 1))
+    return keys
+
+
+def _components(n, a, b):
+    """Connected components dari pasangan (a, b) -> label = indeks terkecil di komponen."""
+    labels = np.arange(n)
+    if len(a) == 0:
+        return labels
+    while True:
+        before = labels.copy()
+        low = np.minimum(labels[a], labels[b])
+        np.minimum.at(labels, a, low)
+        np.minimum.at(labels, b, low)
+        labels = labels[labels]  # pointer jumping
+        if np.array_equal(labels, before):
+            return labels
+
+
+def cluster_ids(signatures, threshold=JACCARD_THRESHOLD):
+    """Signature (n, NUM_PERM) -> id cluster int64 per baris.
+
+    Id cluster = hash signature terkecil di cluster, jadi tidak tergantung
+    urutan baris (lowongan yang sama dapat id yang sama di run berikutnya).
+    Baris tanpa teks (signature nol) tidak bisa dibandingkan, jadi masing-masing
+    jadi cluster sendiri dengan id -(posisi baris) - 1.
+    """
+    n = len(signatures)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    valid = np.flatnonzero(signatures.any(axis=1))
+    keys = _band_keys(signatures)
+
+    pairs_a, pairs_b = [], []
+    for band in range(BANDS):
+        order = valid[np.argsort(keys[valid, band], kind='stable')]
+        sorted_keys = keys[order, band]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        sizes = np.diff(np.r_[starts, len(order)])
+        multi = np.repeat(sizes > 1, sizes)
+        members = order[multi]
+        if len(members) == 0:
+            continue
+        first = np.repeat(order[starts], sizes)[multi]
+        # Verifikasi: perkiraan Jaccard = porsi nilai signature yang sama
+        similar = (signatures[members] == signatures[first]).mean(axis=1) >= threshold
+        keep = similar & (members != first)
+        pairs_a.append(members[keep])
+        pairs_b.append(first[keep])
+
+    a = np.concatenate(pairs_a) if pairs_a else np.empty(0, dtype=np.int64)
+    b = np.concatenate(pairs_b) if pairs_b else np.empty(0, dtype=np.int64)
+    labels = _components(n, a, b)
+
+    row_hash = (signatures.astype(np.uint64) * _MIX).sum(axis=1, dtype=np.uint64).view(np.int64)
+    cluster = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(cluster, labels, row_hash)
+    ids = cluster[labels]
+    empty = np.ones(n, dtype=bool)
+    empty[valid] = False
+    ids[empty] = -np.flatnonzero(empty) - 1
+    return ids
@@ -0,0 +1,85 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+
+# Manifest untuk ETL inkremental (bikin_data_lite.py --incremental).
+# Tiap lowongan punya 2 hash 64-bit:
+#   posting_key  : hash kolom identitas (job_id, atau judul+perusahaan+lokasi+platform+tanggal)
+#   content_hash : hash seluruh isi baris (termasuk description)
+# Baris yang key-nya belum ada, atau content_hash-nya berubah, saja yang
+# di-scan ulang skill-nya. Manifest juga menyimpan versi taxonomy skill
+# (skill_taxonomy.py): kalau versinya berubah, artefak dibangun ulang (full
+# rebuild; pola skill yang sudah pernah di-scan diambil dari cache match).
+# Begitu juga kalau cara hashing berubah (HASH_VERSION): key lama tidak cocok lagi.
+
+MANIFEST_FILE = 'gsearch_jobs_manifest.parquet'
+KEY_COL = 'posting_key'
+ID_COLS = ['job_id']
+ID_COLS_FALLBACK = ['title', 'company_name', 'location', 'via', 'date_time']
+HASH_VERSION = 2  # Naikkan kalau hash_rows berubah (2 = kolom numerik dinormalisasi ke float64)
+
+
+def id_columns(header):
+    """Kolom identitas yang dipakai untuk posting_key, tergantung kolom yang ada di CSV."""
+    return ID_COLS if all(c in header for c in ID_COLS) else [c for c in ID_COLS_FALLBACK if c in header]
+
+
+def _normalized(frame):
+    # Tipe hasil parsing CSV bisa beda antar chunk untuk nilai yang sama: kolom angka
+    # jadi int64 di chunk tanpa NaN tapi float64 di chunk yang ada NaN-nya
+    # ('95000' vs '95000.0' kalau langsung di-astype(str)). Kolom numerik (kecuali
+    # bool) diseragamkan ke float64 dulu, baru semuanya di-hash sebagai teks.
+    numeric = [c for c in frame.columns
+               if pd.api.types.is_numeric_dtype(frame[c]) and not pd.api.types.is_bool_dtype(frame[c])]
+    if numeric:
+        frame = frame.assign(**{c: pd.to_numeric(frame[c]).astype('float64') for c in numeric})
+    return frame.astype(str)
+
+
+def hash_rows(frame):
+    # Disimpan sebagai int64 (bukan uint64) agar aman juga untuk SQLite.
+    return pd.util.hash_pandas_object(_normalized(frame), index=False).to_numpy().view(np.int64)
+
+
+def posting_hashes(chunk, id_cols, content_cols):
+    """(posting_key, content_hash) per baris chunk CSV."""
+    return hash_rows(chunk[id_cols]), hash_rows(chunk[[c for c in content_cols if c in chunk.columns]])
+
+
+def in_sample(keys, rate):
+    """Sampling deterministik berbasis hash: lowongan yang sama selalu ikut / tidak ikut sampel."""
+    if rate >= 1:
+        return np.ones(len(keys), dtype=bool)
+    fraction = (keys.view(np.uint64) >> np.uint64(11)).astype(np.float64) / float(1 << 53)
+    return fraction < rate
+
+
+def needs_scan(manifest, keys, content):
+    """Mask baris yang baru (key belum ada) atau berubah (content_hash beda)."""
+    if manifest is None or manifest.empty:
+        return np.ones(len(keys), dtype=bool)
+    pos = pd.Index(manifest[KEY_COL]).get_indexer(keys)
+    known = pos >= 0
+    changed = np.ones(len(keys), dtype=bool)
+    changed[known] = manifest['content_hash'].to_numpy()[pos[known]] != content[known]
+    return changed
+
+
+def read_manifest(path=MANIFEST_FILE):
+    """(DataFrame posting_key/content_hash, metadata dict); (None, {}) kalau belum ada."""
+    if not os.path.exists(path):
+        return None, {}
+    import pyarrow.parquet as pq
+    table = pq.read_table(path)
+    raw = (table.schema.metadata or {}).get(b'loker_manifest', b'{}')
+    return table.to_pandas(), json.loads(raw)
+
+
+def write_manifest(manifest, meta, path=MANIFEST_FILE):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    table = pa.Table.from_pandas(manifest[[KEY_COL, 'content_hash']], preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[b'loker_manifest'] = json.dumps(meta).encode('utf-8')
+    pq.write_table(table.replace_schema_metadata(metadata), path)
@@ -0,0 +1,87 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Pipeline filter sidebar tanpa df.copy().
+# Setiap kriteria cuma menghasilkan boolean mask di atas DataFrame bersama
+# (read-only), mask digabung dengan &, dan baris hanya di-materialize SEKALI
+# di akhir. LRU kecil menyimpan POSISI baris per kombinasi filter (bukan
+# DataFrame hasil), jadi kombinasi yang diulang / di-toggle balik (atau cuma
+# pindah tab) tidak menghitung mask lagi, dan memori cache yang dipakai
+# bersama antar sesi tetap kecil (8 byte per baris lolos, bukan semua kolom).
+
+
+class FilterPipeline:
+    """Filter dashboard berbasis mask + memo LRU (posisi baris) per kombinasi filter.
+
+    Kalau semua baris lolos, `select` mengembalikan DataFrame bersama itu
+    sendiri, jadi anggap hasilnya read-only (jangan diubah in-place).
+    """
+
+    def __init__(self, df, title_index=None, maxsize=16):
+        self.df = df
+        self.title_index = title_index
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(search, schedule_types, platforms, remote):
+        # Normalisasi: urutan pilihan multiselect tidak berpengaruh, NaN -> None
+        def norm(values):
+            return frozenset(None if pd.isna(v) else v for v in (values or []))
+        return (search or "", norm(schedule_types), norm(platforms), remote)
+
+    def mask(self, search, schedule_types, platforms, remote=None):
+        """Boolean mask (numpy) untuk kombinasi filter, tanpa menyalin data."""
+        df = self.df
+        mask = np.ones(len(df), dtype=bool)
+
+        if search:
+            if self.title_index is not None:
+                mask &= self.title_index.search(search)
+            else:
+                mask &= df['title'].str.contains(search, case=False, na=False).to_numpy(dtype=bool)
+        mask &= df['schedule_type'].isin(schedule_types).to_numpy(dtype=bool)
+        if platforms and 'via' in df.columns:
+            mask &= df['via'].isin(platforms).to_numpy(dtype=bool)
+        if remote is True:
+            mask &= (df['work_from_home'] == True).to_numpy(dtype=bool)
+        elif remote is False:
+            mask &= (df['work_from_home'] != True).to_numpy(dtype=bool)
+        return mask
+
+    def select_rows(self, search, schedule_types, platforms, remote=None):
+        """(DataFrame hasil filter, posisi baris); posisi None = semua baris lolos.
+
+        Yang di-memo hanya posisi baris; `iloc` dijalankan tiap panggilan.
+
+        Posisi (np.flatnonzero(mask)) dipakai langsung oleh struktur per snapshot yang
+        diindeks per baris (mis. SkillInsights), tanpa mencocokkan ulang index.
+        """
+        key = self.make_key(search, schedule_types, platforms, remote)
+        with self._lock:
+            hit = key in self._cache
+            if hit:
+                self._cache.move_to_end(key)
+                positions = self._cache[key]
+
+        if not hit:
+            mask = self.mask(search, schedule_types, platforms, remote)
+            # Semua baris lolos -> cukup None, DataFrame asli dipakai tanpa alokasi baru
+            positions = None if mask.all() else np.flatnonzero(mask)
+            with self._lock:
+                self._cache[key] = positions
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+
+        if positions is None:
+            return self.df, None
+        return self.df.iloc[positions], positions
+
+    def select(self, search, schedule_types, platforms, remote=None):
+        """DataFrame hasil filter (memoized). remote: None/True/False."""
+        return self.select_rows(search, schedule_types, platforms, remote)[0]
@@ -0,0 +1,291 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import numpy as np
+
+from benchmark_loker import REPO_DIR, _git_rev, prepare_data
+from bikin_data_sintetis import parse_rows
+from perf_timer import current_rss_mb, get_perf_logger, peak_rss_mb
+
+# Load test dashboard_loker.py: N sesi bersamaan dalam SATU proses, masing-masing
+# sebuah AppTest di thread sendiri. Ini meniru server Streamlit (1 proses, 1 thread
+# script per sesi, cache_resource/snapshot dataset dipakai bersama); yang tidak
+# ikut diukur hanya websocket & render di browser.
+#
+# Tiap sesi memutar ulang interaksi yang realistis (seed tetap): mengetik pencarian
+# judul, ganti multiselect platform/jadwal, mode kerja, dan interaksi di tab
+# (Streamlit menjalankan semua tab tiap rerun, jadi "pindah tab" sendiri tidak memicu
+# rerun; yang memicu adalah widget di tab itu: periode/metrik tren, bin gaji, halaman Raw Data).
+# Per level konkurensi dicatat latensi rerun p50/p95/p99, throughput (rerun/s) dan RSS proses.
+# Data sintetis & artefak ETL dibuat lokal (bench_data/), tanpa jaringan.
+
+DASHBOARD = os.path.join(REPO_DIR, 'dashboard_loker.py')
+RESULTS_FILE = 'loadtest_results.jsonl'
+SLO_P95_MS = 1000.0  # Batas latensi rerun p95 yang masih dianggap interaktif
+SEARCH_TERMS = ["data analyst", "data scientist", "engineer", "senior", "business intelligence", "analyst"]
+BACKEND_ENV = {
+    'pandas': {},
+    'mmap': {'LOKER_MMAP': '1'},
+    'duckdb': {'LOKER_BACKEND': 'duckdb'},
+    'sqlite': {'LOKER_BACKEND': 'sqlite'},
+}
+
+
+def _widget(at, kind, label):
+    # Widget berdasarkan label (None kalau tidak ada, misal kolom datanya tidak ada)
+    return next((w for w in getattr(at, kind) if w.label == label), None)
+
+
+def _subset(rng, options, low=1, high=4):
+    k = int(rng.integers(low, min(high, len(options)) + 1))
+    return [options[i] for i in sorted(rng.choice(len(options), size=k, replace=False))]
+
+
+# Aksi: fungsi (at, rng) -> list langkah; tiap langkah = fungsi yang mengubah widget lalu 1 rerun
+def _search(at, rng):
+    term = SEARCH_TERMS[int(rng.integers(len(SEARCH_TERMS)))]
+    # Mengetik: potongan awal dulu (user berhenti sebentar), lalu kata lengkap.
+    # Widget dicari ulang tiap langkah karena elemen lama tidak berlaku setelah rerun
+    return [lambda: at.sidebar.text_input[0].input(term[:3]), lambda: at.sidebar.text_input[0].input(term)]
+
+
+def _clear_search(at, rng):
+    box = at.sidebar.text_input[0]
+    return [lambda: box.input("")] if box.value else []
+
+
+def _multiselect(label):
+    def action(at, rng):
+        widget = _widget(at, 'multiselect', label)
+        if widget is None or not widget.options:
+            return []
+        choice = _subset(rng, list(widget.options))
+        return [lambda: widget.set_value(choice)]
+    return action
+
+
+def _radio(label):
+    def action(at, rng):
+        widget = _widget(at, 'radio', label)
+        if widget is None:
+            return []
+        choice = widget.options[int(rng.integers(len(widget.options)))]
+        return [lambda: widget.set_value(choice)]
+    return action
+
+
+def _raw_page(at, rng):
+    widget = next((w for w in at.number_input if w.label.startswith("Halaman")), None)
+    if widget is None:
+        return []
+    page = int(rng.integers(widget.min, widget.max + 1))
+    return [lambda: widget.set_value(page)]
+
+
+# (nama, bobot, aksi): bobot ~ seberapa sering user melakukannya
+ACTIONS = [
+    ('search', 3, _search),
+    ('clear_search', 1, _clear_search),
+    ('platform', 3, _multiselect("🌐 Platform:")),
+    ('schedule', 1, _multiselect("⏳ Tipe Jadwal:")),
+    ('remote', 1, _radio("🏠 Mode Kerja:")),
+    ('tab_trend', 2, lambda at, rng: _radio(("Periode:", "Metrik:")[int(rng.integers(2))])(at, rng)),
+    ('tab_salary', 1, _radio("Bin histogram:")),
+    ('tab_raw', 1, _raw_page),
+]
+
+
+class Session:
+    """Satu pengguna simulasi: buka dashboard lalu jalankan `n_actions` aksi acak."""
+
+    def __init__(self, seed, n_actions, think_ms, timeout):
+        self.rng = np.random.default_rng(seed)
+        self.n_actions = n_actions
+        self.think_ms = think_ms
+        self.timeout = timeout
+        self.latencies = defaultdict(list)  # aksi -> list detik per rerun
+        self.errors = []
+
+    def _rerun(self, at, name):
+        t0 = time.perf_counter()
+        at.run(timeout=self.timeout)
+        self.latencies[name].append(time.perf_counter() - t0)
+        if at.exception:
+            self.errors.append(f"{name}: {at.exception[0].value}")
+
+    def run(self):
+        from streamlit.testing.v1 import AppTest
+        try:
+            at = AppTest.from_file(DASHBOARD, default_timeout=self.timeout)
+            self._rerun(at, 'open')
+            weights = np.array([w for _, w, _ in ACTIONS], dtype='float64')
+            for _ in range(self.n_actions):
+                name, _, action = ACTIONS[int(self.rng.choice(len(ACTIONS), p=weights / weights.sum()))]
+                for step in action(at, self.rng):
+                    if self.think_ms:
+                        time.sleep(self.rng.exponential(self.think_ms) / 1000)
+                    step()
+                    self._rerun(at, name)
+        except Exception as e:
+            self.errors.append(f"{type(e).__name__}: {e}")
+
+
+class RssSampler:
+    """Thread latar yang mencatat RSS maksimum proses selama satu level."""
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.peak = current_rss_mb() or 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, current_rss_mb() or 0.0)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def _percentiles(seconds):
+    if not seconds:
+        return {'p50_ms': None, 'p95_ms': None, 'p99_ms': None}
+    p50, p95, p99 = np.percentile(np.asarray(seconds) * 1000, [50, 95, 99])
+    return {'p50_ms': round(p50, 1), 'p95_ms': round(p95, 1), 'p99_ms': round(p99, 1)}
+
+
+def run_level(n_sessions, n_actions, think_ms, timeout, seed):
+    """Jalankan `n_sessions` sesi bersamaan -> ringkasan latensi, throughput & RSS."""
+    sessions = [Session(seed * 1000 + i, n_actions, think_ms, timeout) for i in range(n_sessions)]
+    threads = [threading.Thread(target=s.run, name=f'session-{i}') for i, s in enumerate(sessions)]
+    rss_start = current_rss_mb()
+    with RssSampler() as rss:
+        t0 = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        wall = time.perf_counter() - t0
+
+    by_action = defaultdict(list)
+    for s in sessions:
+        for name, values in s.latencies.items():
+            by_action[name].extend(values)
+    everything = [v for values in by_action.values() for v in values]
+    errors = [e for s in sessions for e in s.errors]
+    return {
+        'sessions': n_sessions,
+        'reruns': len(everything),
+        'errors': len(errors),
+        'error_samples': errors[:3],
+        'wall_s': round(wall, 3),
+        'throughput_rps': round(len(everything) / wall, 2) if wall > 0 else None,
+        **_percentiles(everything),
+        'rss_start_mb': round(rss_start, 1) if rss_start is not None else None,
+        'rss_peak_mb': round(rss.peak, 1) if rss.peak else None,
+        'by_action': {name: {'reruns': len(values), **_percentiles(values)} for name, values in by_action.items()},
+    }
+
+
+def prepare_artifacts(rows, seed):
+    """Data sintetis + artefak ETL (termasuk file Arrow untuk mode mmap) di bench_data/."""
+    workdir = prepare_data(rows, seed)
+    needed = ['gsearch_jobs_lite.parquet', 'gsearch_jobs_lite.arrow']
+    if not all(os.path.exists(os.path.join(workdir, f)) for f in needed):
+        print("🔧 Menjalankan ETL (bikin_data_lite.py --arrow)...")
+        subprocess.run([sys.executable, os.path.join(REPO_DIR, 'bikin_data_lite.py'), '--arrow'],
+                       cwd=workdir, check=True, stdout=subprocess.DEVNULL)
+    return workdir
+
+
+def max_sessions_within(levels, slo_ms):
+    """Konkurensi terbesar yang p95-nya masih <= SLO (dan tanpa error)."""
+    ok = [lv['sessions'] for lv in levels if lv['errors'] == 0 and lv['p95_ms'] is not None and lv['p95_ms'] <= slo_ms]
+    return max(ok) if ok else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test sesi bersamaan dashboard loker (AppTest, offline)")
+    parser.add_argument('--rows', type=parse_rows, default=parse_rows('50k'), help="Skala data sintetis: 10k .. 5M")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--sessions', default='1,2,4,8', help="Level konkurensi, dipisah koma (contoh 1,4,16)")
+    parser.add_argument('--actions', type=int, default=15, help="Jumlah aksi per sesi")
+    parser.add_argument('--think-ms', type=float, default=0.0,
+                        help="Rata-rata jeda antar aksi (ms, eksponensial); 0 = tanpa jeda (beban maksimum)")
+    parser.add_argument('--backend', choices=list(BACKEND_ENV), default='pandas')
+    parser.add_argument('--timeout', type=float, default=120.0, help="Batas waktu 1 rerun (detik)")
+    parser.add_argument('--slo-p95-ms', type=float, default=SLO_P95_MS)
+    parser.add_argument('--output', default=RESULTS_FILE)
+    args = parser.parse_args()
+
+    output = os.path.abspath(args.output)
+    workdir = prepare_artifacts(args.rows, args.seed)
+    # Dashboard membaca artefak & env saat script jalan; refresher latar tidak perlu di sini
+    os.environ.update(BACKEND_ENV[args.backend], LOKER_REFRESH_S='0')
+    os.chdir(workdir)
+    # Log JSON per rerun dari dashboard dimatikan (ribuan baris), ringkasan dicetak di sini
+    get_perf_logger().setLevel('WARNING')
+
+    print(f"🚦 Load test {args.rows:,} baris, backend {args.backend}, {args.actions} aksi/sesi")
+    t0 = time.perf_counter()
+    warmup = Session(args.seed, 0, 0, args.timeout)
+    warmup.run()  # Sesi pertama memuat snapshot dataset (cold start), tidak ikut diukur
+    cold_start_ms = round((time.perf_counter() - t0) * 1000, 1)
+    # Peringatan Streamlit per rerun juga dimatikan (level log di-reset saat run AppTest pertama)
+    from streamlit import logger as st_logger
+    st_logger.set_log_level('error')
+    if warmup.errors:
+        print(f"❌ Dashboard gagal dijalankan: {warmup.errors[0]}")
+        sys.exit(1)
+    print(f"   🧊 Cold start {cold_start_ms:,.0f} ms · RSS {current_rss_mb() or 0:,.0f} MB")
+
+    levels = []
+    print(f"   {'sesi':>5} {'rerun':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'rerun/s':>8} {'RSS peak':>9} error")
+    for n in [int(x) for x in args.sessions.split(',') if x.strip()]:
+        level = run_level(n, args.actions, args.think_ms, args.timeout, args.seed)
+        levels.append(level)
+        print(f"   {n:>5} {level['reruns']:>6} {level['p50_ms'] or 0:>6.0f}ms {level['p95_ms'] or 0:>6.0f}ms "
+              f"{level['p99_ms'] or 0:>6.0f}ms {level['throughput_rps'] or 0:>8.2f} "
+              f"{level['rss_peak_mb'] or 0:>7.0f}MB {level['errors']}")
+        for sample in level['error_samples']:
+            print(f"      ⚠️  {sample}")
+
+    capacity = max_sessions_within(levels, args.slo_p95_ms)
+    print(f"✅ Konkurensi maksimum dengan p95 <= {args.slo_p95_ms:,.0f} ms: {capacity} sesi")
+
+    run = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'git_rev': _git_rev(),
+        'rows': args.rows,
+        'seed': args.seed,
+        'backend': args.backend,
+        'actions': args.actions,
+        'think_ms': args.think_ms,
+        'python': platform.python_version(),
+        'cpu_count': os.cpu_count(),
+        'cold_start_ms': cold_start_ms,
+        'peak_rss_mb': round(peak_rss_mb() or 0, 1),
+        'slo_p95_ms': args.slo_p95_ms,
+        'max_sessions_within_slo': capacity,
+        'levels': levels,
+    }
+    with open(output, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(run) + "\n")
+    print(f"💾 Hasil ditambahkan ke '{output}'")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+from compact_data import compact_frame
+
+# Dataset lite versi Arrow IPC (tanpa kompresi) untuk di-memory-map read-only.
+# Beberapa proses server Streamlit (di belakang load balancer) membaca file
+# yang sama lewat mmap, jadi data kolom hanya ada SEKALI di page cache OS,
+# bukan satu salinan penuh per worker, dan start worker tidak perlu decode Parquet.
+#
+# Supaya kolom bisa jadi pandas tanpa disalin, tiap kolom ditulis dalam
+# bentuk yang layout memorinya sama persis dengan array NumPy/pandas:
+#   angka        -> apa adanya, NaN tetap NaN (tanpa validity bitmap Arrow)
+#   datetime     -> int64 nanodetik (NaT = nilai sentinel), di-view balik saat baca
+#   bool         -> uint8 (bool Arrow disimpan per-bit, jadi harus disalin)
+#   category     -> kode int (-1 = kosong) + daftar kategori di metadata schema
+#   teks         -> string Arrow, dibungkus langsung jadi kolom string[pyarrow]
+# Semua kolom ditulis dalam satu record batch (1 chunk) agar tidak perlu digabung saat baca.
+
+DATA_ARROW = 'gsearch_jobs_lite.arrow'
+_META_KEY = b'loker_mmap'
+
+
+def _encode(df):
+    import pyarrow as pa
+    arrays, meta = {}, {'categories': {}, 'bool': [], 'datetime': []}
+    for col in df.columns:
+        s = df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            arrays[col] = pa.array(s.cat.codes.to_numpy())
+            meta['categories'][col] = s.cat.categories.tolist()
+        elif pd.api.types.is_bool_dtype(s):
+            arrays[col] = pa.array(s.to_numpy(dtype=np.uint8))
+            meta['bool'].append(col)
+        elif pd.api.types.is_datetime64_any_dtype(s):
+            arrays[col] = pa.array(s.astype('datetime64[ns]').to_numpy().view(np.int64))
+            meta['datetime'].append(col)
+        elif pd.api.types.is_numeric_dtype(s):
+            arrays[col] = pa.array(s.to_numpy(), from_pandas=False)
+        else:
+            arrays[col] = pa.array(s.astype(object).where(s.notna(), None).tolist(), type=pa.large_string())
+    table = pa.table(arrays)
+    metadata = {_META_KEY: json.dumps(meta, ensure_ascii=False, default=str).encode('utf-8')}
+    return table.replace_schema_metadata(metadata)
+
+
+def write_mmap_data(df, path=DATA_ARROW):
+    """Tulis dataset (dipadatkan dulu dengan compact_frame) sebagai file Arrow IPC siap mmap.
+
+    File ditulis ke .tmp lalu di-rename: worker yang masih memetakan file lama
+    tetap membaca versi lama (inode lama) sampai dia membuka ulang.
+    """
+    import pyarrow as pa
+    table = _encode(compact_frame(df.reset_index(drop=True)))
+    tmp_path = path + '.tmp'
+    with pa.OSFile(tmp_path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table.combine_chunks(), max_chunksize=max(table.num_rows, 1))
+    os.replace(tmp_path, path)
+    return path
+
+
+def _single_chunk(column):
+    return column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+
+
+def read_mmap_data(path=DATA_ARROW):
+    """Memory-map file Arrow -> DataFrame yang kolomnya menunjuk langsung ke halaman mmap.
+
+    Array NumPy hasilnya read-only (perlakukan DataFrame sebagai read-only,
+    sama seperti hasil load_data di dashboard).
+    """
+    import pyarrow as pa
+    source = pa.memory_map(path, 'r')
+    table = pa.ipc.open_file(source).read_all()
+    meta = json.loads((table.schema.metadata or {}).get(_META_KEY, b'{}'))
+    categories = meta.get('categories', {})
+
+    columns = {}
+    for name in table.column_names:
+        column = table.column(name)
+        if pa.types.is_large_string(column.type) or pa.types.is_string(column.type):
+            columns[name] = pd.Series(pd.arrays.ArrowStringArray(column), name=name, copy=False)
+            continue
+        values = _single_chunk(column).to_numpy(zero_copy_only=True)
+        if name in categories:
+            dtype = pd.CategoricalDtype(categories[name])
+            values = pd.Categorical.from_codes(values, dtype=dtype, validate=False)
+        elif name in meta.get('bool', []):
+            values = values.view(np.bool_)
+        elif name in meta.get('datetime', []):
+            values = values.view('datetime64[ns]')
+        columns[name] = pd.Series(values, name=name, copy=False)
+
+    return pd.DataFrame(columns, copy=False)
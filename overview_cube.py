@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+from salary_stats import QUANTILES
+from dedup import CLUSTER_COL
+
+# Cube agregat untuk tab Overview.
+# Ruang filter sidebar kecil (schedule_type x via x work_from_home), jadi
+# semua KPI & bar chart Overview bisa dijawab dengan menjumlah sel cube
+# (ratusan baris) alih-alih scan seluruh dataset tiap rerun.
+# Ukuran cube dibatasi jumlah sel x TOP_PER_CELL, tidak tumbuh dengan jumlah
+# perusahaan/lokasi. Jumlah perusahaan/lokasi unik TIDAK dari cube (butuh semua
+# pasangan sel x nilai), tapi dari sketch HLL per sel (lihat sketches.py).
+
+GROUP_COLS = ['schedule_type', 'via', 'work_from_home']
+TOP_DIMS = ['location', 'company_name']
+TOP_PER_CELL = 50  # Nilai teratas per (sel, dimensi) yang disimpan untuk chart top 10
+
+
+def build_cube(df, top_n=TOP_PER_CELL):
+    """Bangun (cells, top) dari dataset lite.
+
+    cells : 1 baris per kombinasi filter -> count, salary_sum, salary_count
+    top   : jumlah lowongan per (kombinasi filter, dimensi, nilai) untuk
+            location & company_name, hanya `top_n` nilai terbanyak per sel.
+            Top 10 hasil merge exact selama tiap nilai di top 10 filter itu masuk
+            top `top_n` di setiap sel tempat ia muncul (nilai di luar itu bisa
+            sedikit kurang terhitung); data lowongan sangat berekor, jadi 50 cukup.
+    """
+    if any(c not in df.columns for c in GROUP_COLS):
+        return None, None
+
+    keys = df[GROUP_COLS]
+    if 'salary_yearly' in df.columns:
+        salary = df['salary_yearly'].where(df['salary_yearly'] > 0)
+    else:
+        salary = pd.Series(float('nan'), index=df.index)
+
+    cells = (
+        keys.assign(_salary=salary)
+        .groupby(GROUP_COLS, observed=True, dropna=False)
+        .agg(count=('_salary', 'size'), salary_sum=('_salary', 'sum'), salary_count=('_salary', 'count'))
+        .reset_index()
+    )
+
+    parts = []
+    for dim in TOP_DIMS:
+        if dim not in df.columns:
+            continue
+        counts = (
+            df[GROUP_COLS + [dim]]
+            .dropna(subset=[dim])
+            .groupby(GROUP_COLS + [dim], observed=True, dropna=False)
+            .size()
+            .reset_index(name='count')
+            .rename(columns={dim: 'value'})
+        )
+        counts = counts[counts['count'] > 0]
+        counts = (counts.sort_values('count', ascending=False, kind='stable')
+                  .groupby(GROUP_COLS, observed=True, dropna=False, sort=False).head(top_n)
+                  .sort_index())
+        counts['value'] = counts['value'].astype(str)
+        counts.insert(len(GROUP_COLS), 'dimension', dim)
+        parts.append(counts)
+
+    top = pd.concat(parts, ignore_index=True) if parts else None
+    if top is not None:
+        top['dimension'] = top['dimension'].astype('category')
+        top['value'] = top['value'].astype('category')
+    return cells, top
+
+
+def cell_mask(frame, schedule_types, platforms, remote):
+    # Logika filter sama persis dengan filter baris di dashboard (dipakai juga rollups.py)
+    mask = frame['schedule_type'].isin(schedule_types)
+    if any(pd.isna(v) for v in schedule_types):
+        # Jadwal kosong bisa tersimpan sebagai NaN (kategori) atau None (object)
+        mask |= frame['schedule_type'].isna()
+    if platforms:
+        mask &= frame['via'].isin(platforms)
+    if remote is True:
+        mask &= frame['work_from_home'] == True
+    elif remote is False:
+        mask &= frame['work_from_home'] != True
+    return mask
+
+
+def query_cube(cells, top, schedule_types, platforms, remote=None, top_n=10):
+    """Jawab KPI & chart Overview untuk filter terpilih dari sel-sel cube.
+
+    remote: None = Semua, True = Remote Only, False = On-site Only.
+    Hasil tanpa comp_unique / loc_unique / job_unique / salary_quantiles:
+    nilai itu diambil dari merge sketch (sketches.query_sketches).
+    """
+    sel = cells[cell_mask(cells, schedule_types, platforms, remote)]
+
+    total = int(sel['count'].sum())
+    salary_count = sel['salary_count'].sum()
+    avg_salary = sel['salary_sum'].sum() / salary_count if salary_count else 0
+
+    via_counts = sel.groupby('via', observed=True)['count'].sum()
+    via_counts = via_counts[via_counts > 0]
+    platform_top = via_counts.idxmax() if not via_counts.empty else "-"
+
+    result = {
+        'total': total,
+        'avg_salary': avg_salary,
+        'platform_top': platform_top,
+        'location': pd.Series(dtype='int64'),
+        'company_name': pd.Series(dtype='int64'),
+    }
+
+    if top is not None:
+        top_sel = top[cell_mask(top, schedule_types, platforms, remote)]
+        for dim in TOP_DIMS:
+            counts = top_sel[top_sel['dimension'] == dim].groupby('value', observed=True)['count'].sum()
+            counts = counts[counts > 0]
+            result[dim] = counts.sort_values(ascending=False, kind='stable').head(top_n)
+
+    return result
+
+
+def overview_from_rows(df, top_n=10):
+    """Hasil sama seperti query_cube, tapi dihitung langsung dari baris (dipakai saat ada pencarian)."""
+    result = {
+        'total': len(df),
+        'avg_salary': None,
+        'platform_top': df['via'].mode()[0] if not df.empty and 'via' in df.columns else "-",
+        'comp_unique': df['company_name'].nunique() if 'company_name' in df.columns else 0,
+        'loc_unique': df['location'].nunique() if 'location' in df.columns else 0,
+        'job_unique': df[CLUSTER_COL].nunique() if CLUSTER_COL in df.columns else None,
+        'salary_quantiles': None,
+    }
+    if 'salary_yearly' in df.columns:
+        salary_valid = df.loc[df['salary_yearly'] > 0, 'salary_yearly']
+        result['avg_salary'] = salary_valid.mean() if not salary_valid.empty else 0
+        if not salary_valid.empty:
+            values = np.quantile(salary_valid.to_numpy(dtype='float64'), list(QUANTILES.values()))
+            result['salary_quantiles'] = dict(zip(QUANTILES, values))
+    for dim in TOP_DIMS:
+        if dim in df.columns:
+            counts = df[dim].value_counts()
+            result[dim] = counts[counts > 0].head(top_n)
+    return result
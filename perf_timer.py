@@ -0,0 +1,101 @@
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+# Timer per tahap (stage) yang ringan untuk dashboard & ETL.
+# Tiap tahap mencatat durasi, jumlah baris (opsional) -> baris/s, dan peak RSS,
+# lalu semuanya bisa dicetak sebagai satu baris JSON terstruktur per run.
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb():
+    """Peak RSS proses ini (MB), None kalau tidak didukung OS."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS melaporkan bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def current_rss_mb():
+    """RSS proses ini saat ini (MB), dari /proc (Linux); None kalau tidak tersedia."""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+
+def get_perf_logger(name='loker.perf'):
+    """Logger khusus baris JSON performa (ke stderr, level INFO)."""
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+class StageTimer:
+    """Kumpulan waktu per tahap untuk satu run (1 rerun dashboard / 1 run ETL)."""
+
+    def __init__(self, name):
+        self.name = name
+        self.stages = {}
+        self._start = time.perf_counter()
+        self._last = self._start
+
+    def add(self, stage, seconds, rows=None):
+        # Tahap dengan nama sama dijumlahkan (misal extract per chunk)
+        entry = self.stages.setdefault(stage, {'seconds': 0.0, 'rows': 0})
+        entry['seconds'] += seconds
+        if rows:
+            entry['rows'] += rows
+
+    @contextmanager
+    def stage(self, stage, rows=None):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - t0, rows)
+            self._last = time.perf_counter()
+
+    def lap(self, stage, rows=None):
+        """Catat waktu sejak lap/stage sebelumnya (tanpa perlu indentasi blok)."""
+        now = time.perf_counter()
+        self.add(stage, now - self._last, rows)
+        self._last = now
+
+    def report(self):
+        stages = []
+        for stage, entry in self.stages.items():
+            row = {'stage': stage, 'ms': round(entry['seconds'] * 1000, 2)}
+            if entry['rows']:
+                row['rows'] = entry['rows']
+                row['rows_per_s'] = round(entry['rows'] / entry['seconds'], 1) if entry['seconds'] > 0 else None
+            stages.append(row)
+        rss = peak_rss_mb()
+        return {
+            'run': self.name,
+            'total_ms': round((time.perf_counter() - self._start) * 1000, 2),
+            'peak_rss_mb': round(rss, 1) if rss is not None else None,
+            'stages': stages,
+        }
+
+    def log(self, logger=None, **extra):
+        """Tulis report sebagai satu baris JSON."""
+        payload = self.report()
+        payload.update(extra)
+        (logger or get_perf_logger()).info(json.dumps(payload, default=str))
+        return payload
@@ -0,0 +1,436 @@
+import itertools
+import math
+import os
+import re
+import shutil
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from data_lite import DATA_PARQUET
+from dedup import CLUSTER_COL
+from salary_stats import QUANTILES, MAX_ADAPTIVE_BINS, salary_summary, salary_histogram
+from skill_matcher import SKILL_PREFIX
+from title_index import REGEX_META
+
+# Backend query opsional untuk dashboard: dataset lite didaftarkan ke engine
+# SQL embedded (DuckDB di atas Parquet, atau file SQLite lokal), lalu filter
+# sidebar & agregasi tab dijalankan sebagai SQL. Yang kembali ke Python cuma
+# frame kecil untuk chart, jadi dataset tidak perlu muat di RAM.
+
+try:
+    import duckdb
+except ImportError:  # DuckDB opsional (pip install duckdb)
+    duckdb = None
+
+ENGINES = ('duckdb', 'sqlite')
+DATA_SQLITE = 'gsearch_jobs_lite.sqlite'
+TABLE = 'jobs'
+SQLITE_BATCH_ROWS = 50_000
+_SNAPSHOT_IDS = itertools.count()
+
+
+def _ident(name):
+    # Nama kolom skill ada yang berspasi (mis. "skill_power bi") -> selalu di-quote
+    return '"' + name.replace('"', '""') + '"'
+
+
+def build_sqlite(parquet_path=DATA_PARQUET, db_path=DATA_SQLITE, batch_rows=SQLITE_BATCH_ROWS):
+    """Salin dataset lite (Parquet) ke file SQLite per batch, plus index kolom filter."""
+    import pyarrow.parquet as pq
+
+    tmp_path = db_path + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    with sqlite3.connect(tmp_path) as con:
+        for batch in pq.ParquetFile(parquet_path).iter_batches(batch_size=batch_rows):
+            chunk = batch.to_pandas()
+            for col in chunk.columns:
+                if isinstance(chunk[col].dtype, pd.CategoricalDtype):
+                    chunk[col] = chunk[col].astype(object)
+            chunk.to_sql(TABLE, con, if_exists='append', index=False)
+        con.execute(f"CREATE INDEX idx_{TABLE}_filter ON {TABLE} (schedule_type, via, work_from_home)")
+    con.close()
+
+    # Ganti file lama secara atomik (sesi lain tidak pernah melihat file setengah jadi)
+    os.replace(tmp_path, db_path)
+    return db_path
+
+
+class SqlBackend:
+    """Filter + agregasi dashboard sebagai SQL di DuckDB / SQLite.
+
+    engine='duckdb' : `path` berupa file Parquet (di-scan langsung, out-of-core)
+                      atau file database DuckDB berisi tabel `jobs`
+    engine='sqlite' : `path` berupa file SQLite (lihat build_sqlite)
+
+    Klausa filter dibuat sekali lewat `where(...)` lalu dipakai ulang di
+    semua method agregasi. Hasil query kecil disimpan di LRU (thread-safe).
+    """
+
+    def __init__(self, engine='duckdb', path=DATA_PARQUET, maxsize=64):
+        if engine not in ENGINES:
+            raise ValueError(f"Engine tidak dikenal: {engine} (pilih {', '.join(ENGINES)})")
+        if engine == 'duckdb' and duckdb is None:
+            raise ImportError("Backend 'duckdb' butuh paket duckdb (pip install duckdb)")
+
+        self.engine = engine
+        self.path = path
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        if engine == 'duckdb':
+            if path.endswith('.parquet'):
+                self._con = duckdb.connect()
+                source = path.replace("'", "''")
+                self._con.execute(f"CREATE VIEW {TABLE} AS SELECT * FROM read_parquet('{source}', file_row_number = true)")
+                self.row_col = 'file_row_number'
+            else:
+                self._con = duckdb.connect(path, read_only=True)
+                self.row_col = 'rowid'
+            # Fallback regex Python untuk pola yang tidak didukung RE2
+            self._con.create_function('loker_regexp', _regexp_match, ['VARCHAR', 'VARCHAR'], 'BOOLEAN',
+                                      null_handling='special')
+        else:
+            self.row_col = 'rowid'
+
+        info = self._run(f"SELECT * FROM {TABLE} LIMIT 0")
+        self.columns = [c for c in info.columns if c != self.row_col]
+        self.skill_cols = [c for c in self.columns if c.startswith(SKILL_PREFIX)]
+        self.n_rows = int(self._run(f"SELECT COUNT(*) AS n FROM {TABLE}")['n'].iloc[0])
+
+    # --- koneksi & eksekusi ---
+    def _sqlite(self):
+        # Satu koneksi read-only per thread (objek sqlite3 tidak boleh lintas thread)
+        con = getattr(self._local, 'con', None)
+        if con is None:
+            con = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            con.create_function('loker_regexp', 2, _regexp_match, deterministic=True)
+            self._local.con = con
+        return con
+
+    def _run(self, sql, params=()):
+        if self.engine == 'duckdb':
+            return self._con.cursor().execute(sql, list(params)).df()
+        return pd.read_sql_query(sql, self._sqlite(), params=list(params))
+
+    def _query(self, sql, params=()):
+        """Jalankan SQL (hasil kecil) lewat LRU; anggap hasilnya read-only."""
+        key = (sql, tuple(params))
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        result = self._run(sql, params)
+
+        with self._lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return result
+
+    def _fix_types(self, df):
+        # SQLite tidak punya tipe datetime/bool -> kembalikan ke tipe Parquet
+        if self.engine == 'sqlite':
+            if 'date_time' in df.columns:
+                df['date_time'] = pd.to_datetime(df['date_time'], errors='coerce')
+            if 'work_from_home' in df.columns:
+                df['work_from_home'] = df['work_from_home'].fillna(0).astype(bool)
+            if 'salary_yearly' in df.columns:
+                # Halaman yang gajinya NULL semua terbaca sebagai object (None)
+                df['salary_yearly'] = pd.to_numeric(df['salary_yearly'], errors='coerce').astype('float64')
+        return df
+
+    # --- filter ---
+    def _re2_ok(self, query):
+        # DuckDB memakai RE2; beberapa pola valid di Python (mis. "c++") ditolak RE2
+        try:
+            self._con.cursor().execute("SELECT regexp_matches('', ?)", [query])
+        except duckdb.Error:
+            return False
+        return True
+
+    def _search_clause(self, query):
+        # Semantik sama dengan TitleIndex: literal case-insensitive, atau regex
+        # kalau ada karakter spesial (regex tidak valid -> dianggap literal)
+        if set(query) & REGEX_META:
+            try:
+                re.compile(query)
+            except re.error:
+                pass
+            else:
+                if self.engine == 'duckdb' and self._re2_ok(query):
+                    return "regexp_matches(title, ?, 'i')", [query]
+                return "loker_regexp(title, ?)", [query]
+        escaped = query.lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return "lower(title) LIKE ? ESCAPE '\\'", [f"%{escaped}%"]
+
+    def where(self, search, schedule_types, platforms, remote=None):
+        """Klausa WHERE (sql, params) untuk kombinasi filter sidebar. remote: None/True/False."""
+        parts, params = [], []
+
+        if search:
+            clause, values = self._search_clause(search)
+            parts.append(clause)
+            params += values
+
+        values = sorted({v for v in schedule_types if not pd.isna(v)})
+        sched = []
+        if values:
+            sched.append(f"schedule_type IN ({', '.join('?' * len(values))})")
+            params += values
+        if any(pd.isna(v) for v in schedule_types):
+            sched.append("schedule_type IS NULL")
+        parts.append("(" + " OR ".join(sched) + ")" if sched else "FALSE")
+
+        if platforms and 'via' in self.columns:
+            values = sorted(set(platforms))
+            parts.append(f"via IN ({', '.join('?' * len(values))})")
+            params += values
+
+        if remote is True:
+            parts.append("work_from_home IS TRUE")
+        elif remote is False:
+            parts.append("work_from_home IS NOT TRUE")
+
+        return " AND ".join(parts), tuple(params)
+
+    # --- opsi sidebar ---
+    def schedule_options(self):
+        # Urutan kemunculan pertama, sama seperti df['schedule_type'].unique()
+        rows = self._query(f"SELECT schedule_type FROM {TABLE} GROUP BY schedule_type ORDER BY MIN({self.row_col})")
+        return [None if pd.isna(v) else v for v in rows['schedule_type']]
+
+    def platform_options(self, top_n=10):
+        if 'via' not in self.columns:
+            return []
+        rows = self._query(f"SELECT via, COUNT(*) AS n FROM {TABLE} WHERE via IS NOT NULL "
+                           f"GROUP BY via ORDER BY n DESC, via LIMIT {int(top_n)}")
+        return rows['via'].tolist()
+
+    # --- agregasi ---
+    def count(self, where):
+        sql, params = where
+        return int(self._query(f"SELECT COUNT(*) AS n FROM {TABLE} WHERE {sql}", params)['n'].iloc[0])
+
+    def _top_values(self, col, where, top_n):
+        sql, params = where
+        rows = self._query(
+            f"SELECT {_ident(col)} AS value, COUNT(*) AS n FROM {TABLE} WHERE {sql} AND {_ident(col)} IS NOT NULL "
+            f"GROUP BY {_ident(col)} ORDER BY n DESC, value LIMIT {int(top_n)}", params)
+        return pd.Series(rows['n'].to_numpy(dtype='int64'), index=rows['value'].astype(str).tolist(), name='count')
+
+    def overview(self, where, top_n=10):
+        """KPI & chart Overview, bentuk dict sama dengan query_cube / overview_from_rows."""
+        sql, params = where
+        salary = "AVG(CASE WHEN salary_yearly > 0 THEN salary_yearly END)" if 'salary_yearly' in self.columns else "NULL"
+        companies = "COUNT(DISTINCT company_name)" if 'company_name' in self.columns else "0"
+        locations = "COUNT(DISTINCT location)" if 'location' in self.columns else "0"
+        jobs = f"COUNT(DISTINCT {CLUSTER_COL})" if CLUSTER_COL in self.columns else "NULL"
+        row = self._query(f"SELECT COUNT(*) AS total, {salary} AS avg_salary, {companies} AS comp_unique, "
+                          f"{locations} AS loc_unique, {jobs} AS job_unique FROM {TABLE} WHERE {sql}",
+                          params).iloc[0]
+
+        result = {
+            'total': int(row['total']),
+            'avg_salary': 0 if pd.isna(row['avg_salary']) else float(row['avg_salary']),
+            'platform_top': "-",
+            'comp_unique': int(row['comp_unique']),
+            'loc_unique': int(row['loc_unique']),
+            'job_unique': None if pd.isna(row['job_unique']) else int(row['job_unique']),
+            'salary_quantiles': None,
+        }
+        if 'salary_yearly' in self.columns:
+            summary = self.salary_summary(where)
+            if summary:
+                result['salary_quantiles'] = {label: summary[label] for label in QUANTILES}
+        if 'via' in self.columns:
+            top_via = self._top_values('via', where, 1)
+            if not top_via.empty:
+                result['platform_top'] = top_via.index[0]
+        for dim in ['location', 'company_name']:
+            if dim in self.columns:
+                result[dim] = self._top_values(dim, where, top_n)
+        return result
+
+    def skill_totals(self, where, top_n=15):
+        """Jumlah lowongan per kolom skill (> 0), terurut menurun."""
+        if not self.skill_cols:
+            return pd.Series(dtype='int64')
+        sql, params = where
+        sums = ", ".join(f"COALESCE(SUM({_ident(c)}), 0) AS {_ident(c)}" for c in self.skill_cols)
+        totals = self._query(f"SELECT {sums} FROM {TABLE} WHERE {sql}", params).iloc[0].astype('int64')
+        return totals[totals > 0].sort_values(ascending=False, kind='stable').head(top_n)
+
+    def salary_values(self, where):
+        """Array gaji > 0 hasil filter (satu kolom float, dipakai jalur SQLite)."""
+        sql, params = where
+        if 'salary_yearly' not in self.columns:
+            return np.empty(0)
+        rows = self._run(f"SELECT salary_yearly FROM {TABLE} WHERE {sql} AND salary_yearly > 0", params)
+        return rows['salary_yearly'].to_numpy(dtype='float64')
+
+    def _salary_stats(self, where):
+        # count, min, max, rata-rata & kuantil dalam satu query (DuckDB: quantile_cont = np.quantile linear)
+        sql, params = where
+        quantiles = ", ".join(f"quantile_cont(salary_yearly, {q}) AS {_ident(label)}" for label, q in QUANTILES.items())
+        return self._query(
+            f"SELECT COUNT(*) AS n, MAX(salary_yearly) AS \"Tertinggi\", AVG(salary_yearly) AS \"Rata-rata\", "
+            f"MIN(salary_yearly) AS \"Terendah\", {quantiles} FROM {TABLE} WHERE {sql} AND salary_yearly > 0",
+            params).iloc[0]
+
+    def salary_count(self, where):
+        if 'salary_yearly' not in self.columns:
+            return 0
+        sql, params = where
+        return int(self._query(f"SELECT COUNT(*) AS n FROM {TABLE} WHERE {sql} AND salary_yearly > 0", params)['n'].iloc[0])
+
+    def salary_summary(self, where):
+        """Sama dengan salary_stats.salary_summary, dihitung di engine."""
+        if self.engine == 'sqlite':
+            # SQLite tidak punya fungsi kuantil -> ambil kolom gaji saja lalu hitung di NumPy
+            return salary_summary(self.salary_values(where))
+        stats = self._salary_stats(where)
+        if not stats['n']:
+            return {}
+        return {label: float(stats[label]) for label in ['Tertinggi', 'Rata-rata', 'Terendah', *QUANTILES]}
+
+    def salary_histogram(self, where, bins=30, mode='fixed'):
+        """Sama dengan salary_stats.salary_histogram; di DuckDB binning dilakukan lewat GROUP BY."""
+        if self.engine == 'sqlite':
+            return salary_histogram(self.salary_values(where), bins=bins, mode=mode)
+
+        stats = self._salary_stats(where)
+        n = int(stats['n'])
+        if not n:
+            return salary_histogram(np.empty(0))
+
+        lo, hi = float(stats['Terendah']), float(stats['Tertinggi'])
+        if lo == hi:
+            lo, hi = lo - 0.5, hi + 0.5
+        if mode == 'adaptive':
+            # Freedman-Diaconis seperti np.histogram_bin_edges(bins='fd')
+            width = 2 * (float(stats['P75']) - float(stats['P25'])) * n ** (-1 / 3)
+            n_bins = math.ceil((hi - lo) / width) if width else 1
+            if n_bins > MAX_ADAPTIVE_BINS:
+                n_bins = MAX_ADAPTIVE_BINS
+        else:
+            n_bins = bins
+        edges = np.linspace(lo, hi, n_bins + 1)
+
+        sql, params = where
+        # Indeks bin lalu dikoreksi terhadap tepi bin, persis seperti np.histogram
+        # (edge ke-i = i * step + lo, sama dengan np.linspace)
+        step = (hi - lo) / n_bins
+        rows = self._query(
+            f"SELECT CASE WHEN salary_yearly < bin * {step!r} + {lo!r} THEN bin - 1 "
+            f"WHEN bin < {n_bins - 1} AND salary_yearly >= (bin + 1) * {step!r} + {lo!r} THEN bin + 1 "
+            f"ELSE bin END AS bin, COUNT(*) AS n FROM ("
+            f"SELECT salary_yearly, LEAST(CAST(FLOOR((salary_yearly - {lo!r}) * {n_bins / (hi - lo)!r}) AS BIGINT), "
+            f"{n_bins - 1}) AS bin FROM {TABLE} WHERE {sql} AND salary_yearly > 0) GROUP BY 1",
+            params)
+        counts = np.zeros(n_bins, dtype='int64')
+        counts[rows['bin'].to_numpy(dtype='int64')] = rows['n'].to_numpy(dtype='int64')
+        return pd.DataFrame({
+            'start': edges[:-1],
+            'end': edges[1:],
+            'center': (edges[:-1] + edges[1:]) / 2,
+            'width': np.diff(edges),
+            'count': counts,
+        })
+
+    # --- baris (tab Raw Data) ---
+    def _select_sql(self, where, cols, sort_col=None, ascending=True):
+        sql, params = where
+        order = f"{self.row_col}"
+        if sort_col is not None:
+            order = f"{_ident(sort_col)} {'ASC' if ascending else 'DESC'} NULLS LAST, {order}"
+        select = ", ".join(_ident(c) for c in cols)
+        return f"SELECT {select} FROM {TABLE} WHERE {sql} ORDER BY {order}", params
+
+    def page(self, where, cols, sort_col=None, ascending=True, page=1, page_size=100):
+        """Satu halaman baris (ORDER BY + LIMIT/OFFSET di engine)."""
+        sql, params = self._select_sql(where, cols, sort_col, ascending)
+        offset = (page - 1) * page_size
+        rows = self._query(f"{sql} LIMIT {int(page_size)} OFFSET {int(offset)}", params)
+        rows = self._fix_types(rows.copy())
+        rows.index = range(offset, offset + len(rows))
+        return rows
+
+    def iter_frames(self, where, cols, chunk_rows=50_000):
+        """Generator DataFrame per chunk untuk export seluruh hasil filter."""
+        sql, params = self._select_sql(where, cols)
+        if self.engine == 'duckdb':
+            reader = self._con.cursor().execute(sql, list(params)).to_arrow_reader(chunk_rows)
+            for batch in reader:
+                yield batch.to_pandas()
+        else:
+            for chunk in pd.read_sql_query(sql, self._sqlite(), params=list(params), chunksize=chunk_rows):
+                yield self._fix_types(chunk)
+
+
+def _regexp_match(text, pattern):
+    # Dipakai SQLite untuk query regex (case-insensitive, seperti str.contains(case=False))
+    return text is not None and re.search(pattern, text, flags=re.IGNORECASE) is not None
+
+
+def snapshot_link(path):
+    """Hardlink `path` ke nama khusus satu snapshot: gsearch_jobs_lite.snap<pid>-<n>.parquet.
+
+    DuckDB membuka ulang Parquet di tiap query (SQLite: di tiap koneksi thread
+    baru), jadi snapshot harus memegang nama file sendiri. ETL menulis artefak
+    baru ke .tmp lalu os.replace, sehingga isi file lama tidak pernah diubah:
+    link cukup menahan versi lama tanpa menyalin data. Salinan penuh hanya
+    dipakai kalau filesystem tidak mendukung hardlink.
+    """
+    root, ext = os.path.splitext(path)
+    snap_path = f"{root}.snap{os.getpid()}-{next(_SNAPSHOT_IDS)}{ext}"
+    try:
+        os.link(path, snap_path)
+    except OSError:
+        shutil.copyfile(path, snap_path + '.tmp')
+        os.replace(snap_path + '.tmp', snap_path)
+    return snap_path
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def open_backend(engine, parquet_path=DATA_PARQUET, sqlite_path=DATA_SQLITE, snapshot=False):
+    """Buka backend; untuk SQLite, file dibangun ulang dari Parquet kalau belum ada / lebih lama.
+
+    snapshot=True: backend membaca link ke file versi saat ini (lihat snapshot_link),
+    jadi hasilnya tidak berubah walau ETL menulis artefak baru. Link dihapus
+    begitu backend tidak dipakai lagi (di-garbage-collect atau proses selesai).
+    """
+    path = parquet_path
+    if engine == 'sqlite':
+        stale = (not os.path.exists(sqlite_path)
+                 or os.path.getmtime(sqlite_path) < os.path.getmtime(parquet_path))
+        if stale:
+            build_sqlite(parquet_path, sqlite_path)
+        path = sqlite_path
+    if not snapshot:
+        return SqlBackend(engine, path)
+
+    path = snapshot_link(path)
+    try:
+        backend = SqlBackend(engine, path)
+    except Exception:
+        _remove_quietly(path)
+        raise
+    weakref.finalize(backend, _remove_quietly, path)
+    return backend
@@ -0,0 +1,173 @@
+import os
+import numpy as np
+import pandas as pd
+from overview_cube import GROUP_COLS, cell_mask
+from skill_matcher import SKILL_PREFIX, skill_columns
+
+# Rollup deret waktu (harian & mingguan) untuk chart tren dashboard.
+# Tiap tabel berisi jumlah per (grain, bucket, schedule_type, via, work_from_home),
+# jadi filter sidebar tetap bisa diterapkan dan chart tren cukup menjumlah
+# ratusan/ribuan baris rollup, bukan scan semua lowongan.
+#
+# Semua nilai berupa JUMLAH (count) sehingga rollup bisa di-update inkremental:
+# rollup baru = rollup lama + rollup lowongan baru (- rollup versi lama lowongan
+# yang berubah). Median gaji dihitung dari histogram gaji per bin $1.000,
+# jadi galat median maksimal setengah lebar bin ($500).
+
+GRAINS = {'daily': 'Harian', 'weekly': 'Mingguan'}
+SALARY_BIN_WIDTH = 1000  # USD per bin histogram gaji
+TABLES = ['postings', 'salary', 'skills']
+ROLLUP_FILES = {
+    'postings': 'gsearch_jobs_rollup_postings.parquet',  # jumlah lowongan
+    'salary': 'gsearch_jobs_rollup_salary.parquet',      # jumlah per bin gaji
+    'skills': 'gsearch_jobs_rollup_skills.parquet',      # jumlah per skill
+}
+KEYS = ['grain', 'bucket'] + GROUP_COLS
+
+
+def _bucket(dates, grain):
+    # Mingguan = minggu Senin-Minggu, diwakili tanggal Senin
+    if grain == 'daily':
+        return dates.dt.floor('D')
+    return dates.dt.to_period('W-SUN').dt.start_time
+
+
+def build_rollups(df):
+    """Dataset lite (dengan matriks skill) -> dict {postings, salary, skills}."""
+    if 'date_time' not in df.columns or any(c not in df.columns for c in GROUP_COLS):
+        return None
+
+    dated = df[df['date_time'].notna()]
+    skill_cols = skill_columns(dated)
+    parts = {name: [] for name in TABLES}
+
+    for grain in GRAINS:
+        keys = dated[GROUP_COLS].assign(grain=grain, bucket=_bucket(dated['date_time'], grain))[KEYS]
+        parts['postings'].append(
+            keys.groupby(KEYS, observed=True, dropna=False).size().reset_index(name='count'))
+
+        if 'salary_yearly' in dated.columns:
+            valid = (dated['salary_yearly'] > 0).to_numpy()
+            salary_bin = (dated['salary_yearly'].to_numpy()[valid] // SALARY_BIN_WIDTH).astype('int32')
+            parts['salary'].append(
+                keys[valid].assign(salary_bin=salary_bin)
+                .groupby(KEYS + ['salary_bin'], observed=True, dropna=False).size().reset_index(name='count'))
+
+        if skill_cols:
+            sums = pd.concat([keys, dated[skill_cols]], axis=1).groupby(KEYS, observed=True, dropna=False)[skill_cols].sum()
+            long = sums.stack().reset_index()
+            long.columns = KEYS + ['skill', 'count']
+            long['skill'] = long['skill'].str[len(SKILL_PREFIX):]
+            parts['skills'].append(long[long['count'] > 0])
+
+    return {name: _tidy(pd.concat(frames, ignore_index=True)) if frames else None
+            for name, frames in parts.items()}
+
+
+def _tidy(frame):
+    # Tipe konsisten antar run (penting saat rollup lama & baru digabung)
+    frame = frame.copy()
+    for col in ['grain', 'schedule_type', 'via', 'skill']:
+        if col in frame.columns:
+            frame[col] = frame[col].astype(object).where(frame[col].notna(), None)
+    frame['count'] = frame['count'].astype('int64')
+    return frame
+
+
+def merge_rollups(base, delta, sign=1):
+    """Gabung dua set rollup: base + sign * delta (sign=-1 untuk mengurangi baris lama)."""
+    if base is None:
+        base = {}
+    merged = {}
+    for name in TABLES:
+        frames = [f for f in (base.get(name), delta.get(name) if delta else None) if f is not None]
+        if not frames:
+            merged[name] = None
+            continue
+        if len(frames) == 2:
+            frames[1] = frames[1].assign(count=frames[1]['count'] * sign)
+        frame = _tidy(pd.concat(frames, ignore_index=True))
+        keys = [c for c in frame.columns if c != 'count']
+        frame = frame.groupby(keys, dropna=False, sort=True)['count'].sum().reset_index()
+        merged[name] = frame[frame['count'] != 0].reset_index(drop=True)
+    return merged
+
+
+def write_rollups(rollups, files=ROLLUP_FILES):
+    for name, frame in rollups.items():
+        if frame is not None:
+            # .tmp lalu rename: dashboard yang sedang memuat snapshot tidak membaca file setengah jadi
+            frame.to_parquet(files[name] + '.tmp', index=False)
+            os.replace(files[name] + '.tmp', files[name])
+
+
+def read_rollups(files=ROLLUP_FILES):
+    """Baca rollup hasil ETL; None kalau tabel postings belum ada."""
+    if not os.path.exists(files['postings']):
+        return None
+    return {name: pd.read_parquet(path) if os.path.exists(path) else None for name, path in files.items()}
+
+
+def _binned_median(hist):
+    """Median per bucket dari histogram (bucket, salary_bin) -> count.
+
+    Sama seperti np.median (rata-rata 2 nilai tengah kalau jumlahnya genap),
+    tiap nilai diwakili titik tengah bin-nya -> galat maksimal setengah lebar bin.
+    """
+    h = hist.reset_index()
+    by_bucket = h.groupby('bucket')['count']
+    end = by_bucket.cumsum()
+    start = end - h['count']
+    n = by_bucket.transform('sum')
+    center = (h['salary_bin'] + 0.5) * SALARY_BIN_WIDTH
+
+    middle = []
+    for rank in [(n - 1) // 2, n // 2]:
+        hit = (start <= rank) & (rank < end)
+        middle.append(center[hit].groupby(h.loc[hit, 'bucket']).first())
+    return (middle[0] + middle[1]) / 2
+
+
+def query_trend(rollups, grain, schedule_types, platforms, remote=None, top_skills=5):
+    """Deret waktu untuk filter terpilih -> (trend, skills).
+
+    trend  : per bucket -> count, remote_share (%), median_salary
+    skills : long format (bucket, skill, count) untuk `top_skills` skill teratas
+    """
+    postings = rollups['postings']
+    postings = postings[(postings['grain'] == grain) & cell_mask(postings, schedule_types, platforms, remote)]
+    if postings.empty:
+        return pd.DataFrame(columns=['bucket', 'count', 'remote_share', 'median_salary']), \
+            pd.DataFrame(columns=['bucket', 'skill', 'count'])
+
+    counts = postings.groupby('bucket')['count'].sum()
+    # Bucket tanpa lowongan tetap muncul (nilai 0) supaya garis tren tidak "melompat"
+    freq = 'D' if grain == 'daily' else 'W-MON'
+    full_range = pd.date_range(counts.index.min(), counts.index.max(), freq=freq)
+    counts = counts.reindex(full_range, fill_value=0)
+    remote_counts = postings[postings['work_from_home'] == True].groupby('bucket')['count'].sum()
+    remote_counts = remote_counts.reindex(full_range, fill_value=0)
+
+    trend = pd.DataFrame({'count': counts})
+    trend['remote_share'] = np.where(counts > 0, remote_counts / counts.where(counts > 0, 1) * 100, np.nan)
+    trend['median_salary'] = np.nan
+
+    salary = rollups.get('salary')
+    if salary is not None:
+        salary = salary[(salary['grain'] == grain) & cell_mask(salary, schedule_types, platforms, remote)]
+        hist = salary.groupby(['bucket', 'salary_bin'])['count'].sum()
+        if not hist.empty:
+            trend['median_salary'] = _binned_median(hist).reindex(trend.index)
+
+    trend = trend.rename_axis('bucket').reset_index()
+
+    skills = pd.DataFrame(columns=['bucket', 'skill', 'count'])
+    skill_rows = rollups.get('skills')
+    if skill_rows is not None:
+        skill_rows = skill_rows[(skill_rows['grain'] == grain)
+                                & cell_mask(skill_rows, schedule_types, platforms, remote)]
+        top = skill_rows.groupby('skill')['count'].sum().nlargest(top_skills).index
+        skills = (skill_rows[skill_rows['skill'].isin(top)]
+                  .groupby(['bucket', 'skill'])['count'].sum().reset_index())
+
+    return trend, skills
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+# Statistik & histogram gaji dihitung di server (NumPy).
+# Yang dikirim ke browser cuma jumlah per bin (+ batas bin), jadi ukuran
+# payload chart tetap kecil berapa pun jumlah baris gajinya.
+
+QUANTILES = {'P25': 0.25, 'Median': 0.50, 'P75': 0.75, 'P90': 0.90}
+MAX_ADAPTIVE_BINS = 100
+
+
+def valid_salaries(df, col='salary_yearly'):
+    """Array float gaji > 0 (NaN & nol dibuang)."""
+    if col not in df.columns:
+        return np.empty(0)
+    values = df[col].to_numpy(dtype='float64', na_value=np.nan)
+    return values[values > 0]
+
+
+def salary_summary(values):
+    """Tertinggi / rata-rata / terendah + kuantil (P25, median, P75, P90)."""
+    if len(values) == 0:
+        return {}
+    summary = {'Tertinggi': values.max(), 'Rata-rata': values.mean(), 'Terendah': values.min()}
+    for label, q in zip(QUANTILES, np.quantile(values, list(QUANTILES.values()))):
+        summary[label] = q
+    return summary
+
+
+def salary_histogram(values, bins=30, mode='fixed'):
+    """Histogram pre-binned -> DataFrame (start, end, center, width, count).
+
+    mode='fixed'    : `bins` bin dengan lebar sama dari min sampai max
+    mode='adaptive' : lebar bin Freedman-Diaconis (menyesuaikan sebaran data),
+                      dibatasi maksimal MAX_ADAPTIVE_BINS bin
+    """
+    if len(values) == 0:
+        return pd.DataFrame(columns=['start', 'end', 'center', 'width', 'count'])
+
+    if mode == 'adaptive':
+        edges = np.histogram_bin_edges(values, bins='fd')
+        if len(edges) - 1 > MAX_ADAPTIVE_BINS or len(edges) < 2:
+            edges = np.histogram_bin_edges(values, bins=MAX_ADAPTIVE_BINS)
+    else:
+        edges = np.histogram_bin_edges(values, bins=bins)
+
+    counts, edges = np.histogram(values, bins=edges)
+    return pd.DataFrame({
+        'start': edges[:-1],
+        'end': edges[1:],
+        'center': (edges[:-1] + edges[1:]) / 2,
+        'width': np.diff(edges),
+        'count': counts,
+    })
@@ -0,0 +1,163 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from skill_matcher import SKILL_PREFIX
+
+# Co-occurrence skill & premium gaji per skill untuk baris hasil filter.
+# Matriks skill (kolom uint8 'skill_<nama>') diubah SEKALI per snapshot dataset
+# jadi matriks sparse CSR baris x skill (rata-rata cuma beberapa skill per lowongan).
+# Tiap rerun cukup ambil baris hasil filter, lalu:
+#   co-occurrence  = X^T X (perkalian matriks sparse), hanya untuk top-N skill.
+#                    Baris dengan himpunan skill identik digabung dulu jadi satu pola
+#                    berbobot (puluhan ribu pola untuk jutaan lowongan), jadi yang dikalikan
+#                    U^T diag(w) U dengan w = jumlah baris hasil filter per pola
+#   median gaji    = order statistic per segmen kolom CSC (gaji diurutkan sekali)
+#   median TANPA skill = order statistic komplemen lewat binary search vektor
+#                        (semua skill sekaligus, ~log2(n) iterasi searchsorted)
+#   rata-rata      = bincount berbobot gaji
+# Tidak ada loop Python per baris / per lowongan, dan tidak ada explode string.
+
+MIN_SALARY_POSTINGS = 30  # Premium hanya untuk skill dengan >= 30 lowongan bergaji (median stabil)
+TOP_N_COOCCURRENCE = 15
+
+
+class SkillInsights:
+    """Matriks sparse baris x skill + gaji per baris, dibangun sekali per snapshot.
+
+    `rows` di semua method = posisi baris (np.ndarray int) hasil filter, None = semua baris.
+    """
+
+    def __init__(self, df, skill_cols):
+        self.skill_cols = list(skill_cols)
+        self.skills = [c[len(SKILL_PREFIX):] for c in self.skill_cols]
+        n = len(df)
+
+        # Nonzero per kolom skill -> koordinat (baris, skill); kolom uint8 tidak perlu digabung jadi dense
+        row_parts = [np.flatnonzero(df[col].to_numpy()) for col in self.skill_cols]
+        rows = np.concatenate(row_parts) if row_parts else np.empty(0, dtype=np.int64)
+        cols = np.repeat(np.arange(len(self.skill_cols)), [len(r) for r in row_parts])
+        self.matrix = sparse.csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, cols)),
+                                        shape=(n, len(self.skill_cols)))
+        self.row_pattern, first = _row_patterns(self.matrix)
+        self.patterns = self.matrix[first]  # 1 baris per himpunan skill unik
+
+        if 'salary_yearly' in df.columns:
+            salary = df['salary_yearly'].to_numpy(dtype='float64', na_value=np.nan)
+            self.salary = np.where(salary > 0, salary, np.nan)  # Gaji <= 0 dianggap tidak ada
+        else:
+            self.salary = np.full(n, np.nan)
+
+    def _select(self, rows):
+        if rows is None:
+            return self.matrix, self.salary
+        return self.matrix[rows], self.salary[rows]
+
+    def cooccurrence(self, rows=None, top_n=TOP_N_COOCCURRENCE):
+        """Jumlah lowongan yang memuat skill baris & skill kolom (top_n skill terbanyak).
+
+        Diagonal = jumlah lowongan per skill.
+        """
+        pattern = self.row_pattern if rows is None else self.row_pattern[rows]
+        weights = np.bincount(pattern, minlength=self.patterns.shape[0])
+        used = np.flatnonzero(weights)
+        sub = self.patterns[used]
+        full = (sub.multiply(weights[used][:, None]).T.tocsr() @ sub).toarray()
+        counts = np.diag(full)
+        top = np.argsort(-counts, kind='stable')[:top_n]
+        top = top[counts[top] > 0]
+        names = [self.skills[j] for j in top]
+        return pd.DataFrame(full[np.ix_(top, top)], index=names, columns=names)
+
+    def premium(self, rows=None, min_postings=MIN_SALARY_POSTINGS):
+        """Gaji per skill vs lowongan tanpa skill itu (hanya lowongan bergaji).
+
+        Kolom: skill, postings (lowongan bergaji dengan skill), median, mean,
+        median_without, premium (= median / median_without - 1). Urut premium tertinggi.
+        """
+        columns = ['skill', 'postings', 'median', 'mean', 'median_without', 'premium']
+        matrix, salary = self._select(rows)
+        paid = np.flatnonzero(~np.isnan(salary))
+        n, k = len(paid), len(self.skills)
+        if n == 0 or k == 0:
+            return pd.DataFrame(columns=columns)
+
+        csc = matrix[paid].tocsc()
+        csc.sort_indices()
+        values = salary[paid]
+        order = np.argsort(values, kind='stable')
+        sorted_values = values[order]
+        rank = np.empty(n, dtype=np.int64)
+        rank[order] = np.arange(n)
+
+        counts = np.diff(csc.indptr).astype(np.int64)
+        starts = csc.indptr[:-1].astype(np.int64)
+        col_of = np.repeat(np.arange(k, dtype=np.int64), counts)
+        # Key global = skill * n + peringkat gaji -> satu sort, tiap segmen skill terurut gaji
+        keys = np.sort(col_of * n + rank[csc.indices])
+        positions = keys - col_of * n
+
+        sums = np.bincount(col_of, weights=values[csc.indices], minlength=k)
+        has = counts > 0
+        mean = np.where(has, sums / np.maximum(counts, 1), np.nan)
+
+        median = np.full(k, np.nan)
+        lo_pos = positions[(starts + (counts - 1) // 2)[has]]
+        hi_pos = positions[(starts + counts // 2)[has]]
+        median[has] = (sorted_values[lo_pos] + sorted_values[hi_pos]) / 2
+
+        rest = n - counts
+        median_without = np.full(k, np.nan)
+        some_rest = rest > 0
+        if some_rest.any():
+            lo = _complement_kth(keys, starts, counts, n, (rest - 1) // 2, sorted_values)
+            hi = _complement_kth(keys, starts, counts, n, rest // 2, sorted_values)
+            median_without[some_rest] = ((lo + hi) / 2)[some_rest]
+
+        result = pd.DataFrame({
+            'skill': self.skills,
+            'postings': counts,
+            'median': median,
+            'mean': mean,
+            'median_without': median_without,
+            'premium': median / median_without - 1,
+        })
+        result = result[(result['postings'] >= min_postings) & result['premium'].notna()]
+        return result.sort_values('premium', ascending=False, kind='stable').reset_index(drop=True)
+
+
+def _row_patterns(matrix):
+    """Id pola (himpunan skill) per baris + indeks baris pertama tiap pola.
+
+    Himpunan skill di-encode exact sebagai bitmask uint64 (1 word per 64 skill).
+    """
+    n, k = matrix.shape
+    coo = matrix.tocoo()
+    words = max(1, -(-k // 64))
+    codes = np.zeros((n, words), dtype=np.uint64)
+    bits = np.left_shift(np.uint64(1), (coo.col % 64).astype(np.uint64))
+    np.bitwise_or.at(codes, (coo.row, coo.col // 64), bits)
+    if words == 1:
+        _, first, inverse = np.unique(codes[:, 0], return_index=True, return_inverse=True)
+    else:
+        _, first, inverse = np.unique(codes, axis=0, return_index=True, return_inverse=True)
+    return inverse.ravel().astype(np.int64), first
+
+
+def _complement_kth(keys, starts, counts, n, kth, sorted_values):
+    """Nilai ke-`kth` (0-based) dari gaji lowongan TANPA skill j, untuk semua j sekaligus.
+
+    Cari posisi terkecil i (urutan gaji) dengan jumlah lowongan tanpa skill di
+    posisi <= i sudah kth + 1; posisi itu pasti milik lowongan tanpa skill.
+    """
+    k = len(starts)
+    base = np.arange(k, dtype=np.int64) * n
+    kth = np.clip(kth, 0, None)
+    lo = np.zeros(k, dtype=np.int64)
+    hi = np.full(k, n - 1, dtype=np.int64)
+    while (lo < hi).any():
+        mid = (lo + hi) // 2
+        with_skill = np.searchsorted(keys, base + mid, side='right') - starts
+        enough = mid + 1 - np.minimum(with_skill, counts) >= kth + 1
+        hi = np.where(enough, mid, hi)
+        lo = np.where(enough, lo, mid + 1)
+    return sorted_values[lo]
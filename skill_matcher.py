@@ -0,0 +1,101 @@
+import re
+import numpy as np
+import pandas as pd
+
+# Mesin pencocokan skill bersama (dipakai bikin_data_lite.py & notebook analisis).
+# Versi lama menjalankan satu regex \b...\b per skill untuk setiap deskripsi
+# (23-60 kali scan per baris). Di sini semua keyword dikompilasi SEKALI jadi
+# satu regex gabungan, jadi tiap deskripsi cukup di-scan satu kali saja.
+
+# Versi aturan pencocokan; naik kalau semantik match berubah (cache hasil match
+# di skill_taxonomy.MatchCache dengan versi lain dibuang).
+# 2 = batas kata lewat lookaround (?<!\w)/(?!\w), bukan \b (supaya 'c++' bisa match)
+MATCH_RULES_VERSION = 2
+
+# Prefix nama kolom matriks skill (1 kolom uint8 per skill, contoh: 'skill_python')
+SKILL_PREFIX = 'skill_'
+
+
+class SkillMatcher:
+    """Pencocok skill satu-kali-scan dengan hasil identik dengan loop regex per skill.
+
+    Semantik:
+    - Tiap skill dicocokkan seperti r'(?<!\\w)' + re.escape(skill) + r'(?!\\w)':
+      tidak boleh diapit huruf/angka (jadi 'r' tidak match di "your", 'java'
+      tidak match di "javascript"). Beda dengan \\b, skill yang diakhiri
+      non-huruf tetap bisa match: 'c++' di "C++, SQL" / "C++ and SQL".
+    - Hasil dikembalikan sesuai urutan daftar keyword asli, tanpa duplikat.
+    """
+
+    def __init__(self, keywords):
+        # Buang duplikat tapi pertahankan urutan asli
+        self.keywords = list(dict.fromkeys(keywords))
+        self._order = {skill: i for i, skill in enumerate(self.keywords)}
+
+        # Skill yang lebih panjang dicoba duluan, supaya 'sql server' tidak
+        # "ketutup" oleh 'sql' di posisi yang sama.
+        by_length = sorted(self.keywords, key=len, reverse=True)
+        alternation = '|'.join(re.escape(skill) for skill in by_length)
+
+        # Lookahead (?=...) = match lebar-nol, jadi skill yang saling tumpang
+        # tindih (misal 'power bi' dan 'bi') tetap ketemu semua.
+        self._pattern = re.compile(r'(?=(?<!\w)(' + alternation + r')(?!\w))')
+
+        # Regex per skill hanya dipakai untuk verifikasi skill "prefix"
+        # (contoh: 'sql' di dalam 'sql server') yang mulai di posisi sama.
+        self._single = {
+            skill: re.compile(r'(?<!\w)' + re.escape(skill) + r'(?!\w)')
+            for skill in self.keywords
+        }
+        self._prefixes = {
+            skill: [other for other in self.keywords
+                    if other != skill and skill.startswith(other)]
+            for skill in self.keywords
+        }
+
+    def find(self, text):
+        """Kembalikan list skill yang ditemukan di `text` (urutan keyword)."""
+        if not isinstance(text, str):
+            return []
+        text = text.lower()
+        found = set()
+
+        for match in self._pattern.finditer(text):
+            skill = match.group(1)
+            found.add(skill)
+            pos = match.start()
+            for shorter in self._prefixes[skill]:
+                if shorter not in found and self._single[shorter].match(text, pos):
+                    found.add(shorter)
+
+        return sorted(found, key=self._order.__getitem__)
+
+    def find_joined(self, text, sep=", "):
+        """Versi string (format kolom `required_skills`: "python, sql, excel")."""
+        return sep.join(self.find(text))
+
+
+def skill_matrix(skill_strings, keywords, sep=", "):
+    """Ubah kolom string "python, sql" jadi matriks skill uint8 (1 kolom per skill).
+
+    Dengan matriks ini, hitungan skill cukup `df[kolom_skill].sum()` (vektor),
+    tanpa split/explode/Counter yang membuat objek Python per skill per baris.
+    """
+    col_of = {skill: i for i, skill in enumerate(keywords)}
+    matrix = np.zeros((len(skill_strings), len(keywords)), dtype=np.uint8)
+
+    for row, joined in enumerate(skill_strings):
+        if not isinstance(joined, str) or not joined:
+            continue
+        for skill in joined.split(sep):
+            col = col_of.get(skill)
+            if col is not None:
+                matrix[row, col] = 1
+
+    return pd.DataFrame(matrix, columns=[SKILL_PREFIX + s for s in keywords],
+                        index=getattr(skill_strings, 'index', None))
+
+
+def skill_columns(df):
+    """Daftar kolom matriks skill yang ada di DataFrame."""
+    return [c for c in df.columns if c.startswith(SKILL_PREFIX)]
@@ -0,0 +1,218 @@
+import hashlib
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, repeat
+
+import numpy as np
+import pandas as pd
+from skill_matcher import MATCH_RULES_VERSION, SkillMatcher
+
+# Taxonomy skill bersama (satu sumber untuk ETL, analisis_skill.py & notebook).
+# skill_taxonomy.json berisi kategori -> skill kanonik -> sinonim, contoh
+# "google cloud": ["gcp"] artinya teks "gcp" dihitung sebagai skill "google cloud".
+# Isi taxonomy di-hash jadi `version`; versi berubah = artefak ETL perlu dibangun ulang.
+#
+# Hasil pencocokan per deskripsi disimpan di cache Parquet (MatchCache), di level
+# POLA (skill + sinonim), bukan skill kanonik. Jadi kalau taxonomy cuma ditambah
+# beberapa skill/sinonim, yang di-scan ulang hanya pola barunya saja; sinonim yang
+# dipindah ke skill lain atau skill yang dihapus tidak perlu scan sama sekali.
+
+TAXONOMY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'skill_taxonomy.json')
+CACHE_FILE = 'gsearch_jobs_skill_cache.parquet'  # Cache hasil match per hash deskripsi
+MATCH_SEP = '|'  # Pemisah pola di kolom `matches` cache
+
+
+def _normalize(pattern):
+    return ' '.join(str(pattern).lower().split())
+
+
+class SkillTaxonomy:
+    """Kategori -> skill kanonik -> sinonim, plus versi (hash isi taxonomy).
+
+    - `skills`   : daftar skill kanonik (urutan = urutan kolom matriks skill)
+    - `patterns` : semua teks yang dicari (skill kanonik + sinonim)
+    - `version`  : hash pendek isi taxonomy (urutan ikut dihitung)
+    """
+
+    def __init__(self, categories):
+        self.categories = {}
+        self.canonical = {}    # pola -> skill kanonik
+        self.category_of = {}  # skill kanonik -> kategori
+
+        for category, entries in categories.items():
+            self.categories[category] = {}
+            for skill, synonyms in entries.items():
+                skill = _normalize(skill)
+                synonyms = [_normalize(s) for s in synonyms or []]
+                if skill in self.category_of:
+                    raise ValueError(f"Skill '{skill}' muncul dua kali di taxonomy")
+                self.categories[category][skill] = synonyms
+                self.category_of[skill] = category
+                for pattern in [skill] + synonyms:
+                    if MATCH_SEP in pattern:
+                        raise ValueError(f"Pola '{pattern}' tidak boleh mengandung '{MATCH_SEP}'")
+                    owner = self.canonical.setdefault(pattern, skill)
+                    if owner != skill:
+                        raise ValueError(f"Pola '{pattern}' dipakai oleh '{owner}' dan '{skill}'")
+
+        self.skills = list(self.category_of)
+        self.patterns = list(self.canonical)
+        self._rank = {skill: i for i, skill in enumerate(self.skills)}
+        raw = json.dumps(self.categories, ensure_ascii=False)
+        self.version = hashlib.sha1(raw.encode('utf-8')).hexdigest()[:12]
+
+    def to_skills(self, patterns):
+        """Pola yang ketemu -> skill kanonik unik (urutan taxonomy)."""
+        skills = {self.canonical[p] for p in patterns if p in self.canonical}
+        return sorted(skills, key=self._rank.__getitem__)
+
+    def joined(self, patterns, sep=", "):
+        """Versi string (format kolom `required_skills`: "python, sql, excel")."""
+        return sep.join(self.to_skills(patterns))
+
+
+def load_taxonomy(path=TAXONOMY_FILE):
+    with open(path, encoding='utf-8') as f:
+        return SkillTaxonomy(json.load(f)['categories'])
+
+
+def pattern_set_id(patterns):
+    """Id himpunan pola yang sudah dievaluasi (tidak tergantung urutan)."""
+    raw = json.dumps(sorted(set(patterns)), ensure_ascii=False)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:12]
+
+
+def description_hashes(texts):
+    # Hash 64-bit isi deskripsi, disimpan int64 (sama seperti etl_manifest.hash_rows)
+    return pd.util.hash_pandas_object(pd.Series(texts, dtype=object), index=False).to_numpy().view(np.int64)
+
+
+@lru_cache(maxsize=8)
+def _matcher(patterns):
+    return SkillMatcher(patterns)
+
+
+def _match_chunk(patterns, texts):
+    # Dijalankan di worker (level modul agar bisa di-pickle)
+    matcher = _matcher(patterns)
+    return [matcher.find(t) for t in texts]
+
+
+def match_texts(texts, patterns, workers=1, chunk_size=5000):
+    """Cocokkan `patterns` ke tiap teks -> list pola yang ketemu per teks."""
+    patterns = tuple(patterns)
+    texts = list(texts)
+    if workers is None or workers <= 1 or len(texts) <= chunk_size:
+        return _match_chunk(patterns, texts)
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(chain.from_iterable(executor.map(_match_chunk, repeat(patterns), chunks)))
+
+
+class MatchCache:
+    """Cache hasil pencocokan pola per deskripsi (Parquet, persist antar run).
+
+    Tiap baris: hash deskripsi -> (id himpunan pola yang sudah dievaluasi, pola
+    yang match). Daftar pola per id disimpan di metadata Parquet. Saat lookup
+    dengan taxonomy baru, baris yang himpunan polanya sudah mencakup semua pola
+    taxonomy cukup difilter; sisanya hanya di-scan dengan pola yang BELUM pernah
+    dievaluasi, lalu hasilnya digabung. Deskripsi identik (repost) di-scan sekali.
+    """
+
+    def __init__(self, path=CACHE_FILE):
+        self.path = path
+        self.pattern_sets = {}
+        self.stats = Counter()
+        self.dirty = False
+        self._frame = pd.DataFrame({'pattern_set': pd.Series(dtype=object),
+                                    'matches': pd.Series(dtype=object)},
+                                   index=pd.Index([], dtype='int64', name='desc_hash'))
+        if os.path.exists(path):
+            import pyarrow.parquet as pq
+            table = pq.read_table(path)
+            meta = json.loads((table.schema.metadata or {}).get(b'loker_skill_cache', b'{}'))
+            # Cache dari aturan match lama (misal batas kata \b) tidak dipakai lagi
+            if meta.get('match_rules') == MATCH_RULES_VERSION:
+                self.pattern_sets = meta.get('pattern_sets', {})
+                self._frame = table.to_pandas().set_index('desc_hash')
+            else:
+                self.dirty = True  # Tulis ulang dengan aturan baru saat save()
+
+    def __len__(self):
+        return len(self._frame)
+
+    def _register(self, patterns):
+        set_id = pattern_set_id(patterns)
+        self.pattern_sets.setdefault(set_id, sorted(set(patterns)))
+        return set_id
+
+    def match(self, descriptions, patterns, workers=1, chunk_size=5000):
+        """Per deskripsi -> list pola (dari `patterns`) yang ketemu; hasil identik dengan SkillMatcher."""
+        texts = pd.Series(descriptions, dtype=object).reset_index(drop=True)
+        results = [[] for _ in range(len(texts))]
+        valid = texts.map(lambda t: isinstance(t, str)).to_numpy(dtype=bool)
+        if not valid.any():
+            return results
+
+        wanted = list(dict.fromkeys(patterns))
+        wanted_set = set(wanted)
+        hashes, first, inverse = np.unique(description_hashes(texts[valid]), return_index=True,
+                                           return_inverse=True)
+        uniq_texts = texts[valid].iloc[first].tolist()
+
+        pos = self._frame.index.get_indexer(hashes)
+        cached = pos >= 0
+        set_ids = np.full(len(hashes), '', dtype=object)
+        matches = np.full(len(hashes), '', dtype=object)
+        set_ids[cached] = self._frame['pattern_set'].to_numpy()[pos[cached]]
+        matches[cached] = self._frame['matches'].to_numpy()[pos[cached]]
+
+        changed = np.zeros(len(hashes), dtype=bool)
+        for set_id in pd.unique(set_ids):
+            rows = np.flatnonzero(set_ids == set_id)
+            done = set(self.pattern_sets.get(set_id, ())) if set_id else set()
+            missing = [p for p in wanted if p not in done]
+            if not missing:
+                self.stats['hit'] += len(rows)
+                continue
+            self.stats['partial' if set_id else 'new'] += len(rows)
+
+            found = match_texts([uniq_texts[i] for i in rows], missing, workers, chunk_size)
+            new_id = self._register(done | wanted_set)
+            for i, extra in zip(rows, found):
+                old = matches[i].split(MATCH_SEP) if matches[i] else []
+                matches[i] = MATCH_SEP.join(old + extra)
+            set_ids[rows] = new_id
+            changed[rows] = True
+
+        if changed.any():
+            update = pd.DataFrame({'pattern_set': set_ids[changed], 'matches': matches[changed]},
+                                  index=pd.Index(hashes[changed], name='desc_hash'))
+            self._frame = pd.concat([self._frame[~self._frame.index.isin(update.index)], update])
+            self.dirty = True
+
+        per_hash = [[p for p in m.split(MATCH_SEP) if p in wanted_set] if m else [] for m in matches]
+        for row, slot in zip(np.flatnonzero(valid), inverse.ravel()):
+            results[row] = per_hash[slot]
+        return results
+
+    def save(self):
+        """Tulis cache (hanya kalau ada entri baru/berubah)."""
+        if not self.dirty:
+            return False
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        used = set(self._frame['pattern_set'])
+        meta = {'match_rules': MATCH_RULES_VERSION,
+                'pattern_sets': {k: v for k, v in self.pattern_sets.items() if k in used}}
+        table = pa.Table.from_pandas(self._frame.reset_index(), preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[b'loker_skill_cache'] = json.dumps(meta, ensure_ascii=False).encode('utf-8')
+        tmp_path = self.path + '.tmp'
+        pq.write_table(table.replace_schema_metadata(metadata), tmp_path)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+        return True
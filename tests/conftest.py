@@ -0,0 +1,41 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+from bikin_data_sintetis import generate
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SYNTHETIC_ROWS = 3000
+
+
+@pytest.fixture(scope='session')
+def synthetic_csv(tmp_path_factory):
+    """gsearch_jobs.csv sintetis kecil (seed tetap), dibuat sekali per sesi test."""
+    path = tmp_path_factory.mktemp('data') / 'gsearch_jobs.csv'
+    generate(str(path), SYNTHETIC_ROWS, seed=7, chunk_rows=1000)
+    return str(path)
+
+
+@pytest.fixture(scope='session')
+def synthetic_jobs(synthetic_csv):
+    return pd.read_csv(synthetic_csv)
+
+
+def run_script(script, *args, cwd):
+    """Jalankan script repo sebagai proses terpisah (cwd = folder artefak)."""
+    import subprocess
+    return subprocess.run([sys.executable, os.path.join(REPO_DIR, script), *args], cwd=cwd,
+                          capture_output=True, text=True)
+
+
+@pytest.fixture(scope='session')
+def etl_dir(synthetic_csv, tmp_path_factory):
+    """Folder berisi artefak `bikin_data_lite.py --arrow` dari CSV sintetis (semua baris masuk sampel)."""
+    import shutil
+    folder = tmp_path_factory.mktemp('etl')
+    shutil.copy(synthetic_csv, folder / 'gsearch_jobs.csv')
+    result = run_script('bikin_data_lite.py', '--arrow', cwd=folder)
+    assert result.returncode == 0, result.stdout + result.stderr
+    return folder
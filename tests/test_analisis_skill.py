@@ -0,0 +1,34 @@
+from collections import Counter
+
+import pandas as pd
+
+from analisis_skill import count_skills, frequency_table
+from bikin_data_lite import detect_skills
+from conftest import run_script
+
+
+def _exact_counts(path):
+    counts = Counter()
+    for text in pd.read_csv(path, usecols=['description'])['description'].dropna().astype(str):
+        # Referensi: format kolom required_skills dari ETL, 1 hitungan per lowongan
+        counts.update(skill for skill in detect_skills(text).split(', ') if skill)
+    return counts
+
+
+def test_streaming_counts_match_full_read(synthetic_csv):
+    exact = _exact_counts(synthetic_csv)
+    serial, n_rows = count_skills(synthetic_csv, chunk_size=700, workers=1)
+    parallel, n_parallel = count_skills(synthetic_csv, chunk_size=700, workers=2)
+    n_exact = pd.read_csv(synthetic_csv, usecols=['description'])['description'].notna().sum()
+    assert n_rows == n_parallel == n_exact
+    assert serial == parallel == exact
+
+    table = frequency_table(serial, n_rows)
+    assert table['Jumlah'].is_monotonic_decreasing
+    assert table['Jumlah'].sum() == sum(exact.values())
+
+
+def test_missing_input_exits_non_zero(tmp_path):
+    result = run_script('analisis_skill.py', '--input', 'tidak_ada.csv', '--no-plot', cwd=tmp_path)
+    assert result.returncode == 1
+    assert "❌ Error" in result.stdout
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from bikin_data_lite import add_signatures, detect_skills, extract_skills, scan_rows
+from conftest import run_script
+from dedup import SIGNATURE_COL
+from perf_timer import StageTimer
+from skill_taxonomy import MatchCache
+
+
+def test_parallel_extraction_matches_serial(synthetic_jobs):
+    descriptions = synthetic_jobs['description'].copy()
+    descriptions.iloc[::97] = np.nan  # Deskripsi kosong tetap menghasilkan ""
+    serial = extract_skills(descriptions, workers=1)
+    parallel = extract_skills(descriptions, workers=2, chunk_size=700)
+    pd.testing.assert_series_equal(parallel, serial, check_dtype=False, check_names=False)
+    assert serial.tolist() == [detect_skills(t) for t in descriptions]
+    assert (serial == "").sum() >= descriptions.isna().sum()
+
+
+def test_failed_run_exits_non_zero(tmp_path):
+    # Tidak ada gsearch_jobs.csv di folder kerja -> ETL gagal, exit code harus != 0
+    result = run_script('bikin_data_lite.py', cwd=tmp_path)
+    assert result.returncode == 1
+    assert "❌ Error" in result.stdout
+
+
+@pytest.mark.parametrize('workers, use_cache', [(1, False), (2, False), (2, True)])
+def test_scan_rows_parallel_matches_serial(synthetic_jobs, tmp_path, workers, use_cache):
+    rows = synthetic_jobs.head(1500)
+    expected = add_signatures(rows.assign(required_skills=[detect_skills(t) for t in rows['description']]),
+                              StageTimer('test'))
+    cache = MatchCache(str(tmp_path / 'cache.parquet')) if use_cache else None
+    got = scan_rows(rows.copy(), StageTimer('test'), workers=workers, chunk_size=400, cache=cache)
+    assert got['required_skills'].tolist() == expected['required_skills'].tolist()
+    assert got[SIGNATURE_COL].tolist() == expected[SIGNATURE_COL].tolist()
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from compact_data import compact_frame, memory_report
+
+
+def test_compact_frame_keeps_values_and_shrinks():
+    rng = np.random.default_rng(4)
+    n = 5000
+    df = pd.DataFrame({
+        'via': rng.choice(['via LinkedIn', 'via Indeed', None], n).astype(object),
+        'title': [f"Title {i}" for i in range(n)],
+        'count': rng.integers(0, 200, n).astype('int64'),
+        'salary': np.where(rng.random(n) < 0.5, np.nan, np.round(rng.normal(9e4, 1e4, n), -2)),
+        'precise': rng.random(n),
+        'flag': rng.random(n) < 0.5,
+    })
+    compact = compact_frame(df)
+
+    assert isinstance(compact['via'].dtype, pd.CategoricalDtype)
+    assert compact['count'].dtype == np.uint8
+    assert compact['salary'].dtype == np.float32      # Semua nilai tetap sama di float32
+    assert compact['precise'].dtype == np.float64     # Presisi hilang di float32 -> tidak diturunkan
+    for col in df.columns:
+        np.testing.assert_array_equal(compact[col].astype(object).where(compact[col].notna(), None).to_numpy(),
+                                      df[col].astype(object).where(df[col].notna(), None).to_numpy())
+    assert memory_report(compact)['bytes'].iloc[-1] < memory_report(df)['bytes'].iloc[-1]
+
+
+def test_memory_report_total():
+    df = pd.DataFrame({'a': np.arange(10, dtype='int64'), 'b': ['x'] * 10})
+    report = memory_report(df)
+    assert report['kolom'].tolist() == ['Index', 'a', 'b', 'TOTAL']
+    assert report['bytes'].iloc[-1] == df.memory_usage(deep=True).sum()
+    assert report.loc[report['kolom'] == 'a', 'bytes'].item() == 80
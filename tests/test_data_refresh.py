@@ -0,0 +1,95 @@
+import gc
+import glob
+import os
+
+import pandas as pd
+import pytest
+
+import query_backend
+from data_refresh import DatasetRefresher
+from query_backend import open_backend
+
+ENGINES = ['sqlite', pytest.param('duckdb', marks=pytest.mark.skipif(query_backend.duckdb is None,
+                                                                 reason="duckdb tidak terpasang"))]
+
+
+def _bump_mtime(path):
+    # mtime dimajukan manual supaya perubahan terlihat walau terjadi di tick waktu yang sama
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def _write(path, text):
+    path.write_text(text)
+    _bump_mtime(path)
+
+
+@pytest.fixture
+def artifact(tmp_path):
+    path = tmp_path / 'jobs.txt'
+    _write(path, 'v1')
+    return path
+
+
+def test_swap_waits_until_artifact_is_stable(artifact):
+    refresher = DatasetRefresher(lambda: {'text': artifact.read_text()}, [str(artifact)], interval=0)
+    first = refresher.current()
+    assert first['text'] == 'v1'
+    assert not refresher.check()
+
+    _write(artifact, 'v2')
+    assert not refresher.check()           # Baru terlihat berubah: tunggu satu interval
+    assert refresher.check()               # Sudah stabil: snapshot baru ditukar
+    assert refresher.current()['text'] == 'v2' and refresher.swaps == 1
+    assert first['text'] == 'v1'           # Snapshot lama tidak diubah
+
+
+def test_failed_build_is_retried_only_after_artifact_changes(artifact):
+    calls = []
+
+    def build():
+        calls.append(artifact.read_text())
+        if artifact.read_text() == 'rusak':
+            raise ValueError("artefak rusak")
+        return {'text': artifact.read_text()}
+
+    refresher = DatasetRefresher(build, [str(artifact)], interval=0)
+    refresher.current()
+    _write(artifact, 'rusak')
+    for _ in range(6):
+        assert not refresher.check()
+    assert calls == ['v1', 'rusak']        # Versi rusak dibangun sekali saja
+    assert 'artefak rusak' in refresher.last_error
+    assert refresher.current()['text'] == 'v1'
+
+    _write(artifact, 'v3')
+    assert not refresher.check()
+    assert refresher.check()
+    assert calls == ['v1', 'rusak', 'v3'] and refresher.last_error is None
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_backend_snapshot_keeps_reading_its_own_version(engine, etl_dir, tmp_path):
+    lite = pd.read_parquet(etl_dir / 'gsearch_jobs_lite.parquet')
+    parquet, sqlite = tmp_path / 'jobs.parquet', str(tmp_path / 'jobs.sqlite')
+    lite.head(1000).to_parquet(parquet, index=False)
+    old = open_backend(engine, str(parquet), sqlite, snapshot=True)
+    where = old.where("", list(lite['schedule_type'].unique()), [], None)
+
+    # ETL menulis file baru ke .tmp lalu rename ke path yang sama
+    lite.head(2500).to_parquet(str(parquet) + '.tmp', index=False)
+    os.replace(str(parquet) + '.tmp', parquet)
+    _bump_mtime(parquet)
+    new = open_backend(engine, str(parquet), sqlite, snapshot=True)
+    old._cache.clear()                     # Pastikan benar-benar query ke engine, bukan LRU
+    assert old.count(where) == 1000
+    assert new.count(where) == 2500
+
+    links = glob.glob(str(tmp_path / '*.snap*'))
+    assert len(links) == 2
+    # Snapshot terbaru = hardlink ke file aktif, bukan salinan
+    source = parquet if engine == 'duckdb' else sqlite
+    assert sum(os.path.samefile(link, source) for link in links) == 1
+    del old
+    gc.collect()
+    assert len(glob.glob(str(tmp_path / '*.snap*'))) == 1  # Link snapshot lama dihapus
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dedup import (JACCARD_THRESHOLD, NUM_PERM, SHINGLE_SIZE, _tokens, cluster_ids, minhash_signatures,
+                   unpack_signatures, signature_column)
+
+
+def _shingles(title, company, description):
+    words = _tokens(title, company, description)
+    if len(words) < SHINGLE_SIZE:
+        return set(words)
+    return {tuple(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def _jaccard(a, b):
+    return len(a & b) / len(a | b)
+
+
+@pytest.fixture(scope='module')
+def postings():
+    """200 lowongan dasar + varian near-duplicate (1-2 kata diganti) + varian yang jauh berbeda."""
+    rng = np.random.default_rng(13)
+    vocab = [f"w{i}" for i in range(3000)]
+    rows, family = [], []
+    for base in range(200):
+        words = list(rng.choice(vocab, 120))
+        rows.append((f"Data Analyst {base}", "PT Contoh", " ".join(words)))
+        family.append(base)
+        for _ in range(int(rng.integers(0, 3))):
+            variant = list(words)
+            for pos in rng.choice(len(variant), int(rng.integers(1, 3)), replace=False):
+                variant[pos] = str(rng.choice(vocab))
+            rows.append((f"Data Analyst {base}", "PT Contoh", " ".join(variant)))
+            family.append(base)
+        # Judul & perusahaan sama, deskripsi separuhnya lain -> BUKAN duplikat
+        other = words[:60] + list(rng.choice(vocab, 60))
+        rows.append((f"Data Analyst {base}", "PT Contoh", " ".join(other)))
+        family.append(-1 - base)
+    return rows, np.array(family)
+
+
+def test_clusters_match_exact_jaccard(postings):
+    rows, family = postings
+    ids = cluster_ids(minhash_signatures(*zip(*rows)))
+    shingles = [_shingles(*r) for r in rows]
+
+    # Pasangan dengan Jaccard exact jauh di atas / di bawah threshold harus terpisah dengan benar
+    checked = 0
+    for i in range(len(rows)):
+        for j in range(i + 1, min(i + 5, len(rows))):
+            similarity = _jaccard(shingles[i], shingles[j])
+            if similarity >= 0.9:
+                assert ids[i] == ids[j], (i, j, similarity)
+                checked += 1
+            elif similarity <= JACCARD_THRESHOLD - 0.3:
+                assert ids[i] != ids[j], (i, j, similarity)
+    assert checked > 50
+    # Tiap keluarga near-duplicate = tepat satu cluster
+    assert len(np.unique(ids)) == len(np.unique(family))
+
+
+def test_cluster_ids_do_not_depend_on_row_order(postings):
+    rows, _ = postings
+    signatures = minhash_signatures(*zip(*rows))
+    ids = cluster_ids(signatures)
+    order = np.random.default_rng(4).permutation(len(rows))
+    np.testing.assert_array_equal(cluster_ids(signatures[order]), ids[order])
+
+
+def test_rows_without_text_get_distinct_ids():
+    rows = [("Data Analyst", "PT A", "sql python excel"), (None, None, None), (None, None, ""),
+            ("Data Analyst", "PT A", "sql python excel"), (None, None, None)]
+    signatures = minhash_signatures(*zip(*rows))
+    assert not signatures[[1, 2, 4]].any()
+    ids = cluster_ids(signatures)
+    assert ids[0] == ids[3]  # Teks identik -> satu cluster
+    assert ids[[1, 2, 4]].tolist() == [-2, -3, -5]
+    assert len(set(ids.tolist())) == 4
+
+
+def test_signature_column_roundtrip(postings):
+    rows, _ = postings
+    frame = pd.DataFrame(rows[:50], columns=['title', 'company_name', 'description'])
+    packed = signature_column(frame)
+    unpacked = unpack_signatures(packed.tolist())
+    assert unpacked.shape == (50, NUM_PERM)
+    np.testing.assert_array_equal(unpacked, minhash_signatures(*zip(*rows[:50]), batch_size=7))
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+
+from conftest import run_script
+from etl_manifest import KEY_COL, hash_rows, in_sample, needs_scan, posting_hashes, read_manifest
+from rollups import TABLES, read_rollups
+
+
+def test_hash_stable_across_parsed_types(tmp_path):
+    # Chunk pertama salary tanpa NaN (int64), chunk kedua ada NaN (float64)
+    path = tmp_path / 'jobs.csv'
+    pd.DataFrame({
+        'job_id': ['a', 'b', 'c', 'a', 'b', 'd'],
+        'salary_yearly': ['95000', '80000', '70000', '95000', '80000', ''],
+        'work_from_home': ['True', 'True', 'True', 'True', 'True', ''],
+    }).to_csv(path, index=False)
+    chunks = list(pd.read_csv(path, chunksize=3))
+    assert chunks[0]['salary_yearly'].dtype != chunks[1]['salary_yearly'].dtype
+
+    whole = hash_rows(pd.read_csv(path))
+    chunked = np.concatenate([hash_rows(c) for c in chunks])
+    assert (chunked == whole).all()
+    assert chunked[0] == chunked[3] and chunked[1] == chunked[4]
+    assert len(set(chunked[[0, 1, 2, 5]])) == 4
+
+
+def test_needs_scan_marks_new_and_changed_rows(synthetic_jobs):
+    rows = synthetic_jobs.head(200)
+    id_cols, content_cols = ['job_id'], ['title', 'description', 'salary_yearly']
+    keys, content = posting_hashes(rows, id_cols, content_cols)
+    manifest = pd.DataFrame({KEY_COL: keys[:150], 'content_hash': content[:150]})
+    assert needs_scan(None, keys, content).all()
+
+    edited = rows.copy()
+    edited.loc[edited.index[[3, 40]], 'description'] += ' Edited.'
+    keys2, content2 = posting_hashes(edited, id_cols, content_cols)
+    assert (keys2 == keys).all()  # Isi berubah, identitas tetap
+
+    expected = np.zeros(len(rows), dtype=bool)
+    expected[[3, 40]] = True   # Berubah
+    expected[150:] = True      # Belum ada di manifest
+    assert (needs_scan(manifest, keys2, content2) == expected).all()
+
+
+def test_in_sample_is_deterministic(synthetic_jobs):
+    keys = hash_rows(synthetic_jobs[['job_id']])
+    picked = in_sample(keys, 0.3)
+    assert (picked == in_sample(keys.copy(), 0.3)).all()
+    assert abs(picked.mean() - 0.3) < 0.05
+    # Rate lebih besar = superset: lowongan yang sudah masuk sampel tidak keluar
+    assert (in_sample(keys, 0.5) | ~picked).all()
+    assert in_sample(keys, 1.0).all()
+
+
+def _sorted(frame):
+    return frame.sort_values(KEY_COL).reset_index(drop=True)
+
+
+def test_incremental_run_matches_full_rebuild(synthetic_csv, tmp_path):
+    jobs = pd.read_csv(synthetic_csv)
+    inc, full = tmp_path / 'inc', tmp_path / 'full'
+    inc.mkdir()
+    full.mkdir()
+
+    jobs.iloc[:2500].to_csv(inc / 'gsearch_jobs.csv', index=False)
+    assert run_script('bikin_data_lite.py', '--incremental', cwd=inc).returncode == 0
+
+    # Run berikutnya: 100 deskripsi berubah, 200 lowongan hilang, 500 lowongan baru
+    changed = jobs.drop(index=range(200, 400)).copy()
+    changed.loc[changed.index[:100], 'description'] += ' Experience with Snowflake and dbt.'
+    changed.to_csv(inc / 'gsearch_jobs.csv', index=False)
+    changed.to_csv(full / 'gsearch_jobs.csv', index=False)
+    result = run_script('bikin_data_lite.py', '--incremental', cwd=inc)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "Mode inkremental" in result.stdout
+    # Pembanding: run pertama di folder kosong = full rebuild dari CSV yang sama
+    assert run_script('bikin_data_lite.py', '--incremental', cwd=full).returncode == 0
+
+    got = _sorted(pd.read_parquet(inc / 'gsearch_jobs_lite.parquet'))
+    expected = _sorted(pd.read_parquet(full / 'gsearch_jobs_lite.parquet'))
+    pd.testing.assert_frame_equal(got[expected.columns], expected, check_dtype=False, check_categorical=False)
+
+    manifest, meta = read_manifest(inc / 'gsearch_jobs_manifest.parquet')
+    assert len(manifest) == len(changed)
+    assert meta['sample_rate'] == 1.0
+
+    got_rollups = read_rollups({name: inc / f'gsearch_jobs_rollup_{name}.parquet' for name in TABLES})
+    expected_rollups = read_rollups({name: full / f'gsearch_jobs_rollup_{name}.parquet' for name in TABLES})
+    for name in TABLES:
+        keys = [c for c in expected_rollups[name].columns if c != 'count']
+        a = got_rollups[name].sort_values(keys).reset_index(drop=True)
+        b = expected_rollups[name].sort_values(keys).reset_index(drop=True)
+        pd.testing.assert_frame_equal(a, b, check_dtype=False)
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from filter_pipeline import FilterPipeline
+from title_index import TitleIndex
+
+
+@pytest.fixture(scope='module')
+def lite(etl_dir):
+    return pd.read_parquet(etl_dir / 'gsearch_jobs_lite.parquet')
+
+
+def _naive(df, search, schedule_types, platforms, remote):
+    # Filter lama dashboard: salin lalu saring berurutan
+    out = df.copy()
+    if search:
+        out = out[out['title'].astype(object).str.contains(search, case=False, na=False)]
+    out = out[out['schedule_type'].isin(schedule_types)]
+    if platforms:
+        out = out[out['via'].isin(platforms)]
+    if remote is True:
+        out = out[out['work_from_home'] == True]
+    elif remote is False:
+        out = out[out['work_from_home'] != True]
+    return out
+
+
+def _cases(df, n=30, seed=2):
+    rng = np.random.default_rng(seed)
+    schedules = list(df['schedule_type'].unique())
+    platforms = df['via'].dropna().unique().tolist()
+    for _ in range(n):
+        yield (["", "analyst", "Data Sci", "senior"][int(rng.integers(4))],
+               [s for s in schedules if rng.random() < 0.7],
+               [p for p in platforms if rng.random() < 0.3],
+               [None, True, False][int(rng.integers(3))])
+
+
+@pytest.mark.parametrize('with_index', [True, False])
+def test_select_matches_naive_filter(lite, with_index):
+    pipeline = FilterPipeline(lite, TitleIndex(lite['title']) if with_index else None)
+    for search, sched, via, remote in _cases(lite):
+        got = pipeline.select(search, sched, via, remote)
+        expected = _naive(lite, search, sched, via, remote)
+        pd.testing.assert_index_equal(got.index, expected.index)
+
+
+def test_lru_memo_and_key_normalisation(lite):
+    pipeline = FilterPipeline(lite, maxsize=2)
+    schedules = list(lite['schedule_type'].unique())
+    platforms = lite['via'].dropna().unique().tolist()[:3]
+
+    _, first = pipeline.select_rows("", schedules, platforms)
+    # Urutan pilihan multiselect tidak berpengaruh -> posisi dari memo yang sama
+    assert pipeline.select_rows("", schedules[::-1], platforms[::-1])[1] is first
+    # Semua baris lolos -> DataFrame asli tanpa salinan
+    assert pipeline.select("", schedules, []) is lite
+
+    pipeline.select("analyst", schedules, [])
+    assert len(pipeline._cache) == 2
+    # Cache hanya berisi posisi baris, bukan DataFrame hasil
+    assert all(v is None or isinstance(v, np.ndarray) for v in pipeline._cache.values())
+    assert pipeline.select_rows("", schedules, platforms)[1] is not first  # Sudah tergusur (LRU)
+
+
+def test_select_rows_returns_positions(lite):
+    # Index non-default: posisi harus tetap posisi baris, bukan label index
+    shuffled = lite.sample(frac=1, random_state=3)
+    pipeline = FilterPipeline(shuffled)
+    schedules = list(lite['schedule_type'].unique())
+    assert pipeline.select_rows("", schedules, [])[1] is None
+    for search, sched, via, remote in _cases(lite, n=10):
+        frame, positions = pipeline.select_rows(search, sched, via, remote)
+        if positions is None:
+            assert frame is shuffled
+            continue
+        pd.testing.assert_frame_equal(shuffled.iloc[positions], frame)
+        np.testing.assert_array_equal(positions, shuffled.index.get_indexer(frame.index))
+        pd.testing.assert_frame_equal(pipeline.select(search, sched, via, remote), frame)
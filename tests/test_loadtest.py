@@ -0,0 +1,32 @@
+import numpy as np
+
+from loadtest_loker import _percentiles, max_sessions_within, run_level
+
+
+def _level(sessions, p95, errors=0):
+    return {'sessions': sessions, 'p95_ms': p95, 'errors': errors}
+
+
+def test_max_sessions_within_slo():
+    levels = [_level(1, 120.0), _level(2, 480.0), _level(4, 900.0, errors=1), _level(8, 1500.0)]
+    assert max_sessions_within(levels, 1000.0) == 2   # Level 4 ada error, level 8 lewat SLO
+    assert max_sessions_within(levels, 100.0) == 0
+    assert max_sessions_within([_level(1, None)], 1000.0) == 0
+
+
+def test_percentiles_in_ms():
+    seconds = np.random.default_rng(1).exponential(0.2, 500)
+    got = _percentiles(seconds.tolist())
+    for key, q in [('p50_ms', 50), ('p95_ms', 95), ('p99_ms', 99)]:
+        assert got[key] == round(np.percentile(seconds * 1000, q), 1)
+    assert _percentiles([]) == {'p50_ms': None, 'p95_ms': None, 'p99_ms': None}
+
+
+def test_concurrent_sessions_run_without_errors(etl_dir, monkeypatch):
+    # Dashboard dijalankan sungguhan (AppTest) di atas artefak ETL sintetis
+    monkeypatch.chdir(etl_dir)
+    monkeypatch.setenv('LOKER_REFRESH_S', '0')
+    level = run_level(2, 4, think_ms=0, timeout=120, seed=3)
+    assert level['errors'] == 0, level['error_samples']
+    assert level['reruns'] >= 2 * (1 + 4)  # Buka dashboard + minimal satu rerun per aksi
+    assert sum(a['reruns'] for a in level['by_action'].values()) == level['reruns']
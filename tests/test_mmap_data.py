@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from compact_data import compact_frame
+from mmap_data import read_mmap_data, write_mmap_data
+
+
+@pytest.fixture(scope='module')
+def lite(etl_dir):
+    return pd.read_parquet(etl_dir / 'gsearch_jobs_lite.parquet')
+
+
+def _plain(s):
+    return s.astype(object).where(s.notna(), None).tolist()
+
+
+def test_roundtrip_matches_parquet(lite, etl_dir):
+    mapped = read_mmap_data(str(etl_dir / 'gsearch_jobs_lite.arrow'))
+    expected = compact_frame(lite)
+    assert list(mapped.columns) == list(expected.columns)
+    for col in expected.columns:
+        if pd.api.types.is_datetime64_any_dtype(expected[col]):
+            assert mapped[col].dtype == 'datetime64[ns]', col  # Disimpan sebagai int64 nanodetik
+        elif not isinstance(mapped[col].dtype, pd.StringDtype):
+            assert mapped[col].dtype == expected[col].dtype, col
+        assert _plain(mapped[col]) == _plain(expected[col]), col
+
+
+def test_columns_point_into_the_mapping(tmp_path):
+    df = pd.DataFrame({
+        'salary': [95000.0, np.nan, 70000.0],
+        'remote': [True, False, True],
+        'posted': pd.to_datetime(['2024-01-02', None, '2024-03-04']),
+        'via': pd.Categorical(['via LinkedIn', None, 'via Indeed']),
+        'title': ['Data Analyst', None, 'BI Analyst'],
+    })
+    path = str(tmp_path / 'jobs.arrow')
+    write_mmap_data(df, path)
+    mapped = read_mmap_data(path)
+
+    for col in ['salary', 'remote', 'posted']:
+        values = mapped[col].to_numpy()
+        assert not values.flags.writeable and not values.flags.owndata, col  # View ke halaman mmap
+    assert not mapped['via'].cat.codes.to_numpy().flags.writeable
+    assert _plain(mapped['title']) == _plain(df['title'])
+    assert mapped['posted'].isna().tolist() == [False, True, False]
+
+    # File baru di-rename ke path yang sama: frame lama tetap membaca versi lamanya
+    write_mmap_data(df.assign(salary=[1.0, 2.0, 3.0]), path)
+    assert mapped['salary'].iloc[0] == 95000.0
+    assert read_mmap_data(path)['salary'].tolist() == [1.0, 2.0, 3.0]
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from overview_cube import GROUP_COLS, TOP_DIMS, build_cube, cell_mask, overview_from_rows, query_cube
+
+
+@pytest.fixture(scope='module')
+def lite(etl_dir):
+    return pd.read_parquet(etl_dir / 'gsearch_jobs_lite.parquet')
+
+
+def _filter_cases(lite, n=40, seed=5):
+    rng = np.random.default_rng(seed)
+    schedules = list(lite['schedule_type'].unique())
+    platforms = lite['via'].dropna().unique().tolist()
+    yield schedules, [], None
+    for _ in range(n):
+        sched = [s for s in schedules if rng.random() < 0.7] or schedules[:1]
+        via = [p for p in platforms if rng.random() < 0.3]
+        yield sched, via, [None, True, False][int(rng.integers(3))]
+
+
+def test_query_cube_matches_rows(lite):
+    cells, top = build_cube(lite)
+    for sched, via, remote in _filter_cases(lite):
+        rows = lite[cell_mask(lite, sched, via, remote).to_numpy(dtype=bool)]
+        got = query_cube(cells, top, sched, via, remote)
+        expected = overview_from_rows(rows)
+        assert got['total'] == expected['total']
+        assert got['avg_salary'] == pytest.approx(expected['avg_salary'] or 0, rel=1e-12)
+        if len(rows):
+            via_counts = rows['via'].value_counts()
+            assert via_counts[got['platform_top']] == via_counts.max()
+        for dim in TOP_DIMS:
+            exact = rows[dim].value_counts()
+            assert got[dim].tolist() == expected[dim].tolist()
+            assert all(exact[name] == count for name, count in got[dim].items())
+
+
+def test_cube_size_is_bounded_per_cell(lite):
+    cells, top = build_cube(lite, top_n=3)
+    per_cell = top.groupby(GROUP_COLS + ['dimension'], observed=True, dropna=False).size()
+    assert per_cell.max() <= 3
+    assert len(top) <= len(cells) * 3 * len(TOP_DIMS)
+    # Yang disimpan memang nilai terbanyak di selnya: count terkecil yang disimpan
+    # = count terbesar ke-3 di sel itu (hitung exact dari baris)
+    for dim in TOP_DIMS:
+        exact = lite.groupby(GROUP_COLS + [dim], observed=True, dropna=False).size()
+        third = exact[exact > 0].groupby(level=GROUP_COLS, dropna=False).apply(lambda c: c.nlargest(3).min())
+        stored = top[top['dimension'] == dim].groupby(GROUP_COLS, observed=True, dropna=False)['count'].min()
+        assert len(stored) == len(third)
+        assert sorted(stored.tolist()) == sorted(third.tolist())
+
+
+def test_cube_has_no_distinct_counts(lite):
+    cells, top = build_cube(lite)
+    result = query_cube(cells, top, list(lite['schedule_type'].unique()), [])
+    assert not {'comp_unique', 'loc_unique', 'job_unique', 'salary_quantiles'} & set(result)
@@ -0,0 +1,31 @@
+import json
+import logging
+
+from perf_timer import StageTimer
+
+
+def test_stages_accumulate_and_report():
+    timer = StageTimer('unit')
+    timer.add('extract', 0.5, rows=1000)
+    timer.add('extract', 0.5, rows=1000)  # Nama sama dijumlahkan (misal per chunk)
+    with timer.stage('write'):
+        pass
+    timer.lap('tail', rows=10)
+
+    report = timer.report()
+    stages = {s['stage']: s for s in report['stages']}
+    assert report['run'] == 'unit'
+    assert stages['extract'] == {'stage': 'extract', 'ms': 1000.0, 'rows': 2000, 'rows_per_s': 2000.0}
+    assert 'rows' not in stages['write']
+    assert list(stages) == ['extract', 'write', 'tail']
+
+
+def test_log_writes_one_json_line(caplog):
+    logger = logging.getLogger('loker.perf.test')
+    logger.setLevel(logging.INFO)
+    timer = StageTimer('unit')
+    timer.add('read', 0.25, rows=100)
+    with caplog.at_level(logging.INFO, logger='loker.perf.test'):
+        payload = timer.log(logger, mode='full')
+    assert payload['mode'] == 'full'
+    assert json.loads(caplog.records[-1].getMessage())['stages'][0]['rows_per_s'] == 400.0
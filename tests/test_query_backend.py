@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_explorer import get_page
+from filter_pipeline import FilterPipeline
+from overview_cube import overview_from_rows
+import query_backend
+from query_backend import open_backend
+from salary_stats import salary_histogram, salary_summary, valid_salaries
+from skill_matcher import skill_columns
+from title_index import TitleIndex
+
+ENGINES = ['sqlite', pytest.param('duckdb', marks=pytest.mark.skipif(query_backend.duckdb is None,
+                                                                 reason="duckdb tidak terpasang"))]
+
+
+@pytest.fixture(scope='module')
+def lite(etl_dir):
+    return pd.read_parquet(etl_dir / 'gsearch_jobs_lite.parquet')
+
+
+@pytest.fixture(scope='module', params=ENGINES)
+def backend(request, etl_dir, tmp_path_factory):
+    sqlite_path = str(tmp_path_factory.mktemp('sqlite') / 'jobs.sqlite')
+    return open_backend(request.param, str(etl_dir / 'gsearch_jobs_lite.parquet'), sqlite_path)
+
+
+def _cases(lite, n=12, seed=9):
+    rng = np.random.default_rng(seed)
+    schedules = list(lite['schedule_type'].unique())
+    platforms = lite['via'].dropna().unique().tolist()
+    yield "", schedules, [], None
+    yield "c++", schedules, [], None       # Regex tidak valid -> literal
+    yield "analyst|scientist", schedules, [], True
+    for _ in range(n):
+        yield (["", "analyst", "Senior"][int(rng.integers(3))],
+               [s for s in schedules if rng.random() < 0.7],
+               [p for p in platforms if rng.random() < 0.4],
+               [None, True, False][int(rng.integers(3))])
+
+
+@pytest.mark.filterwarnings('ignore:This pattern is interpreted as a regular expression')
+def test_backend_matches_pandas(lite, backend):
+    assert backend.n_rows == len(lite)
+    assert backend.schedule_options() == [None if pd.isna(v) else v for v in lite['schedule_type'].unique()]
+    pipeline = FilterPipeline(lite, TitleIndex(lite['title']))
+    for args in _cases(lite):
+        rows = pipeline.select(*args)
+        where = backend.where(*args)
+        assert backend.count(where) == len(rows), args
+
+        got, expected = backend.overview(where), overview_from_rows(rows)
+        for key in ['total', 'comp_unique', 'loc_unique', 'job_unique']:
+            assert got[key] == expected[key], (args, key)
+        assert got['avg_salary'] == pytest.approx(expected['avg_salary'] or 0, rel=1e-9)
+        for dim in ['location', 'company_name']:
+            # Urutan nilai yang seri bisa beda antar engine -> bandingkan jumlahnya
+            assert got[dim].tolist() == expected[dim].tolist(), (args, dim)
+
+        totals = rows[skill_columns(rows)].sum()
+        skills = backend.skill_totals(where, top_n=100)
+        assert skills.to_dict() == totals[totals > 0].astype('int64').to_dict()
+
+        values = valid_salaries(rows)
+        summary = backend.salary_summary(where)
+        assert summary.keys() == salary_summary(values).keys()
+        for label, value in salary_summary(values).items():
+            assert summary[label] == pytest.approx(value, rel=1e-9)
+        hist = backend.salary_histogram(where, bins=20)
+        assert hist['count'].tolist() == salary_histogram(values, bins=20)['count'].tolist()
+
+        cols = ['title', 'salary_yearly', 'date_time']
+        page = backend.page(where, cols, 'salary_yearly', False, page=2, page_size=25)
+        want = get_page(rows, cols, 'salary_yearly', False, page=2, page_size=25)
+        np.testing.assert_array_equal(page['salary_yearly'].to_numpy(), want['salary_yearly'].to_numpy())
+        exported = pd.concat(list(backend.iter_frames(where, cols, chunk_rows=500)) or [pd.DataFrame()])
+        assert len(exported) == len(rows)
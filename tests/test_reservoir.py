@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+import bikin_data_lite
+from bikin_data_lite import reservoir_picks, stream_sample
+
+
+def _reference(chunk_sizes, sample_size, seed):
+    # Algorithm R baris per baris, dengan angka acak yang sama (1 per baris, urut)
+    rng = np.random.default_rng(seed)
+    reservoir, seen = {}, 0
+    for n in chunk_sizes:
+        draws = rng.integers(0, np.arange(seen, seen + n) + 1)
+        for offset, j in enumerate(draws):
+            i = seen + offset
+            slot = i if i < sample_size else j
+            if slot < sample_size:
+                reservoir[slot] = i
+        seen += n
+    return reservoir
+
+
+def _run(chunk_sizes, sample_size, seed):
+    rng = np.random.default_rng(seed)
+    reservoir, seen = {}, 0
+    for n in chunk_sizes:
+        picked = reservoir_picks(rng, seen, n, sample_size)
+        reservoir.update({int(slot): seen + int(row) for slot, row in picked.items()})
+        seen += n
+    return reservoir
+
+
+def test_reservoir_matches_row_by_row_algorithm_r():
+    for chunk_sizes, sample_size in [([7] * 30, 10), ([1, 50, 3, 200], 25), ([5], 10), ([40, 40], 40)]:
+        assert _run(chunk_sizes, sample_size, seed=3) == _reference(chunk_sizes, sample_size, seed=3)
+
+
+def test_reservoir_inclusion_is_uniform():
+    n_rows, sample_size, trials = 50, 10, 2000
+    counts = np.zeros(n_rows)
+    for seed in range(trials):
+        counts[list(_run([20, 20, 9, 1], sample_size, seed).values())] += 1
+    freq = counts / trials
+    # Peluang tiap baris = 10/50; galat standar binomial ~0,009 -> batas 5 sigma
+    assert np.abs(freq - sample_size / n_rows).max() < 5 * np.sqrt(0.2 * 0.8 / trials)
+
+
+def test_stream_sample_independent_of_chunk_size(synthetic_csv):
+    small = stream_sample(synthetic_csv, sample_size=400, read_chunk_size=250)
+    large = stream_sample(synthetic_csv, sample_size=400, read_chunk_size=1300)
+    assert len(small) == 400
+    pd.testing.assert_frame_equal(small, large)
+
+    # Sama dengan Algorithm R baris per baris di atas seluruh file
+    expected = _reference([3000], 400, seed=bikin_data_lite.RANDOM_STATE)
+    full = pd.read_csv(synthetic_csv)
+    rows = [expected[slot] for slot in sorted(expected)]
+    assert small['date_time'].tolist() == full['date_time'].iloc[rows].tolist()
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from overview_cube import cell_mask
+from rollups import SALARY_BIN_WIDTH, TABLES, _bucket, build_rollups, merge_rollups, query_trend
+from skill_matcher import SKILL_PREFIX
+
+
+@pytest.fixture(scope='module')
+def lite(etl_dir):
+    return pd.read_parquet(etl_dir / 'gsearch_jobs_lite.parquet')
+
+
+def _assert_same(got, expected):
+    for name in TABLES:
+        keys = [c for c in expected[name].columns if c != 'count']
+        a = got[name].sort_values(keys).reset_index(drop=True)
+        b = expected[name].sort_values(keys).reset_index(drop=True)
+        pd.testing.assert_frame_equal(a, b, check_dtype=False)
+
+
+def test_merge_equals_rebuild(lite):
+    rng = np.random.default_rng(11)
+    part = rng.random(len(lite)) < 0.4
+    a, b = lite[part], lite[~part]
+    full = merge_rollups(None, build_rollups(lite))  # Bentuk kanonik (terurut, tanpa count 0)
+
+    _assert_same(merge_rollups(build_rollups(a), build_rollups(b)), full)
+    # sign=-1: buang baris lama, hasilnya sama dengan rollup yang dibangun ulang tanpa baris itu
+    _assert_same(merge_rollups(full, build_rollups(b), sign=-1), merge_rollups(None, build_rollups(a)))
+    # Semua baris dibuang -> rollup kosong (baris count 0 dihapus)
+    empty = merge_rollups(full, build_rollups(lite), sign=-1)
+    assert all(empty[name].empty for name in TABLES)
+
+
+def test_query_trend_matches_rows(lite):
+    rollups = build_rollups(lite)
+    schedules = list(lite['schedule_type'].unique())
+    platforms = lite['via'].dropna().unique().tolist()
+    for grain in ['daily', 'weekly']:
+        for sched, via, remote in [(schedules, [], None), (schedules[:1], platforms[:3], None),
+                                   (schedules, [], True)]:
+            rows = lite[cell_mask(lite, sched, via, remote).to_numpy(dtype=bool) & lite['date_time'].notna()]
+            trend, skills = query_trend(rollups, grain, sched, via, remote, top_skills=3)
+            bucket = _bucket(rows['date_time'], grain)
+
+            counts = trend.set_index('bucket')['count']
+            exact = rows.groupby(bucket).size()
+            assert counts.sum() == len(rows)
+            assert (counts.reindex(exact.index) == exact).all()
+
+            salary = rows['salary_yearly'].where(rows['salary_yearly'] > 0)
+            exact_median = salary.groupby(bucket).median().dropna()
+            got_median = trend.set_index('bucket')['median_salary'].reindex(exact_median.index)
+            # Median dari histogram: galat maksimal setengah lebar bin
+            assert (got_median - exact_median).abs().max() <= SALARY_BIN_WIDTH / 2
+
+            skill_total = skills.groupby('skill')['count'].sum()
+            exact_skills = rows.filter(like=SKILL_PREFIX).sum()
+            assert len(skill_total) == 3
+            assert sorted(skill_total, reverse=True) == exact_skills.nlargest(3).tolist()
+            for name, total in skill_total.items():
+                assert exact_skills[SKILL_PREFIX + name] == total
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from salary_stats import MAX_ADAPTIVE_BINS, QUANTILES, salary_histogram, salary_summary, valid_salaries
+
+
+def _values(seed=1, n=5000):
+    rng = np.random.default_rng(seed)
+    return np.round(rng.lognormal(np.log(95_000), 0.35, n), -2)
+
+
+def test_valid_salaries_drops_nan_and_zero():
+    df = pd.DataFrame({'salary_yearly': [np.nan, 0.0, -5.0, 100.0, 250.0]})
+    assert valid_salaries(df).tolist() == [100.0, 250.0]
+    assert len(valid_salaries(pd.DataFrame({'x': [1]}))) == 0
+
+
+def test_summary_matches_pandas():
+    values = _values()
+    summary = salary_summary(values)
+    series = pd.Series(values)
+    assert summary['Tertinggi'] == series.max() and summary['Terendah'] == series.min()
+    assert np.isclose(summary['Rata-rata'], series.mean())
+    for label, q in QUANTILES.items():
+        assert summary[label] == series.quantile(q)
+    assert salary_summary(np.empty(0)) == {}
+
+
+def test_histogram_counts_every_value():
+    values = _values()
+    for mode in ['fixed', 'adaptive']:
+        hist = salary_histogram(values, bins=30, mode=mode)
+        assert hist['count'].sum() == len(values)
+        assert hist['start'].iloc[0] == values.min() and hist['end'].iloc[-1] == values.max()
+        assert np.allclose(hist['start'].iloc[1:].to_numpy(), hist['end'].iloc[:-1].to_numpy())
+        # Jumlah per bin sama dengan hitung manual (bin terakhir inklusif kanan)
+        edges = np.r_[hist['start'].to_numpy(), hist['end'].iloc[-1]]
+        manual = [((values >= lo) & ((values < hi) if i < len(hist) - 1 else (values <= hi))).sum()
+                  for i, (lo, hi) in enumerate(zip(edges[:-1], edges[1:]))]
+        assert hist['count'].tolist() == manual
+    assert len(salary_histogram(values, bins=30)) == 30
+    assert len(salary_histogram(values, mode='adaptive')) <= MAX_ADAPTIVE_BINS
@@ -0,0 +1,102 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmark_loker import sketch_errors
+from overview_cube import cell_mask
+from salary_stats import QUANTILES, valid_salaries
+from sketches import (DISTINCT_KEYS, HLL_ERROR_BOUND, TDIGEST_RANK_ERROR_BOUND, HyperLogLog, TDigest,
+                      build_sketches, query_sketches)
+
+
+def _rank_error(sorted_values, estimate, q):
+    """Jarak q ke rank perkiraan, dengan konvensi np.quantile (rank = posisi / (n - 1)).
+
+    Nilai di antara dua elemen diberi posisi pecahan (interpolasi linear); nilai
+    kembar menempati rentang posisi, jadi np.quantile sendiri selalu bergalat 0.
+    """
+    n = len(sorted_values)
+    if n == 1:
+        return 0.0
+    first = np.searchsorted(sorted_values, estimate, side='left')
+    last = np.searchsorted(sorted_values, estimate, side='right') - 1
+    if first > last:  # Di antara sorted_values[last] dan sorted_values[first]
+        lo, hi = sorted_values[last], sorted_values[first]
+        first = last = last + (estimate - lo) / (hi - lo)
+    return max(first / (n - 1) - q, q - last / (n - 1), 0.0)
+
+
+@pytest.mark.parametrize('n', [50, 2_000, 30_000, 300_000])
+def test_hll_relative_error_within_bound(n):
+    rng = np.random.default_rng(n)
+    values = rng.integers(0, 2**62, n)
+    values = np.concatenate([values, values[: n // 3]])  # Duplikat tidak menambah hitungan
+    estimate = HyperLogLog().add([f"company-{v}" for v in values]).count()
+    assert abs(estimate / n - 1) <= HLL_ERROR_BOUND
+    if n <= 50:
+        assert estimate == n  # Kardinalitas kecil: praktis exact
+
+
+def test_hll_merge_equals_union():
+    rng = np.random.default_rng(3)
+    a, b = rng.integers(0, 10**9, 20_000), rng.integers(0, 10**9, 15_000)
+    b[:5000] = a[:5000]  # Irisan
+    merged = HyperLogLog().add(a).merge(HyperLogLog().add(b))
+    union = HyperLogLog().add(np.concatenate([a, b]))
+    np.testing.assert_array_equal(merged.registers, union.registers)
+    assert HyperLogLog.from_bytes(merged.to_bytes()).count() == union.count()
+    assert abs(union.count() / len(np.unique(np.concatenate([a, b]))) - 1) <= HLL_ERROR_BOUND
+
+
+def test_tdigest_rank_error_within_bound():
+    rng = np.random.default_rng(21)
+    values = np.round(rng.lognormal(11.4, 0.45, 200_000), -2)
+    # Digest per partisi lalu di-merge, seperti query_sketches
+    digest = TDigest.merge_all([TDigest.from_values(part) for part in np.array_split(values, 37)])
+    qs = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+    estimates = TDigest.from_bytes(digest.to_bytes()).quantile(qs)
+    ordered = np.sort(values)
+    for q, estimate in zip(qs, estimates):
+        assert _rank_error(ordered, estimate, q) <= TDIGEST_RANK_ERROR_BOUND
+    assert digest.min == values.min() and digest.max == values.max()
+    assert digest.count == len(values)
+
+
+def test_tdigest_small_input_is_exact():
+    values = np.random.default_rng(2).normal(9e4, 2e4, 80)
+    qs = np.linspace(0, 1, 21)
+    np.testing.assert_allclose(TDigest.from_values(values).quantile(qs), np.quantile(values, qs))
+
+
+def test_query_sketches_against_exact_counts(etl_dir):
+    lite = pd.read_parquet(etl_dir / 'gsearch_jobs_lite.parquet')
+    sketches = build_sketches(lite)
+    rng = np.random.default_rng(8)
+    schedules = list(lite['schedule_type'].unique())
+    platforms = lite['via'].dropna().unique().tolist()
+    cases = [(schedules, [], None)] + [
+        ([s for s in schedules if rng.random() < 0.7] or schedules[:1],
+         [p for p in platforms if rng.random() < 0.4], [None, True, False][int(rng.integers(3))])
+        for _ in range(25)]
+
+    for sched, via, remote in cases:
+        rows = lite[cell_mask(lite, sched, via, remote).to_numpy(dtype=bool)]
+        approx = query_sketches(sketches, sched, via, remote, QUANTILES)
+        for dim, key in DISTINCT_KEYS.items():
+            exact = rows[dim].nunique()
+            assert abs(approx[key] - exact) <= max(HLL_ERROR_BOUND * exact, 1), (dim, exact, approx[key])
+        salaries = np.sort(valid_salaries(rows))
+        if len(salaries):
+            for label, q in QUANTILES.items():
+                assert _rank_error(salaries, approx['salary_quantiles'][label], q) <= TDIGEST_RANK_ERROR_BOUND
+        else:
+            assert 'salary_quantiles' not in approx
+
+
+def test_benchmark_sketch_errors_are_json_ready(etl_dir):
+    lite = pd.read_parquet(etl_dir / 'gsearch_jobs_lite.parquet')
+    errors = sketch_errors(lite, build_sketches(lite), list(lite['schedule_type'].unique()))
+    assert json.loads(json.dumps(errors)) == errors  # Ditulis ke benchmark_results.jsonl
+    assert errors['within_bounds'] is True
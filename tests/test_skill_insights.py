@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from filter_pipeline import FilterPipeline
+from skill_insights import SkillInsights
+from skill_matcher import SKILL_PREFIX
+
+N_SKILLS = 70  # > 64 skill: bitmask pola 2 word
+
+
+@pytest.fixture(scope='module')
+def jobs():
+    rng = np.random.default_rng(17)
+    n = 6000
+    popularity = rng.uniform(0.005, 0.3, N_SKILLS)
+    skills = (rng.random((n, N_SKILLS)) < popularity).astype(np.uint8)
+    salary = np.round(rng.lognormal(11.4, 0.4, n) + skills[:, :5].sum(axis=1) * 5000, -2)
+    salary[rng.random(n) < 0.4] = np.nan
+    salary[rng.random(n) < 0.02] = 0  # Gaji 0 dianggap tidak ada
+    df = pd.DataFrame(skills, columns=[f"{SKILL_PREFIX}s{j}" for j in range(N_SKILLS)])
+    df['salary_yearly'] = salary
+    df['schedule_type'] = rng.choice(['Full-time', 'Contractor', 'Part-time'], n)
+    df['via'] = rng.choice(['via LinkedIn', 'via Indeed', 'via BeBee'], n)
+    df['work_from_home'] = rng.random(n) < 0.3
+    df['title'] = 'Data Analyst'
+    df.index = rng.permutation(n) * 7  # Index bukan posisi
+    return df
+
+
+def _cases():
+    yield ["Full-time", "Contractor", "Part-time"], [], None
+    yield ["Full-time"], [], None
+    yield ["Full-time", "Contractor"], ["via LinkedIn"], True
+    yield ["Part-time"], ["via Indeed", "via BeBee"], False
+
+
+@pytest.mark.parametrize('case', list(_cases()))
+def test_insights_match_brute_force(jobs, case):
+    cols = [c for c in jobs.columns if c.startswith(SKILL_PREFIX)]
+    insights = SkillInsights(jobs, cols)
+    rows_df, positions = FilterPipeline(jobs).select_rows("", *case)
+
+    # Co-occurrence = X^T X dense untuk top-15 skill
+    x = rows_df[cols].to_numpy(dtype=np.int64)
+    full = x.T @ x
+    cooc = insights.cooccurrence(positions, top_n=15)
+    top = np.argsort(-np.diag(full), kind='stable')[:15]
+    assert cooc.index.tolist() == [c[len(SKILL_PREFIX):] for c in np.array(cols)[top]]
+    np.testing.assert_array_equal(cooc.to_numpy(), full[np.ix_(top, top)])
+
+    # Premium: median/mean dengan & tanpa skill, dihitung pandas per skill
+    premium = insights.premium(positions, min_postings=1).set_index('skill')
+    paid = rows_df[rows_df['salary_yearly'] > 0]
+    checked = 0
+    for col in cols:
+        with_skill = paid.loc[paid[col] == 1, 'salary_yearly']
+        without = paid.loc[paid[col] == 0, 'salary_yearly']
+        name = col[len(SKILL_PREFIX):]
+        if len(with_skill) == 0 or len(without) == 0:
+            assert name not in premium.index
+            continue
+        row = premium.loc[name]
+        assert row['postings'] == len(with_skill)
+        assert row['median'] == with_skill.median()
+        assert row['mean'] == pytest.approx(with_skill.mean(), rel=1e-12)
+        assert row['median_without'] == without.median()
+        assert row['premium'] == pytest.approx(with_skill.median() / without.median() - 1, rel=1e-12)
+        checked += 1
+    assert checked > 40
@@ -0,0 +1,75 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from skill_matcher import SkillMatcher
+from skill_taxonomy import MatchCache
+
+KEYWORDS = ['python', 'r', 'java', 'javascript', 'c++', 'sql', 'sql server', 'power bi', 'bi', 'excel']
+
+
+def _reference(text, keywords):
+    # Loop regex lama: satu regex per skill, batas kata lewat lookaround
+    text = text.lower()
+    return [k for k in keywords if re.search(r'(?<!\w)' + re.escape(k) + r'(?!\w)', text)]
+
+
+def test_cpp_followed_by_punctuation_or_space():
+    matcher = SkillMatcher(KEYWORDS)
+    assert matcher.find("Experience with C++, Python") == ['python', 'c++']
+    assert matcher.find("C++ and SQL") == ['c++', 'sql']
+    assert matcher.find("knows c++") == ['c++']
+
+
+def test_word_boundaries():
+    matcher = SkillMatcher(KEYWORDS)
+    assert matcher.find("your javascript code") == ['javascript']
+    assert matcher.find("R, Java") == ['r', 'java']
+    assert matcher.find("sql2019 or mysql") == []
+
+
+def test_overlapping_and_prefix_skills():
+    matcher = SkillMatcher(KEYWORDS)
+    assert matcher.find("Power BI dashboards on SQL Server") == ['sql', 'sql server', 'power bi', 'bi']
+    assert matcher.find_joined("Excel / power bi") == "power bi, bi, excel"
+
+
+def test_matches_per_skill_regex_on_random_texts():
+    rng = np.random.default_rng(7)
+    vocab = KEYWORDS + ['c', 'c+', '++', 'your', 'javas', 'server', ',', '.', '(', ')', '/', 'and', 'powerbi']
+    matcher = SkillMatcher(KEYWORDS)
+    for _ in range(2000):
+        words = rng.choice(vocab, size=int(rng.integers(1, 12)))
+        seps = rng.choice([' ', '', ', ', '\n', '-'], size=len(words))
+        text = ''.join(w + s for w, s in zip(words, seps)).upper()
+        assert matcher.find(text) == _reference(text, KEYWORDS), text
+
+
+def test_non_string_input():
+    matcher = SkillMatcher(KEYWORDS)
+    assert matcher.find(None) == []
+    assert matcher.find(float('nan')) == []
+
+
+def test_match_cache_from_old_rules_is_discarded(tmp_path):
+    path = str(tmp_path / 'cache.parquet')
+    patterns = ['python', 'c++', 'sql']
+    cache = MatchCache(path)
+    assert set(cache.match(["C++, SQL"], patterns)[0]) == {'c++', 'sql'}
+    cache.save()
+
+    # Simulasikan cache lama (tanpa versi aturan match): c++ dianggap sudah dicek & tidak ketemu
+    table = pq.read_table(path)
+    meta = dict(table.schema.metadata)
+    meta[b'loker_skill_cache'] = meta[b'loker_skill_cache'].replace(b'"match_rules": 2, ', b'')
+    stale = pa.Table.from_pandas(pd.DataFrame({'desc_hash': table['desc_hash'].to_pandas(),
+                                               'pattern_set': table['pattern_set'].to_pandas(),
+                                               'matches': ['sql']}), preserve_index=False)
+    pq.write_table(stale.replace_schema_metadata(meta), path)
+
+    reloaded = MatchCache(path)
+    assert len(reloaded) == 0
+    assert 'c++' in reloaded.match(["C++, SQL"], patterns)[0]
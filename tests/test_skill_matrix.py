@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+
+from bikin_data_lite import SKILL_KEYWORDS, detect_skills
+from skill_matcher import SKILL_PREFIX, skill_columns, skill_matrix
+
+
+def test_skill_matrix_from_strings():
+    matrix = skill_matrix(pd.Series(["python, c++", "", None, "sql, unknown"]), ['python', 'c++', 'sql'])
+    assert matrix.to_numpy().tolist() == [[1, 1, 0], [0, 0, 0], [0, 0, 0], [0, 0, 1]]
+    assert matrix.dtypes.eq(np.uint8).all()
+    assert skill_columns(matrix) == ['skill_python', 'skill_c++', 'skill_sql']
+
+
+def test_etl_matrix_and_vocab_match_detected_skills(etl_dir, synthetic_jobs):
+    lite = pd.read_parquet(etl_dir / 'gsearch_jobs_lite.parquet')
+    vocab = pd.read_parquet(etl_dir / 'gsearch_jobs_skill_vocab.parquet')
+    assert vocab['skill'].tolist() == SKILL_KEYWORDS
+    assert vocab['column'].tolist() == [SKILL_PREFIX + s for s in SKILL_KEYWORDS]
+    assert 'required_skills' not in lite.columns
+
+    expected = skill_matrix(synthetic_jobs['description'].map(detect_skills), SKILL_KEYWORDS)
+    np.testing.assert_array_equal(lite[vocab['column']].to_numpy(), expected.to_numpy())
+    np.testing.assert_array_equal(vocab['total'].to_numpy(), expected.sum().to_numpy())
+    assert vocab.set_index('skill').loc['c++', 'total'] > 0
@@ -0,0 +1,105 @@
+import copy
+import json
+
+import pytest
+
+import skill_taxonomy
+from skill_matcher import SkillMatcher
+from skill_taxonomy import TAXONOMY_FILE, MatchCache, SkillTaxonomy, load_taxonomy
+
+
+@pytest.fixture(scope='module')
+def categories():
+    with open(TAXONOMY_FILE, encoding='utf-8') as f:
+        return json.load(f)['categories']
+
+
+SYNONYMS = {
+    'programming': {'python': []},
+    'database': {'postgresql': ['postgres']},
+    'cloud_bigdata': {'google cloud': ['GCP']},
+    'ai_ml': {'scikit-learn': ['sklearn', 'scikit  learn']},
+}
+
+
+def test_synonyms_map_to_canonical_skill():
+    taxonomy = SkillTaxonomy(SYNONYMS)
+    assert taxonomy.to_skills(['gcp', 'python', 'google cloud']) == ['python', 'google cloud']
+    assert taxonomy.joined(['sklearn', 'postgres', 'scikit learn']) == 'postgresql, scikit-learn'
+    assert taxonomy.category_of['google cloud'] == 'cloud_bigdata'
+    assert taxonomy.patterns == ['python', 'postgresql', 'postgres', 'google cloud', 'gcp',
+                                 'scikit-learn', 'sklearn', 'scikit learn']
+
+
+def test_taxonomy_file(categories):
+    taxonomy = SkillTaxonomy(categories)
+    assert taxonomy.category_of['power bi'] == 'bi_viz'
+    assert set(taxonomy.skills) <= set(taxonomy.patterns)
+    assert load_taxonomy().version == taxonomy.version
+
+
+def test_version_tracks_content_and_order(categories):
+    base = SkillTaxonomy(categories).version
+    edited = copy.deepcopy(categories)
+    edited['cloud_bigdata']['google cloud'].append('google cloud platform')
+    assert SkillTaxonomy(edited).version != base
+    reordered = dict(reversed(list(categories.items())))
+    assert SkillTaxonomy(reordered).version != base  # Urutan = urutan kolom matriks skill
+
+
+@pytest.mark.parametrize('categories, message', [
+    ({'a': {'sql': []}, 'b': {'SQL': []}}, 'dua kali'),
+    ({'a': {'aws': ['amazon'], 'amazon': []}}, 'dipakai oleh'),
+    ({'a': {'c|d': []}}, 'tidak boleh'),
+])
+def test_invalid_taxonomy_is_rejected(categories, message):
+    with pytest.raises(ValueError, match=message):
+        SkillTaxonomy(categories)
+
+
+def _exact(texts, patterns):
+    matcher = SkillMatcher(patterns)
+    return [sorted(matcher.find(t)) if isinstance(t, str) else [] for t in texts]
+
+
+def test_partial_rescan_matches_full_scan(synthetic_jobs, tmp_path, monkeypatch, categories):
+    texts = synthetic_jobs['description'].astype(object).tolist()[:1500]
+    texts += texts[:300]  # Repost: deskripsi identik di-scan sekali
+    texts[7] = None
+    full = SkillTaxonomy(categories).patterns
+    old = [p for p in full if p not in ('google cloud', 'tableau', 'scala')]
+    path = str(tmp_path / 'cache.parquet')
+
+    cache = MatchCache(path)
+    got = cache.match(texts, old)
+    assert [sorted(m) for m in got] == _exact(texts, old)
+    assert cache.stats['new'] == len(set(texts) - {None})
+    assert cache.save()
+
+    # Taxonomy bertambah: hanya pola baru yang di-scan, hasilnya sama dengan scan penuh
+    scanned = []
+    real_match = skill_taxonomy.match_texts
+    monkeypatch.setattr(skill_taxonomy, 'match_texts',
+                        lambda t, p, *a: scanned.append(set(p)) or real_match(t, p, *a))
+    cache = MatchCache(path)
+    got = cache.match(texts, full, workers=2, chunk_size=400)
+    assert [sorted(m) for m in got] == _exact(texts, full)
+    assert scanned == [{'google cloud', 'tableau', 'scala'}]
+    assert cache.stats['partial'] == len(set(texts) - {None})
+
+    # Pola dihapus: cukup difilter dari cache, tanpa scan
+    scanned.clear()
+    fewer = [p for p in full if p != 'python']
+    assert [sorted(m) for m in cache.match(texts, fewer)] == _exact(texts, fewer)
+    assert scanned == []
+    assert cache.save() and not MatchCache(path).dirty
+
+
+def test_cache_from_old_match_rules_is_discarded(tmp_path, monkeypatch):
+    path = str(tmp_path / 'cache.parquet')
+    cache = MatchCache(path)
+    cache.match(['Python and SQL'], ['python', 'sql'])
+    cache.save()
+    monkeypatch.setattr(skill_taxonomy, 'MATCH_RULES_VERSION', -1)
+    stale = MatchCache(path)
+    assert len(stale) == 0 and stale.dirty
@@ -0,0 +1,43 @@
+import filecmp
+
+import numpy as np
+
+from benchmark_loker import find_regressions
+from bikin_data_sintetis import SKILL_FREQ, generate, parse_rows
+
+
+def test_parse_rows():
+    assert parse_rows('10k') == 10_000
+    assert parse_rows('1.5M') == 1_500_000
+    assert parse_rows('250_000') == 250_000
+
+
+def test_generator_is_deterministic(tmp_path):
+    a = generate(str(tmp_path / 'a.csv'), 1200, seed=3, chunk_rows=500)
+    b = generate(str(tmp_path / 'b.csv'), 1200, seed=3, chunk_rows=500)
+    c = generate(str(tmp_path / 'c.csv'), 1200, seed=4, chunk_rows=500)
+    assert filecmp.cmp(a, b, shallow=False)
+    assert not filecmp.cmp(a, c, shallow=False)
+
+
+def test_generator_distributions(synthetic_jobs):
+    df = synthetic_jobs
+    assert len(df) == 3000 and df['index'].tolist() == list(range(3000))
+    # Gaji terisi ~17% (binomial, batas ~5 sigma)
+    assert abs(df['salary_yearly'].notna().mean() - 0.17) < 5 * np.sqrt(0.17 * 0.83 / 3000)
+    # Repost (~8%) = deskripsi identik lewat platform lain
+    assert 0.04 < df.duplicated(['title', 'company_name', 'description']).mean() < 0.12
+    sql = df['description'].str.contains(r'(?<!\w)SQL(?!\w)').mean()
+    assert abs(sql - SKILL_FREQ['sql']) < 0.05
+
+
+def test_find_regressions():
+    run = {'rows': 10, 'seed': 1, 'results': {'a': {'seconds': 1.0}, 'b': {'seconds': 0.5}, 'c': {'seconds': 0.001}}}
+    history = [
+        {'rows': 10, 'seed': 2, 'results': {'a': {'seconds': 0.1}}},  # Seed lain: diabaikan
+        {'rows': 10, 'seed': 1, 'results': {'a': {'seconds': 0.5}, 'b': {'seconds': 0.5}, 'c': {'seconds': 0.0001}}},
+    ]
+    slow = find_regressions(run, history)
+    assert [r['name'] for r in slow] == ['a']  # 'c' melambat x10 tapi selisihnya < MIN_DELTA_S
+    assert slow[0]['ratio'] == 2.0
+    assert find_regressions(run, []) == []
@@ -0,0 +1,43 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from title_index import TitleIndex
+
+
+def _expected(titles, query):
+    titles = titles.astype(object)  # Semantik regex Python (bukan RE2 milik string Arrow)
+    try:
+        return titles.str.contains(query, case=False, na=False).to_numpy(dtype=bool)
+    except re.error:
+        return titles.str.lower().str.contains(query.lower(), regex=False, na=False).to_numpy(dtype=bool)
+
+
+@pytest.mark.filterwarnings('ignore:This pattern is interpreted as a regular expression')
+def test_search_matches_str_contains(synthetic_jobs):
+    titles = synthetic_jobs['title'].copy()
+    titles.iloc[::50] = np.nan
+    titles.iloc[1] = "Senior C++ Engineer (Data)"
+    index = TitleIndex(titles)
+    rng = np.random.default_rng(11)
+    unique = titles.dropna().unique()
+
+    queries = ["data", "DATA ANALYST", "an", "a", "sql", "zzz", "c++", "(data)", "analyst|scientist",
+               "^senior", "engineer$", "ana.yst", "ta a"]
+    # Potongan acak judul asli (juga lintas kata & huruf besar/kecil acak)
+    for _ in range(200):
+        title = unique[int(rng.integers(len(unique)))]
+        start = int(rng.integers(len(title)))
+        piece = title[start:start + int(rng.integers(1, 12))]
+        queries.append(piece.upper() if rng.random() < 0.3 else piece)
+
+    for query in queries:
+        np.testing.assert_array_equal(index.search(query), _expected(titles, query), err_msg=query)
+
+
+def test_nan_titles_never_match():
+    index = TitleIndex(pd.Series(["Data Analyst", None, np.nan, "Analyst"]))
+    assert index.search("analyst").tolist() == [True, False, False, True]
+    assert index.search("").tolist() == [True, False, False, True]
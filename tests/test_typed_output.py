@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from bikin_data_lite import CATEGORY_COLS, to_typed
+from data_lite import read_lite_data
+
+
+def test_to_typed_columns():
+    raw = pd.DataFrame({
+        'date_time': ['2023-01-02 10:00:00', 'bukan tanggal'],
+        'work_from_home': [True, None],
+        'salary_yearly': ['95000', None],
+        'required_skills': ['python, sql', None],
+        'via': ['via LinkedIn', 'via Indeed'],
+    })
+    typed = to_typed(raw)
+    assert typed['date_time'].dtype.kind == 'M' and typed['date_time'].isna().tolist() == [False, True]
+    assert typed['work_from_home'].tolist() == [True, False]
+    assert typed['salary_yearly'].dtype == 'float64' and typed['salary_yearly'].iloc[0] == 95000.0
+    assert typed['required_skills'].tolist() == ['python, sql', '']
+    assert isinstance(typed['via'].dtype, pd.CategoricalDtype)
+
+
+def test_parquet_roundtrip_matches_csv(etl_dir, synthetic_jobs):
+    lite = read_lite_data(str(etl_dir / 'gsearch_jobs_lite.parquet'), str(etl_dir / 'missing.csv'))
+    # CSV sintetis < SAMPLE_SIZE -> semua baris ikut, urutan sama
+    assert len(lite) == len(synthetic_jobs)
+    for col in CATEGORY_COLS:
+        assert isinstance(lite[col].dtype, pd.CategoricalDtype), col
+        assert lite[col].astype(str).tolist() == synthetic_jobs[col].astype(str).tolist()
+    assert lite['date_time'].dtype.kind == 'M'
+    assert (lite['date_time'] == pd.to_datetime(synthetic_jobs['date_time'])).all()
+    np.testing.assert_array_equal(lite['salary_yearly'].to_numpy(), synthetic_jobs['salary_yearly'].to_numpy())
+    assert lite['work_from_home'].dtype == bool
+    assert lite['work_from_home'].sum() == synthetic_jobs['work_from_home'].fillna(False).astype(bool).sum()
@@ -0,0 +1,79 @@
+import re
+import numpy as np
+import pandas as pd
+
+# Index trigram untuk pencarian "Cari Posisi".
+# Dulu tiap rerun menjalankan str.contains(case=False) ke SEMUA judul.
+# Di sini judul unik di-index sekali (trigram -> id judul), lalu pencarian
+# cukup mengiris postings list + verifikasi str.contains di kandidat saja.
+
+# Karakter spesial regex: kalau ada di query, trigram tidak bisa dipakai
+# (str.contains default-nya regex), jadi pakai scan judul unik biasa.
+REGEX_META = set('.^$*+?{}[]\\|()')
+
+
+class TitleIndex:
+    """Inverted index trigram atas judul unik, hasil identik dengan str.contains."""
+
+    def __init__(self, titles):
+        codes, uniques = pd.factorize(pd.Series(titles), use_na_sentinel=True)
+        self.n_rows = len(codes)
+        self.titles = pd.Series(uniques.astype(str), dtype=object)
+        # Versi lowercase untuk verifikasi literal (pakai string Arrow kalau ada -> jauh lebih cepat)
+        self._lower = self.titles.str.lower()
+        try:
+            self._lower = self._lower.astype('string[pyarrow]')
+        except (ImportError, TypeError):
+            pass
+        # Judul NaN (kode -1) diarahkan ke slot ekstra yang selalu False
+        self._codes = np.where(codes < 0, len(uniques), codes).astype(np.int32)
+
+        postings = {}
+        for title_id, title in enumerate(self.titles):
+            for gram in _trigrams(title.lower()):
+                postings.setdefault(gram, []).append(title_id)
+        self._postings = {g: np.asarray(ids, dtype=np.int32) for g, ids in postings.items()}
+
+    def _candidates(self, query):
+        # Irisan postings list semua trigram query (dari yang paling pendek)
+        grams = _trigrams(query.lower())
+        lists = []
+        for gram in grams:
+            ids = self._postings.get(gram)
+            if ids is None:
+                return np.empty(0, dtype=np.int32)
+            lists.append(ids)
+        lists.sort(key=len)
+        result = lists[0]
+        for ids in lists[1:]:
+            result = np.intersect1d(result, ids, assume_unique=True)
+            if len(result) == 0:
+                break
+        return result
+
+    def search(self, query):
+        """Boolean mask per baris: judul cocok dengan `query` (case-insensitive)."""
+        literal = not (set(query) & REGEX_META)
+
+        if literal:
+            cand = self._candidates(query) if len(query) >= 3 else np.arange(len(self.titles), dtype=np.int32)
+            # Verifikasi substring di kandidat saja (trigram bisa false positive)
+            if len(cand) and len(query) != 3:
+                ok = self._lower.iloc[cand].str.contains(query.lower(), regex=False).to_numpy(dtype=bool)
+                cand = cand[ok]
+        else:
+            # Query berisi karakter regex -> semantik lama (regex, case=False) di judul unik.
+            # Regex tidak valid (misal "c++") dulu bikin dashboard error; sekarang dianggap literal.
+            try:
+                ok = self.titles.str.contains(query, case=False, na=False)
+            except re.error:
+                ok = self._lower.str.contains(query.lower(), regex=False)
+            cand = np.flatnonzero(ok.to_numpy(dtype=bool))
+
+        hit = np.zeros(len(self.titles) + 1, dtype=bool)
+        hit[cand] = True
+        return hit[self._codes]
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}